@@ -0,0 +1,83 @@
+import sys
+import time
+import tracemalloc
+import argparse
+from pathlib import Path
+from statistics import mean
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+project_root = str(Path(__file__).parent.parent)
+sys.path.insert(0, project_root)
+
+from bs4 import BeautifulSoup
+from fetcher.extractor import HTMLExtractor, HAS_LXML
+
+FIXTURE_DIR = Path(__file__).parent / 'fixtures' / 'html'
+
+def legacy_extract(html: str) -> str:
+    """기존 WebContent 경로: 전체 파싱 후 get_text() 결과를 다시 파싱"""
+    soup = BeautifulSoup(html, 'html.parser')
+    text = soup.get_text()
+    cleaned = BeautifulSoup(text, 'html.parser')
+    return ' '.join(cleaned.stripped_strings)
+
+def load_fixtures(fixture_dir: Path):
+    """저장된 HTML 픽스처 로드"""
+    pages = {}
+    for path in sorted(fixture_dir.glob('*.html')):
+        pages[path.name] = path.read_text(encoding='utf-8')
+    return pages
+
+def measure(extract_fn, pages, rounds: int):
+    """pages/sec 및 페이지당 메모리 측정"""
+    # 처리 속도
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for html in pages.values():
+            extract_fn(html)
+    elapsed = time.perf_counter() - start
+    pages_per_sec = rounds * len(pages) / elapsed
+
+    # 페이지당 최대 메모리 (tracemalloc 오버헤드를 피하기 위해 별도 측정)
+    # tracemalloc은 Python 힙만 추적하므로 libxml2 내부 할당은 포함되지 않음
+    peaks = []
+    for html in pages.values():
+        tracemalloc.start()
+        extract_fn(html)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        peaks.append(peak)
+
+    return pages_per_sec, mean(peaks)
+
+def main():
+    parser = argparse.ArgumentParser(description='HTML 추출 벤치마크')
+    parser.add_argument('--fixtures', type=str, default=str(FIXTURE_DIR),
+                        help='HTML 픽스처 디렉토리')
+    parser.add_argument('--rounds', type=int, default=20,
+                        help='반복 횟수 (기본값: 20)')
+    args = parser.parse_args()
+
+    pages = load_fixtures(Path(args.fixtures))
+    if not pages:
+        print(f"픽스처 없음: {args.fixtures}")
+        return
+
+    candidates = {
+        'legacy (double parse)': legacy_extract,
+        'extractor (html.parser)': HTMLExtractor('html.parser').extract_text,
+    }
+    if HAS_LXML:
+        candidates['extractor (lxml)'] = HTMLExtractor('lxml').extract_text
+    else:
+        print("lxml 미설치: html.parser 경로만 측정합니다.")
+
+    print(f"\n=== HTML 추출 벤치마크 ({len(pages)}개 페이지 x {args.rounds}회) ===")
+    print(f"{'방식':<26}{'pages/sec':>12}{'KiB/page':>12}{'chars/page':>12}")
+    for name, fn in candidates.items():
+        pages_per_sec, peak = measure(fn, pages, args.rounds)
+        chars = mean(len(fn(html)) for html in pages.values())
+        print(f"{name:<26}{pages_per_sec:>12.1f}{peak / 1024:>12.1f}{chars:>12.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+import sys
+import time
+import random
+import argparse
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+project_root = str(Path(__file__).parent.parent)
+sys.path.insert(0, project_root)
+
+from common.highlight import KeywordHighlighter
+
+WORDS = ("model data training inference latency token cache batch vector index query memory "
+         "pipeline summary chapter section network request response notion youtube pocket").split()
+
+def legacy_highlight(text, keywords, fix_fallback: bool = False):
+    """기존 NotionBase.highlight_keywords (위치마다 모든 키워드를 find)
+
+    기존 코드는 다음 키워드 위치를 찾는 루프에서 직전 루프의 keyword_lower(마지막 키워드)만
+    검색하여 대부분의 키워드를 건너뛴다. fix_fallback=True면 이 버그를 고친 버전으로 비교한다.
+    """
+    if not text or not keywords:
+        return [{"type": "text", "text": {"content": text or ""}}]
+    result = []
+    current_pos = 0
+    text_lower = text.lower()
+    sorted_keywords = sorted(keywords, key=len, reverse=True)
+    while current_pos < len(text):
+        found_keyword = False
+        for keyword in sorted_keywords:
+            keyword_lower = keyword.lower()
+            pos = text_lower.find(keyword_lower, current_pos)
+            if pos == current_pos:
+                if pos > 0:
+                    result.append({"type": "text", "text": {"content": text[current_pos:pos]}})
+                result.append({"type": "text", "text": {"content": text[pos:pos + len(keyword)]},
+                               "annotations": {"bold": True, "color": "yellow_background"}})
+                current_pos = pos + len(keyword)
+                found_keyword = True
+                break
+        if not found_keyword:
+            next_pos = len(text)
+            for keyword in sorted_keywords:
+                if fix_fallback:
+                    keyword_lower = keyword.lower()
+                keyword_pos = text_lower.find(keyword_lower, current_pos + 1)
+                if keyword_pos != -1 and keyword_pos < next_pos:
+                    next_pos = keyword_pos
+            result.append({"type": "text", "text": {"content": text[current_pos:next_pos]}})
+            current_pos = next_pos
+    return result
+
+def make_summary(n_keywords: int, n_bullets: int, seed: int = 0):
+    """키워드 n_keywords개와 키워드가 섞인 글머리 n_bullets개 생성"""
+    rng = random.Random(seed)
+    keywords = []
+    while len(keywords) < n_keywords:
+        keyword = ' '.join(rng.sample(WORDS, rng.randint(1, 2))).title()
+        if keyword not in keywords:
+            keywords.append(keyword)
+    bullets = []
+    for _ in range(n_bullets):
+        parts = [rng.choice(keywords) if rng.random() < 0.15 else rng.choice(WORDS) for _ in range(25)]
+        bullets.append(' '.join(parts) + '.')
+    return keywords, bullets
+
+def measure(render, keywords, bullets, rounds: int) -> float:
+    """요약 하나(글머리 전체)를 rounds번 렌더링하는 평균 시간(ms)"""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        render(keywords, bullets)
+    return (time.perf_counter() - start) / rounds * 1000
+
+def render_legacy(keywords, bullets):
+    return [legacy_highlight(bullet, keywords) for bullet in bullets]
+
+def render_legacy_fixed(keywords, bullets):
+    return [legacy_highlight(bullet, keywords, fix_fallback=True) for bullet in bullets]
+
+def render_compiled(keywords, bullets):
+    highlighter = KeywordHighlighter(keywords)  # 요약당 한 번 컴파일
+    return [highlighter.highlight(bullet) for bullet in bullets]
+
+def highlighted(blocks):
+    return sum(1 for block in blocks for part in block if 'annotations' in part)
+
+def main():
+    parser = argparse.ArgumentParser(description='키워드 강조 마이크로 벤치마크')
+    parser.add_argument('--keywords', type=int, default=50, help='키워드 수 (기본값: 50)')
+    parser.add_argument('--bullets', type=int, default=200, help='글머리 항목 수 (기본값: 200)')
+    parser.add_argument('--rounds', type=int, default=5, help='반복 횟수 (기본값: 5)')
+    args = parser.parse_args()
+
+    keywords, bullets = make_summary(args.keywords, args.bullets)
+    chars = sum(len(bullet) for bullet in bullets)
+    print(f"=== 키워드 강조 벤치마크 (키워드 {len(keywords)}개, 글머리 {len(bullets)}개, {chars} 글자) ===")
+
+    print(f"{'구현':<16}{'요약당(ms)':>12}{'강조 구간':>10}")
+    timings = {}
+    for name, render in (('legacy', render_legacy), ('legacy (수정)', render_legacy_fixed),
+                         ('compiled', render_compiled)):
+        timings[name] = measure(render, keywords, bullets, args.rounds)
+        print(f"{name:<16}{timings[name]:>12.2f}{highlighted(render(keywords, bullets)):>10}")
+    print(f"속도 향상 (수정된 legacy 대비): {timings['legacy (수정)'] / timings['compiled']:.1f}x")
+
+if __name__ == '__main__':
+    main()
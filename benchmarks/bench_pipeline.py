@@ -0,0 +1,237 @@
+import io
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import importlib
+import importlib.util
+from contextlib import redirect_stdout
+from pathlib import Path
+from typing import Dict, List
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+project_root = str(Path(__file__).parent.parent)
+sys.path.insert(0, project_root)
+
+from benchmarks.fake_services import FakeServices, FakeTranscriptApi, percentile
+from common.metrics import metrics
+from common.log import configure_logging
+from common.usage import ledger
+from common.batch import BatchRunner
+
+SCENARIOS = ['youtube', 'pocket', 'fetch_save']
+BATCH_SCENARIOS = ['pocket_batch', 'fetch_save_batch']
+
+def load_fetch_save_module(name: str):
+    """fetch_save 스크립트 모듈 로드 (fetch_save의 `utils`는 fetcher/test_utils.py를 사용)"""
+    sys.modules.setdefault('utils', importlib.import_module('fetcher.test_utils'))
+    path = Path(project_root) / 'fetch_save' / f"{name}.py"
+    spec = importlib.util.spec_from_file_location(f"fetch_save_{name}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def run_youtube(services: FakeServices, n_items: int) -> List[float]:
+    """main.process_youtube로 재생목록 전체 처리"""
+    import main
+    from config.config import Config
+    import fetcher.fetch
+
+    fetcher.fetch.YouTubeTranscriptApi = FakeTranscriptApi(services.base_url)
+    config = Config()
+    config.ENABLE_DEDUP = False
+    main.process_youtube(config, playlist_id=services.PLAYLIST_ID)
+    return []
+
+def run_pocket(services: FakeServices, n_items: int, batch: bool = False) -> List[float]:
+    """main.process_pocket으로 Pocket 항목 처리"""
+    import main
+    from config.config import Config
+
+    config = Config()
+    config.ENABLE_DEDUP = False
+    config.ENABLE_BATCH = batch
+    config.BATCH_DIR = Path(tempfile.mkdtemp(prefix='bench_batches_'))
+    config.BATCH_POLL_INTERVAL = 0.05
+    main.process_pocket(config, tags=None, limit=n_items)
+    return []
+
+def run_pocket_batch(services: FakeServices, n_items: int) -> List[float]:
+    """Batch API 모드로 Pocket 항목 처리"""
+    return run_pocket(services, n_items, batch=True)
+
+def run_fetch_save(services: FakeServices, n_items: int) -> List[float]:
+    """fetch_save BaseSummarizer로 자막 요약 (항목별 소요 시간 반환)"""
+    fetch_save_config = load_fetch_save_module('config')
+    fetch_save_summarizer = load_fetch_save_module('summarizer')
+    from fetcher.test_utils import Utils
+
+    summarizer = fetch_save_summarizer.BaseSummarizer(fetch_save_config.Config(), verbose=False)
+    latencies = []
+    for i, video_id in enumerate(services.videos[:n_items]):
+        started = time.perf_counter()
+        text = Utils.preprocess_text(services.transcripts[video_id])
+        summary = summarizer.summarize(text, f"벤치마크 영상 {i}")
+        if summary is None:
+            raise RuntimeError(f"요약 실패: {video_id}")
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+def run_fetch_save_batch(services: FakeServices, n_items: int) -> List[float]:
+    """fetch_save BaseSummarizer.summarize_batch로 자막 일괄 요약"""
+    from openai import OpenAI
+    fetch_save_config = load_fetch_save_module('config')
+    fetch_save_summarizer = load_fetch_save_module('summarizer')
+    from fetcher.test_utils import Utils
+
+    summarizer = fetch_save_summarizer.BaseSummarizer(fetch_save_config.Config(), verbose=False)
+    runner = BatchRunner(OpenAI(), batch_dir=tempfile.mkdtemp(prefix='bench_batches_'), poll_interval=0.05)
+    items = [(Utils.preprocess_text(services.transcripts[video_id]), f"벤치마크 영상 {i}")
+             for i, video_id in enumerate(services.videos[:n_items])]
+    started = time.perf_counter()
+    summaries = summarizer.summarize_batch(items, runner)
+    if any(summary is None for summary in summaries):
+        raise RuntimeError("요약 실패")
+    # 모든 항목이 배치 완료 시점에 함께 끝남
+    return [time.perf_counter() - started] * len(items)
+
+RUNNERS = {
+    'youtube': run_youtube,
+    'pocket': run_pocket,
+    'fetch_save': run_fetch_save,
+    'pocket_batch': run_pocket_batch,
+    'fetch_save_batch': run_fetch_save_batch,
+}
+
+def summarize_calls(calls: List[Dict]) -> Dict:
+    """서비스별 요청 수, 오류 수, 지연 시간 백분위수"""
+    services = {}
+    for call in calls:
+        stats = services.setdefault(call['service'], {'requests': 0, 'errors': 0, 'latencies': []})
+        stats['requests'] += 1
+        stats['errors'] += call['status'] >= 400
+        stats['latencies'].append(call['latency'])
+    return {
+        name: {
+            'requests': stats['requests'],
+            'errors': stats['errors'],
+            'p50': percentile(stats['latencies'], 50),
+            'p95': percentile(stats['latencies'], 95),
+        }
+        for name, stats in services.items()
+    }
+
+def run_scenario(name: str, services: FakeServices, n_items: int, verbose: bool) -> Dict:
+    """시나리오 실행 후 처리량, 항목별 지연 시간, 토큰 수 집계"""
+    first_call = len(services.calls)
+    metrics.reset()
+    ledger.reset()
+    started = time.perf_counter()
+    error = None
+    output = io.StringIO()
+    try:
+        if verbose:
+            latencies = RUNNERS[name](services, n_items)
+        else:
+            with redirect_stdout(output):
+                latencies = RUNNERS[name](services, n_items)
+    except Exception as e:
+        latencies, error = [], f"{type(e).__name__}: {e}"
+    elapsed = time.perf_counter() - started
+    calls = services.calls[first_call:]
+
+    # 파이프라인이 항목별로 순차 처리하므로 Notion 저장 완료 간격을 항목별 소요 시간으로 사용
+    if not latencies:
+        previous = started
+        for call in calls:
+            if call.get('page_created') and call['status'] < 400:
+                latencies.append(call['end'] - previous)
+                previous = call['end']
+
+    openai_calls = [call for call in calls
+                    if call['service'] in ('openai', 'openai_batch') and call['status'] < 400 and 'prompt_tokens' in call]
+    return {
+        'scenario': name,
+        'items': len(latencies),
+        'elapsed': elapsed,
+        'items_per_min': len(latencies) / elapsed * 60 if elapsed else 0.0,
+        'p50': percentile(latencies, 50),
+        'p95': percentile(latencies, 95),
+        'llm_calls': len(openai_calls),
+        'prompt_tokens': sum(call.get('prompt_tokens', 0) for call in openai_calls),
+        'cached_tokens': sum(call.get('cached_tokens', 0) for call in openai_calls),
+        'completion_tokens': sum(call.get('completion_tokens', 0) for call in openai_calls),
+        'services': summarize_calls(calls),
+        'cost': ledger.total['cost'],
+        'stages': dict(metrics.stage_seconds),
+        'error': error,
+    }
+
+def format_seconds(value) -> str:
+    return f"{value:.2f}" if value is not None else '-'
+
+def print_report(results: List[Dict], args) -> None:
+    print(f"\n=== 파이프라인 벤치마크 (항목 {args.items}개, 지연 {args.latency * 1000:.0f}ms, "
+          f"오류율 {args.error_rate:.0%}) ===")
+    print(f"{'시나리오':<18}{'항목':>6}{'경과(s)':>10}{'items/min':>11}{'p50(s)':>9}{'p95(s)':>9}"
+          f"{'LLM호출':>9}{'입력토큰':>10}{'캐시토큰':>10}{'출력토큰':>10}{'비용($)':>10}")
+    for r in results:
+        print(f"{r['scenario']:<18}{r['items']:>6}{r['elapsed']:>10.2f}{r['items_per_min']:>11.1f}"
+              f"{format_seconds(r['p50']):>9}{format_seconds(r['p95']):>9}"
+              f"{r['llm_calls']:>9}{r['prompt_tokens']:>10}{r['cached_tokens']:>10}{r['completion_tokens']:>10}"
+              f"{r['cost']:>10.4f}")
+
+    print(f"\n{'시나리오':<18}{'서비스':<10}{'요청':>6}{'오류':>6}{'p50(ms)':>10}{'p95(ms)':>10}")
+    for r in results:
+        for service, stats in sorted(r['services'].items()):
+            print(f"{r['scenario']:<18}{service:<10}{stats['requests']:>6}{stats['errors']:>6}"
+                  f"{stats['p50'] * 1000:>10.1f}{stats['p95'] * 1000:>10.1f}")
+
+    print(f"\n{'시나리오':<18}{'단계':<16}{'누적(s)':>10}")
+    for r in results:
+        for stage, seconds in sorted(r['stages'].items(), key=lambda kv: -kv[1]):
+            print(f"{r['scenario']:<18}{stage:<16}{seconds:>10.2f}")
+
+    for r in results:
+        if r['error']:
+            print(f"\n[{r['scenario']}] 실행 실패: {r['error']}")
+
+def main():
+    parser = argparse.ArgumentParser(description='로컬 가짜 API 서버 기반 파이프라인 벤치마크')
+    parser.add_argument('--scenario', nargs='+', default=SCENARIOS, choices=SCENARIOS + BATCH_SCENARIOS,
+                        help=f'실행할 시나리오 (기본값: {SCENARIOS}, 배치 모드: {BATCH_SCENARIOS})')
+    parser.add_argument('--items', type=int, default=10,
+                        help='항목 수 (기본값: 10)')
+    parser.add_argument('--sentences', type=int, default=120,
+                        help='항목당 자막/본문 문장 수 (기본값: 120)')
+    parser.add_argument('--latency', type=float, default=0.05,
+                        help='API 요청당 지연 시간(초) (기본값: 0.05)')
+    parser.add_argument('--token_latency', type=float, default=0.0,
+                        help='OpenAI 출력 토큰당 추가 지연 시간(초) (기본값: 0)')
+    parser.add_argument('--error_rate', type=float, default=0.0,
+                        help='429/500 오류 주입 확률 (기본값: 0)')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='난수 시드 (기본값: 0)')
+    parser.add_argument('--output', type=str,
+                        help='결과 JSON 저장 경로 (옵션)')
+    parser.add_argument('--verbose', action='store_true',
+                        help='파이프라인 출력 표시')
+    args = parser.parse_args()
+    configure_logging(level='DEBUG' if args.verbose else 'WARNING')
+
+    services = FakeServices(n_items=args.items, latency=args.latency, token_latency=args.token_latency,
+                            error_rate=args.error_rate, sentences_per_item=args.sentences, seed=args.seed)
+    with services:
+        os.environ.update(services.env())
+        results = [run_scenario(name, services, args.items, args.verbose) for name in args.scenario]
+
+    print_report(results, args)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'args': vars(args), 'results': results}, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,686 @@
+import json
+import time
+import uuid
+import random
+import threading
+from email import message_from_bytes
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlparse, parse_qs
+
+import requests
+from youtube_transcript_api import NoTranscriptFound
+
+# 자막/본문 생성용 어휘 (문장 부호 없는 자동 생성 자막을 흉내 냄)
+SYLLABLES = list("가나다라마바사아자차카타파하거너더러머버서어저처커터퍼허고노도로모보소오조초코토포호구누두루무부수우주추쿠투푸후")
+PARTICLES = ['은', '는', '이', '가', '을', '를', '에서', '으로', '와', '의']
+ENDINGS = ['입니다', '있습니다', '했어요', '하죠', '됩니다', '같아요', '봅니다', '했다']
+
+def make_token_counter() -> Callable[[str], int]:
+    """tiktoken 인코딩을 불러올 수 없으면 UTF-8 바이트 기반 근사치 사용"""
+    try:
+        import tiktoken
+        encoding = tiktoken.get_encoding('cl100k_base')
+        return lambda text: len(encoding.encode(text, disallowed_special=()))
+    except Exception:
+        return lambda text: len(text.encode('utf-8')) // 4 + 1
+
+def make_tokenizer() -> Callable[[str], Sequence]:
+    """텍스트 -> 토큰 목록 (tiktoken을 쓸 수 없으면 UTF-8 4바이트 단위로 근사)"""
+    try:
+        import tiktoken
+        encoding = tiktoken.get_encoding('cl100k_base')
+        return lambda text: encoding.encode(text, disallowed_special=())
+    except Exception:
+        def encode(text: str) -> List[bytes]:
+            data = text.encode('utf-8')
+            return [data[i:i + 4] for i in range(0, len(data), 4)]
+        return encode
+
+def sample_from_schema(schema: Dict, key: str = '') -> object:
+    """JSON 스키마를 만족하는 예시 값 생성"""
+    schema_type = schema.get('type')
+    if schema_type == 'object':
+        return {name: sample_from_schema(prop, name) for name, prop in schema.get('properties', {}).items()}
+    if schema_type == 'array':
+        n_items = max(schema.get('minItems', 0), min(schema.get('maxItems', 3), 3))
+        return [sample_from_schema(schema.get('items', {'type': 'string'}), key) for _ in range(n_items)]
+    if schema_type in ('integer', 'number'):
+        return 1
+    if schema_type == 'boolean':
+        return True
+    text = f"{key or '요약'} 항목의 핵심 내용입니다"
+    return text[:schema['maxLength']] if 'maxLength' in schema else text
+
+DEFAULT_SUMMARY_SCHEMA = {
+    'type': 'object',
+    'properties': {
+        'sections': {
+            'type': 'array',
+            'minItems': 2,
+            'items': {
+                'type': 'object',
+                'properties': {
+                    'title': {'type': 'string'},
+                    'summary': {'type': 'array', 'items': {'type': 'string'}},
+                },
+            },
+        },
+        'full_summary': {'type': 'array', 'items': {'type': 'string'}},
+        'one_sentence_summary': {'type': 'string'},
+    },
+}
+
+class EventStream(list):
+    """SSE(text/event-stream)로 보낼 이벤트 목록"""
+
+class FakeServices:
+    """OpenAI / Notion / YouTube / Pocket / Raindrop API와 웹 페이지를 흉내 내는 로컬 HTTP 서버
+
+    모든 요청은 지정한 지연 시간(±20% 지터) 후 응답하며, error_rate 확률로
+    429(Retry-After 포함) 또는 500 오류를 반환한다. 요청별 서비스, 상태 코드,
+    처리 시간, 토큰 수는 calls에 기록된다. OpenAI Files/Batches 엔드포인트도 제공하며,
+    배치 작업은 batch_delay초 뒤 완료되고 개별 요청은 'openai_batch' 서비스로 기록된다.
+    """
+
+    PLAYLIST_ID = 'PLBENCH'
+    COLLECTION_ID = '1'
+
+    def __init__(self, n_items: int = 10, latency: float = 0.05, token_latency: float = 0.0,
+                 error_rate: float = 0.0, sentences_per_item: int = 120, seed: int = 0,
+                 batch_delay: float = 0.0, invalid_fields: Optional[Sequence[str]] = None):
+        """
+        Args:
+            n_items: 재생목록/Pocket/Raindrop 항목 수
+            latency: API 요청당 기본 지연 시간(초)
+            token_latency: OpenAI 출력 토큰당 추가 지연 시간(초)
+            error_rate: 429/500 오류 주입 확률 (0~1)
+            sentences_per_item: 항목당 자막/본문 문장 수
+            seed: 난수 시드
+            batch_delay: 배치 작업 완료까지 걸리는 시간(초)
+            invalid_fields: 스키마와 다른 타입의 값으로 응답할 필드 이름 (필드마다 처음 한 번만)
+        """
+        self.n_items = n_items
+        self.latency = latency
+        self.token_latency = token_latency
+        self.error_rate = error_rate
+        self.batch_delay = batch_delay
+        self.invalid_fields = set(invalid_fields or ())
+        self.files: Dict[str, Dict] = {}
+        self.batches: Dict[str, Dict] = {}
+        self.count_tokens = make_token_counter()
+        self.tokenize = make_tokenizer()
+        self._prompt_prefixes = set()  # 프롬프트 캐시 흉내: 지금까지 본 요청 앞부분 해시
+        self.calls: List[Dict] = []
+        self._lock = threading.Lock()
+        self._random = random.Random(seed)
+        self._server = None
+        self._thread = None
+
+        data_random = random.Random(seed)
+        self.videos = [f"vid{i:05d}" for i in range(n_items)]
+        self.transcripts = {
+            video_id: self._make_transcript(data_random, sentences_per_item) for video_id in self.videos
+        }
+        self.articles = [self._make_article(data_random, i, sentences_per_item) for i in range(n_items)]
+
+    # ------------------------------------------------------------------
+    # 서버 수명 주기
+    # ------------------------------------------------------------------
+    def start(self) -> 'FakeServices':
+        handler = type('FakeServiceHandler', (_FakeServiceHandler,), {'services': self})
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def env(self) -> Dict[str, str]:
+        """파이프라인이 로컬 서버를 사용하도록 하는 환경 변수"""
+        return {
+            'OPENAI_API_KEY': 'bench-openai-key',
+            'OPENAI_BASE_URL': f"{self.base_url}/v1",
+            'NOTION_TOKEN': 'bench-notion-token',
+            'NOTION_BASE_URL': self.base_url,
+            'NOTION_DATABASE_ID': 'bench-database',
+            'NOTION_DB_YOUTUBE_CH_ID': 'bench-youtube',
+            'NOTION_DB_POCKET_ID': 'bench-pocket',
+            'NOTION_DB_RAINDROP_ID': 'bench-raindrop',
+            'YOUTUBE_API_KEY': 'bench-youtube-key',
+            'YOUTUBE_API_ENDPOINT': self.base_url,
+            'POCKET_BASE_URL': f"{self.base_url}/v3",
+            'POCKET_CONSUMER_KEY': 'bench-consumer-key',
+            'POCKET_ACCESS_TOKEN': 'bench-access-token',
+            'RAINDROP_BASE_URL': f"{self.base_url}/rest/v1",
+            'RAINDROP_TOKEN': 'bench-raindrop-token',
+        }
+
+    # ------------------------------------------------------------------
+    # 테스트 데이터
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _make_sentence(rng: random.Random) -> str:
+        words = []
+        for _ in range(rng.randint(4, 8)):
+            word = ''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 3)))
+            words.append(word + rng.choice(PARTICLES))
+        words.append(''.join(rng.choice(SYLLABLES) for _ in range(2)) + rng.choice(ENDINGS))
+        return ' '.join(words)
+
+    def _make_transcript(self, rng: random.Random, n_sentences: int) -> List[Dict]:
+        """문장 부호 없이 2~4단어 단위로 끊긴 자막 구간 생성 (문장 끝에는 휴지)"""
+        segments = []
+        start = 0.0
+        for _ in range(n_sentences):
+            words = self._make_sentence(rng).split()
+            while words:
+                size = rng.randint(2, 4)
+                text, words = ' '.join(words[:size]), words[size:]
+                duration = 0.4 * len(text.split())
+                segments.append({'text': text, 'start': round(start, 2), 'duration': round(duration, 2)})
+                start += duration + (0.8 if not words else 0.05)
+        return segments
+
+    def _make_article(self, rng: random.Random, index: int, n_sentences: int) -> Dict:
+        paragraphs = []
+        for _ in range(0, n_sentences, 6):
+            paragraphs.append(' '.join(self._make_sentence(rng) + '.' for _ in range(6)))
+        title = f"벤치마크 기사 {index}"
+        body = ''.join(f"<p>{p}</p>" for p in paragraphs)
+        html = (
+            f"<html><head><title>{title}</title><script>var tracking = {index};</script></head>"
+            f"<body><nav><a href='/'>홈</a><a href='/news'>뉴스</a></nav>"
+            f"<article><h1>{title}</h1>{body}</article>"
+            f"<footer>Copyright</footer></body></html>"
+        )
+        return {'title': title, 'html': html}
+
+    # ------------------------------------------------------------------
+    # 요청 처리
+    # ------------------------------------------------------------------
+    def handle(self, method: str, path: str, query: Dict, body: Dict) -> Tuple[str, int, object, Dict, Dict]:
+        """(서비스, 상태 코드, 응답, 추가 헤더, 기록 필드) 반환"""
+        service, route = self._route(method, path)
+        if service != 'web':
+            self._sleep(self.latency)
+            with self._lock:
+                roll = self._random.random()
+            if roll < self.error_rate:
+                if roll < self.error_rate / 2:
+                    return service, 429, {'error': {'message': 'Rate limit exceeded (injected)'}}, {'Retry-After': '1'}, {}
+                return service, 500, {'error': {'message': 'Internal error (injected)'}}, {}, {}
+        if route is None:
+            return service, 404, {'error': {'message': f'Unknown path: {path}'}}, {}, {}
+        status, payload, fields = route(path, query, body)
+        return service, status, payload, {}, fields
+
+    def _route(self, method: str, path: str):
+        if path.startswith('/v1/chat/completions'):
+            return 'openai', self._chat_completions
+        if path.startswith('/v1/files'):
+            return 'openai', self._files
+        if path.startswith('/v1/batches'):
+            return 'openai', self._batches
+        if path.startswith('/v1/pages'):
+            return 'notion', self._notion_page
+        if path.startswith('/v1/'):
+            return 'notion', self._notion_generic
+        if path.startswith('/youtube/v3/playlistItems'):
+            return 'youtube', self._playlist_items
+        if path.startswith('/youtube/v3/videos'):
+            return 'youtube', self._videos
+        if path.startswith('/youtube/v3/playlists'):
+            return 'youtube', self._playlists
+        if path.startswith('/transcripts/'):
+            return 'youtube', self._transcript
+        if path.startswith('/v3/get'):
+            return 'pocket', self._pocket_get
+        if path.startswith('/rest/v1/raindrops/'):
+            return 'raindrop', self._raindrops
+        if path.startswith('/articles/'):
+            return 'web', self._article
+        return 'unknown', None
+
+    def _sleep(self, seconds: float) -> None:
+        if seconds > 0:
+            with self._lock:
+                jitter = self._random.uniform(0.8, 1.2)
+            time.sleep(seconds * jitter)
+
+    def _chat_completions(self, path, query, body):
+        messages = body.get('messages', [])
+        prompt = '\n'.join(str(m.get('content') or '') for m in messages)
+        schema_text = json.dumps(body.get('functions') or body.get('tools') or body.get('response_format') or '',
+                                 ensure_ascii=False)
+        prompt_tokens = self.count_tokens(prompt) + (self.count_tokens(schema_text) if schema_text != '""' else 0)
+        # 함수/도구 정의가 메시지보다 앞에 렌더링되므로 스키마 -> 메시지 순서로 앞부분 비교
+        cached_tokens = min(self._cached_prefix_tokens(schema_text + prompt), prompt_tokens)
+
+        message = {'role': 'assistant', 'content': None}
+        if body.get('functions'):
+            function = body['functions'][0]
+            schema = function['parameters']
+            arguments = json.dumps(self._sample_output(schema), ensure_ascii=False)
+            message['function_call'] = {'name': function['name'], 'arguments': arguments}
+            finish_reason, output = 'function_call', arguments
+        elif body.get('tools'):
+            function = body['tools'][0]['function']
+            schema = function['parameters']
+            arguments = json.dumps(self._sample_output(schema), ensure_ascii=False)
+            message['tool_calls'] = [{
+                'id': f"call_{uuid.uuid4().hex[:12]}",
+                'type': 'function',
+                'function': {'name': function['name'], 'arguments': arguments},
+            }]
+            finish_reason, output = 'tool_calls', arguments
+        else:
+            response_format = body.get('response_format') or {}
+            schema = response_format.get('json_schema', {}).get('schema', DEFAULT_SUMMARY_SCHEMA)
+            output = json.dumps(self._sample_output(schema), ensure_ascii=False)
+            message['content'] = output
+            finish_reason = 'stop'
+
+        completion_tokens = self.count_tokens(output)
+        self._sleep(self.token_latency * completion_tokens)
+        payload = {
+            'id': f"chatcmpl-{uuid.uuid4().hex[:12]}",
+            'object': 'chat.completion',
+            'created': int(time.time()),
+            'model': body.get('model', 'gpt-3.5-turbo'),
+            'choices': [{'index': 0, 'message': message, 'finish_reason': finish_reason}],
+            'usage': {
+                'prompt_tokens': prompt_tokens,
+                'completion_tokens': completion_tokens,
+                'total_tokens': prompt_tokens + completion_tokens,
+                'prompt_tokens_details': {'cached_tokens': cached_tokens},
+            },
+        }
+        if body.get('stream'):
+            include_usage = (body.get('stream_options') or {}).get('include_usage', False)
+            payload = self._stream_events(payload, include_usage)
+        return 200, payload, {'prompt_tokens': prompt_tokens, 'completion_tokens': completion_tokens,
+                              'cached_tokens': cached_tokens, 'fields': list(schema.get('properties', {}))}
+
+    def _sample_output(self, schema: Dict) -> Dict:
+        """스키마 예시 응답 (invalid_fields에 있는 필드는 처음 한 번 잘못된 타입으로)"""
+        output = sample_from_schema(schema)
+        with self._lock:
+            invalid = self.invalid_fields & set(output)
+            self.invalid_fields -= invalid
+        for name in invalid:
+            output[name] = 0
+        return output
+
+    # 스트리밍 응답 조각 크기 (글자 수)
+    STREAM_PIECE_LENGTH = 32
+
+    def _stream_events(self, payload: Dict, include_usage: bool) -> EventStream:
+        """완성 응답을 chat.completion.chunk 이벤트들로 분할"""
+        choice = payload['choices'][0]
+        message = choice['message']
+        base = {'id': payload['id'], 'object': 'chat.completion.chunk', 'created': payload['created'],
+                'model': payload['model']}
+
+        def event(delta: Dict, finish_reason: Optional[str] = None) -> Dict:
+            return {**base, 'choices': [{'index': 0, 'delta': delta, 'finish_reason': finish_reason}]}
+
+        def pieces(text: str) -> List[str]:
+            size = self.STREAM_PIECE_LENGTH
+            return [text[i:i + size] for i in range(0, len(text), size)]
+
+        events = EventStream([event({'role': 'assistant', 'content': None if message['content'] is None else ''})])
+        if message.get('tool_calls'):
+            call = message['tool_calls'][0]
+            events.append(event({'tool_calls': [{'index': 0, 'id': call['id'], 'type': 'function',
+                                                 'function': {'name': call['function']['name'], 'arguments': ''}}]}))
+            events.extend(event({'tool_calls': [{'index': 0, 'function': {'arguments': piece}}]})
+                          for piece in pieces(call['function']['arguments']))
+        elif message.get('function_call'):
+            call = message['function_call']
+            events.append(event({'function_call': {'name': call['name'], 'arguments': ''}}))
+            events.extend(event({'function_call': {'arguments': piece}}) for piece in pieces(call['arguments']))
+        else:
+            events.extend(event({'content': piece}) for piece in pieces(message['content']))
+        events.append(event({}, choice['finish_reason']))
+        if include_usage:
+            events.append({**base, 'choices': [], 'usage': payload['usage']})
+        return events
+
+    # OpenAI 프롬프트 캐시: 앞부분이 1024 토큰 이상 같으면 128 토큰 단위로 재사용
+    CACHE_MIN_TOKENS = 1024
+    CACHE_INCREMENT = 128
+
+    def _cached_prefix_tokens(self, text: str) -> int:
+        """이전 요청과 같은 앞부분 중 캐시로 처리되는 토큰 수 (이번 요청의 앞부분도 기록)"""
+        tokens = self.tokenize(text)
+        cached = 0
+        with self._lock:
+            for n in range(self.CACHE_MIN_TOKENS, len(tokens) + 1, self.CACHE_INCREMENT):
+                digest = hash(tuple(tokens[:n]))
+                if digest in self._prompt_prefixes:
+                    cached = n
+                else:
+                    self._prompt_prefixes.add(digest)
+        return cached
+
+    def _files(self, path, query, body):
+        parts = path.rstrip('/').split('/')
+        if len(parts) == 3:
+            # 업로드 (multipart/form-data)
+            content = body.get('file', b'')
+            file_id = f"file-{uuid.uuid4().hex[:12]}"
+            with self._lock:
+                self.files[file_id] = {'content': content, 'filename': body.get('filename', 'upload.jsonl'),
+                                       'purpose': body.get('purpose', 'batch')}
+            return 200, self._file_object(file_id), {}
+        file_id = parts[3]
+        if file_id not in self.files:
+            return 404, {'error': {'message': f'No such file: {file_id}'}}, {}
+        if len(parts) == 5 and parts[4] == 'content':
+            return 200, self.files[file_id]['content'], {}
+        return 200, self._file_object(file_id), {}
+
+    def _file_object(self, file_id: str) -> Dict:
+        info = self.files[file_id]
+        return {'id': file_id, 'object': 'file', 'bytes': len(info['content']), 'created_at': int(time.time()),
+                'filename': info['filename'], 'purpose': info['purpose'], 'status': 'processed'}
+
+    def _batches(self, path, query, body):
+        parts = path.rstrip('/').split('/')
+        if len(parts) == 3:
+            input_file_id = body.get('input_file_id')
+            if input_file_id not in self.files:
+                return 400, {'error': {'message': f'No such file: {input_file_id}'}}, {}
+            lines = [json.loads(line) for line in self.files[input_file_id]['content'].decode('utf-8').splitlines()
+                     if line.strip()]
+            batch_id = f"batch_{uuid.uuid4().hex[:12]}"
+            batch = {
+                'id': batch_id, 'object': 'batch', 'endpoint': body.get('endpoint'),
+                'input_file_id': input_file_id, 'completion_window': body.get('completion_window', '24h'),
+                'status': 'in_progress', 'output_file_id': None, 'error_file_id': None,
+                'created_at': int(time.time()), 'metadata': body.get('metadata'),
+                'request_counts': {'total': len(lines), 'completed': 0, 'failed': 0},
+            }
+            with self._lock:
+                self.batches[batch_id] = batch
+            threading.Thread(target=self._run_batch, args=(batch_id, lines), daemon=True).start()
+            return 200, dict(batch), {}
+        batch_id = parts[3]
+        if batch_id not in self.batches:
+            return 404, {'error': {'message': f'No such batch: {batch_id}'}}, {}
+        with self._lock:
+            return 200, dict(self.batches[batch_id]), {}
+
+    def _run_batch(self, batch_id: str, lines: List[Dict]) -> None:
+        """배치 요청을 순서대로 처리하여 출력 파일 생성 (개별 요청 지연/오류 주입 없음)"""
+        started = time.perf_counter()
+        output = []
+        for line in lines:
+            status, payload, fields = self._chat_completions(line.get('url', ''), {}, line.get('body', {}))
+            output.append(json.dumps({
+                'id': f"batch_req_{uuid.uuid4().hex[:12]}",
+                'custom_id': line.get('custom_id'),
+                'response': {'status_code': status, 'request_id': uuid.uuid4().hex, 'body': payload},
+                'error': None,
+            }, ensure_ascii=False))
+            ended = time.perf_counter()
+            self.record({'service': 'openai_batch', 'method': 'POST', 'path': line.get('url', ''),
+                         'status': status, 'start': started, 'end': ended, 'latency': 0.0, **fields})
+        remaining = self.batch_delay - (time.perf_counter() - started)
+        if remaining > 0:
+            time.sleep(remaining)
+
+        file_id = f"file-{uuid.uuid4().hex[:12]}"
+        with self._lock:
+            self.files[file_id] = {'content': ('\n'.join(output) + '\n').encode('utf-8'),
+                                   'filename': f"{batch_id}_output.jsonl", 'purpose': 'batch_output'}
+            batch = self.batches[batch_id]
+            batch.update({'status': 'completed', 'output_file_id': file_id, 'completed_at': int(time.time()),
+                          'request_counts': {'total': len(lines), 'completed': len(lines), 'failed': 0}})
+
+    def _notion_page(self, path, query, body):
+        page = {'object': 'page', 'id': str(uuid.uuid4()), 'properties': body.get('properties', {})}
+        return 200, page, {'page_created': True}
+
+    def _notion_generic(self, path, query, body):
+        if path.endswith('/query') or path.endswith('/children'):
+            return 200, {'object': 'list', 'results': [], 'has_more': False, 'next_cursor': None}, {}
+        return 200, {'object': 'block', 'id': str(uuid.uuid4())}, {}
+
+    def _playlist_items(self, path, query, body):
+        page_size = int(query.get('maxResults', ['50'])[0])
+        offset = int(query.get('pageToken', ['0'])[0] or 0)
+        items = []
+        for position in range(offset, min(offset + page_size, self.n_items)):
+            video_id = self.videos[position]
+            items.append({'snippet': {
+                'resourceId': {'videoId': video_id},
+                'title': f"벤치마크 영상 {position}",
+                'position': position,
+                'description': '벤치마크용 영상',
+                'thumbnails': {'default': {'url': f"{self.base_url}/thumbnails/{video_id}.jpg"}},
+                'publishedAt': '2024-01-01T00:00:00Z',
+            }})
+        payload = {'items': items}
+        if offset + page_size < self.n_items:
+            payload['nextPageToken'] = str(offset + page_size)
+        return 200, payload, {}
+
+    def _videos(self, path, query, body):
+        ids = query.get('id', [''])[0].split(',')
+        items = []
+        for video_id in ids:
+            if video_id not in self.transcripts:
+                continue
+            items.append({
+                'id': video_id,
+                'snippet': {
+                    'title': f"벤치마크 영상 {video_id}",
+                    'channelTitle': '벤치마크 채널',
+                    'publishedAt': '2024-01-01T00:00:00Z',
+                    'description': '벤치마크용 영상',
+                    'thumbnails': {'default': {'url': f"{self.base_url}/thumbnails/{video_id}.jpg"}},
+                    'tags': ['benchmark'],
+                    'categoryId': '27',
+                },
+                'statistics': {'viewCount': '100', 'likeCount': '10', 'commentCount': '1'},
+                'contentDetails': {'duration': 'PT10M'},
+            })
+        return 200, {'items': items}, {}
+
+    def _playlists(self, path, query, body):
+        return 200, {'items': [{'snippet': {'title': '벤치마크 재생목록'}}]}, {}
+
+    def _transcript(self, path, query, body):
+        video_id = path.rsplit('/', 1)[-1]
+        if video_id not in self.transcripts:
+            return 404, {'error': {'message': 'No transcript'}}, {}
+        return 200, self.transcripts[video_id], {}
+
+    def _pocket_get(self, path, query, body):
+        count = int(body.get('count', self.n_items))
+        offset = int(body.get('offset', 0))
+        items = {}
+        for i in range(offset, min(offset + count, self.n_items)):
+            items[str(i)] = {
+                'item_id': str(i),
+                'resolved_title': self.articles[i]['title'],
+                'resolved_url': f"{self.base_url}/articles/{i}",
+                'excerpt': '벤치마크 기사 요약문',
+                'tags': {},
+                'time_added': str(1700000000 + i),
+                'word_count': '500',
+            }
+        return 200, {'status': 1, 'list': items}, {}
+
+    def _raindrops(self, path, query, body):
+        page = int(query.get('page', ['0'])[0])
+        per_page = int(query.get('perpage', [str(self.n_items)])[0])
+        items = []
+        for i in range(page * per_page, min((page + 1) * per_page, self.n_items)):
+            items.append({
+                '_id': i,
+                'title': self.articles[i]['title'],
+                'link': f"{self.base_url}/articles/{i}",
+                'excerpt': '벤치마크 기사 요약문',
+                'tags': [],
+                'created': '2024-01-01T00:00:00Z',
+            })
+        return 200, {'result': True, 'items': items, 'count': self.n_items}, {}
+
+    def _article(self, path, query, body):
+        index = int(path.rsplit('/', 1)[-1])
+        if index >= len(self.articles):
+            return 404, '', {}
+        return 200, self.articles[index]['html'], {}
+
+    def record(self, call: Dict) -> None:
+        with self._lock:
+            self.calls.append(call)
+
+class _FakeServiceHandler(BaseHTTPRequestHandler):
+    """FakeServices로 요청을 전달하는 HTTP 핸들러"""
+
+    services: FakeServices = None
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self._dispatch('GET')
+
+    def do_POST(self):
+        self._dispatch('POST')
+
+    def do_PATCH(self):
+        self._dispatch('PATCH')
+
+    def _dispatch(self, method: str) -> None:
+        started = time.perf_counter()
+        parsed = urlparse(self.path)
+        length = int(self.headers.get('Content-Length') or 0)
+        raw = self.rfile.read(length) if length else b''
+        content_type = self.headers.get('Content-Type') or ''
+        if content_type.startswith('multipart/form-data'):
+            body = self._parse_multipart(content_type, raw)
+        else:
+            try:
+                body = json.loads(raw) if raw else {}
+            except ValueError:
+                body = {}
+
+        service, status, payload, headers, fields = self.services.handle(
+            method, parsed.path, parse_qs(parsed.query), body if isinstance(body, dict) else {})
+
+        if isinstance(payload, EventStream):
+            events = [f"data: {json.dumps(event, ensure_ascii=False)}\n\n" for event in payload]
+            data, content_type = (''.join(events) + 'data: [DONE]\n\n').encode('utf-8'), 'text/event-stream'
+        elif isinstance(payload, bytes):
+            data, content_type = payload, 'application/octet-stream'
+        elif isinstance(payload, str):
+            data, content_type = payload.encode('utf-8'), 'text/html; charset=utf-8'
+        else:
+            data, content_type = json.dumps(payload, ensure_ascii=False).encode('utf-8'), 'application/json'
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+        ended = time.perf_counter()
+        self.services.record({
+            'service': service,
+            'method': method,
+            'path': parsed.path,
+            'status': status,
+            'start': started,
+            'end': ended,
+            'latency': ended - started,
+            **fields,
+        })
+
+    @staticmethod
+    def _parse_multipart(content_type: str, raw: bytes) -> Dict:
+        """multipart/form-data 본문을 {필드: 값} 으로 변환 (파일은 bytes, 파일명은 'filename')"""
+        message = message_from_bytes(f"Content-Type: {content_type}\r\n\r\n".encode('utf-8') + raw, policy=HTTP)
+        fields = {}
+        for part in message.iter_parts():
+            name = part.get_param('name', header='content-disposition')
+            payload = part.get_payload(decode=True) or b''
+            if part.get_filename():
+                fields['filename'] = part.get_filename()
+                fields[name] = payload
+            else:
+                fields[name] = payload.decode('utf-8')
+        return fields
+
+    def log_message(self, format, *args):
+        # 요청 로그 출력 생략
+        pass
+
+class FakeTranscriptApi:
+    """youtube_transcript_api의 list_transcripts 인터페이스로 로컬 서버 자막 제공"""
+
+    def __init__(self, base_url: str):
+        self.base_url = base_url
+
+    def list_transcripts(self, video_id: str) -> '_FakeTranscriptList':
+        return _FakeTranscriptList(self.base_url, video_id)
+
+class _FakeTranscriptList:
+    def __init__(self, base_url: str, video_id: str):
+        self.video_id = video_id
+        transcript = _FakeTranscript(base_url, video_id)
+        self.manual = [transcript]
+        self.generated = []
+
+    def find_transcript(self, language_codes: List[str]) -> '_FakeTranscript':
+        for transcript in self.manual:
+            if transcript.language_code in language_codes:
+                return transcript
+        raise NoTranscriptFound(self.video_id, language_codes, self)
+
+    def find_generated_transcript(self, language_codes: List[str]) -> '_FakeTranscript':
+        raise NoTranscriptFound(self.video_id, language_codes, self)
+
+    def __iter__(self):
+        return iter(self.manual + self.generated)
+
+class _FakeTranscript:
+    language = 'Korean'
+    language_code = 'ko'
+
+    def __init__(self, base_url: str, video_id: str):
+        self.url = f"{base_url}/transcripts/{video_id}"
+
+    def fetch(self) -> List[Dict]:
+        response = requests.get(self.url)
+        response.raise_for_status()
+        return response.json()
+
+def percentile(values: List[float], q: float) -> Optional[float]:
+    """선형 보간 백분위수 (q: 0~100)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
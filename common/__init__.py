@@ -0,0 +1,10 @@
+# common 패키지 초기화
+from .sentences import SentenceSegmenter
+from .log import get_logger, configure_logging, lazy
+
+__all__ = [
+    'SentenceSegmenter',
+    'get_logger',
+    'configure_logging',
+    'lazy'
+]
@@ -0,0 +1,145 @@
+import json
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+from common.metrics import metrics
+from common.usage import ledger, cached_tokens
+from common.log import get_logger
+
+logger = get_logger(__name__)
+
+class BatchRunner:
+    """OpenAI Batch API로 chat.completions 요청 일괄 처리
+
+    요청을 JSONL 배치 파일로 저장하여 업로드하고, 배치 작업이 끝날 때까지 폴링한 뒤
+    custom_id별 응답 본문을 반환한다. 배치 요청은 동기 요청보다 토큰 단가가 절반이며
+    분당 요청 수 제한에 걸리지 않는다 (대신 최대 completion_window까지 지연될 수 있음).
+    """
+
+    ENDPOINT = '/v1/chat/completions'
+    TERMINAL_STATUSES = {'completed', 'failed', 'expired', 'cancelled'}
+    MAX_REQUESTS_PER_BATCH = 50000  # Batch API 파일당 최대 요청 수
+
+    def __init__(self, client, batch_dir: str = 'batches', poll_interval: float = 30.0,
+                 completion_window: str = '24h', timeout: Optional[float] = None):
+        """
+        Args:
+            client: openai.OpenAI 클라이언트
+            batch_dir: 배치 입력/출력 JSONL 저장 경로
+            poll_interval: 상태 확인 간격(초)
+            completion_window: 배치 완료 기한
+            timeout: 최대 대기 시간(초), None이면 무제한
+        """
+        self.client = client
+        self.batch_dir = Path(batch_dir)
+        self.poll_interval = poll_interval
+        self.completion_window = completion_window
+        self.timeout = timeout
+
+    def run(self, requests: List[Dict], description: str = None) -> Dict[str, Optional[Dict]]:
+        """요청 목록을 배치로 실행
+
+        Args:
+            requests: [{'custom_id': str, 'body': chat.completions 요청 본문}]
+            description: 배치 설명 (metadata)
+
+        Returns:
+            custom_id별 chat.completion 응답 본문 (실패한 요청은 None)
+        """
+        if not requests:
+            return {}
+        self.batch_dir.mkdir(parents=True, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+        # 파일당 요청 수 제한에 맞춰 나눠 제출한 뒤 함께 대기
+        batch_ids = []
+        for start in range(0, len(requests), self.MAX_REQUESTS_PER_BATCH):
+            part = requests[start:start + self.MAX_REQUESTS_PER_BATCH]
+            path = self.batch_dir / f"requests_{timestamp}_{start // self.MAX_REQUESTS_PER_BATCH}.jsonl"
+            batch_ids.append(self.submit(part, path, description))
+
+        results = {request['custom_id']: None for request in requests}
+        for batch_id in batch_ids:
+            batch = self.wait(batch_id)
+            results.update(self.collect(batch))
+        return results
+
+    def submit(self, requests: List[Dict], path: Path, description: str = None) -> str:
+        """배치 입력 파일 작성 및 업로드 후 배치 생성, 배치 ID 반환"""
+        with open(path, 'w', encoding='utf-8') as f:
+            for request in requests:
+                line = {
+                    'custom_id': request['custom_id'],
+                    'method': 'POST',
+                    'url': self.ENDPOINT,
+                    'body': request['body'],
+                }
+                f.write(json.dumps(line, ensure_ascii=False) + '\n')
+
+        with open(path, 'rb') as f:
+            input_file = self.client.files.create(file=f, purpose='batch')
+        batch = self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=self.ENDPOINT,
+            completion_window=self.completion_window,
+            metadata={'description': description} if description else None
+        )
+        metrics.incr('batches_submitted')
+        logger.info("배치 제출: %s (요청 %d개, %s)", batch.id, len(requests), path)
+        return batch.id
+
+    def wait(self, batch_id: str):
+        """배치가 종료 상태가 될 때까지 폴링"""
+        started = time.monotonic()
+        with metrics.stage('batch_wait'):
+            while True:
+                batch = self.client.batches.retrieve(batch_id)
+                if batch.status in self.TERMINAL_STATUSES:
+                    break
+                if self.timeout is not None and time.monotonic() - started > self.timeout:
+                    raise TimeoutError(f"배치 대기 시간 초과: {batch_id} ({batch.status})")
+                counts = batch.request_counts
+                logger.debug("배치 %s: %s (%s/%s)", batch_id, batch.status,
+                             counts.completed if counts else '-', counts.total if counts else '-')
+                time.sleep(self.poll_interval)
+
+        if batch.status != 'completed':
+            logger.error("배치 실패: %s (%s)", batch_id, batch.status)
+        return batch
+
+    def collect(self, batch) -> Dict[str, Optional[Dict]]:
+        """배치 출력 파일에서 custom_id별 응답 본문 추출 및 사용량 기록"""
+        results = {}
+        if batch.output_file_id:
+            content = self.client.files.content(batch.output_file_id).text
+            output_path = self.batch_dir / f"{batch.id}_output.jsonl"
+            output_path.write_text(content, encoding='utf-8')
+            for line in content.splitlines():
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                response = record.get('response') or {}
+                body = response.get('body')
+                if response.get('status_code') != 200 or not body:
+                    logger.warning("배치 요청 실패: %s (%s)", record.get('custom_id'),
+                                   record.get('error') or response.get('status_code'))
+                    results[record['custom_id']] = None
+                    continue
+                usage = body.get('usage') or {}
+                model = body.get('model', '')
+                cached = cached_tokens(usage)
+                metrics.observe_llm(model, usage.get('prompt_tokens', 0), usage.get('completion_tokens', 0),
+                                    cached_tokens=cached, batch=True)
+                ledger.record(model, usage.get('prompt_tokens', 0), usage.get('completion_tokens', 0), batch=True,
+                              cached_tokens=cached)
+                results[record['custom_id']] = body
+
+        if batch.error_file_id:
+            content = self.client.files.content(batch.error_file_id).text
+            for line in content.splitlines():
+                if line.strip():
+                    record = json.loads(line)
+                    logger.warning("배치 요청 오류: %s (%s)", record.get('custom_id'), record.get('error'))
+                    results[record['custom_id']] = None
+        return results
@@ -0,0 +1,77 @@
+import json
+import hashlib
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+from common.metrics import metrics
+from common.log import get_logger
+
+logger = get_logger(__name__)
+
+class ChunkCache:
+    """청크 내용 해시 -> map 단계 요약 캐시
+
+    키는 모델, 프롬프트(또는 함수 스키마), 청크 본문을 함께 해시한 값이므로 자막이나 기사가
+    일부만 바뀌면 바뀐 청크만 캐시에 없고 나머지 청크의 요약은 그대로 재사용된다. 경로를
+    지정하면 append-only JSONL로 저장하여 다음 실행에서도 사용한다.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self._lock = threading.Lock()
+        self.configure(path)
+
+    def configure(self, path: Optional[str] = None) -> None:
+        """저장 경로 설정 (None이면 메모리에만 보관), 기존 기록을 읽어 옴"""
+        with self._lock:
+            self.path = Path(path) if path else None
+            self.entries: Dict[str, object] = {}
+            if self.path is None:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            if self.path.exists():
+                with open(self.path, encoding='utf-8') as f:
+                    for line in f:
+                        try:
+                            record = json.loads(line)
+                        except ValueError:
+                            continue  # 기록 중 중단된 마지막 줄
+                        self.entries[record['key']] = record['value']
+                logger.debug("청크 캐시 로드: %d개 (%s)", len(self.entries), self.path)
+
+    @staticmethod
+    def key(*parts) -> str:
+        """키 구성 요소(모델, 프롬프트, 청크 등)의 해시"""
+        digest = hashlib.blake2b(digest_size=16)
+        for part in parts:
+            text = part if isinstance(part, str) else json.dumps(part, ensure_ascii=False, sort_keys=True)
+            digest.update(text.encode('utf-8'))
+            digest.update(b'\0')
+        return digest.hexdigest()
+
+    def get(self, key: str):
+        with self._lock:
+            value = self.entries.get(key)
+        metrics.incr('chunk_cache_hits' if value is not None else 'chunk_cache_misses')
+        return value
+
+    def peek(self, key: str):
+        """계측 없이 조회"""
+        with self._lock:
+            return self.entries.get(key)
+
+    def put(self, key: str, value) -> None:
+        if value is None:
+            return
+        with self._lock:
+            if self.entries.get(key) == value:
+                return
+            self.entries[key] = value
+            if self.path is not None:
+                with open(self.path, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps({'key': key, 'value': value}, ensure_ascii=False) + '\n')
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+# 프로세스 전역 청크 요약 캐시
+chunk_cache = ChunkCache()
@@ -0,0 +1,175 @@
+import json
+import re
+from typing import Dict, List, Optional
+
+# 문자열 밖에서 구조에 영향을 주는 글자
+_STRUCTURAL = re.compile(r'["{}\[\],]')
+# 문자열 안에서 상태를 바꾸는 글자
+_STRING_SPECIAL = re.compile(r'["\\]')
+
+_decoder = json.JSONDecoder()
+
+class JsonStreamParser:
+    """스트리밍 응답에서 최상위 JSON 객체의 필드를 완성되는 대로 파싱
+
+    feed()로 받은 조각의 새 글자만 훑으며 문자열/이스케이프/중첩 깊이를 추적하고, 최상위
+    필드 값이 끝나면(깊이 1의 ',' 또는 닫는 '}') 그 필드만 json으로 파싱한다. 응답 전체를
+    다시 파싱하거나 문자열 안의 공백을 바꾸지 않는다. 파싱에 실패한 필드는 errors에 모아
+    해당 필드만 다시 요청할 수 있게 한다. 첫 '{' 앞의 글자(코드 펜스 등)는 무시한다.
+    """
+
+    def __init__(self):
+        self.fields: Dict[str, object] = {}
+        self.errors: Dict[str, str] = {}
+        self.done = False
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._segment: List[str] = []
+
+    def feed(self, text: str) -> List[str]:
+        """응답 조각 추가, 이번 조각에서 완성된 필드 이름 목록 반환"""
+        completed = []
+        pos, length = 0, len(text or '')
+        while pos < length and not self.done:
+            if self._in_string:
+                if self._escape:
+                    # 이스케이프된 글자 (조각 경계에 걸친 경우 포함)
+                    self._escape = False
+                    self._append(text[pos])
+                    pos += 1
+                    continue
+                match = _STRING_SPECIAL.search(text, pos)
+                if match is None:
+                    self._append(text[pos:])
+                    break
+                end = match.end()
+                if match.group() == '\\':
+                    self._escape = True
+                else:
+                    self._in_string = False
+                self._append(text[pos:end])
+                pos = end
+                continue
+
+            match = _STRUCTURAL.search(text, pos)
+            if match is None:
+                self._append(text[pos:])
+                break
+            char, start = match.group(), match.start()
+            if self._depth == 0:
+                # 최상위 객체 시작 전 글자는 버림
+                if char == '{':
+                    self._depth = 1
+                pos = match.end()
+                continue
+            if self._depth == 1 and char in ',}':
+                self._append(text[pos:start])
+                name = self._finish_segment()
+                if name is not None:
+                    completed.append(name)
+                if char == '}':
+                    self._depth = 0
+                    self.done = True
+                pos = match.end()
+                continue
+            if char == '"':
+                self._in_string = True
+            elif char in '{[':
+                self._depth += 1
+            elif char in '}]':
+                self._depth -= 1
+            self._append(text[pos:match.end()])
+            pos = match.end()
+        return completed
+
+    def close(self) -> Dict[str, object]:
+        """스트림 종료, 끝나지 않은 필드(잘린 응답)는 오류로 기록하고 파싱된 필드 반환"""
+        if not self.done and self._depth > 0:
+            segment = ''.join(self._segment).strip()
+            if segment:
+                self.errors[self._field_name(segment) or ''] = '응답이 필드 중간에서 끝남'
+            self._segment = []
+        return self.fields
+
+    def _append(self, piece: str) -> None:
+        if self._depth > 0 and piece:
+            self._segment.append(piece)
+
+    @staticmethod
+    def _field_name(segment: str) -> Optional[str]:
+        try:
+            name, _ = _decoder.raw_decode(segment)
+        except ValueError:
+            return None
+        return name if isinstance(name, str) else None
+
+    def _finish_segment(self) -> Optional[str]:
+        """'"이름": 값' 조각 하나를 파싱해 fields/errors에 기록"""
+        segment = ''.join(self._segment).strip()
+        self._segment = []
+        if not segment:
+            return None
+        name = self._field_name(segment)
+        if name is None:
+            self.errors[''] = f"필드 이름을 읽을 수 없음: {segment[:50]}"
+            return None
+        try:
+            _, end = _decoder.raw_decode(segment)
+            rest = segment[end:].lstrip()
+            if not rest.startswith(':'):
+                raise ValueError("':' 없음")
+            value_text = rest[1:].strip()
+            value, end = _decoder.raw_decode(value_text)
+            if value_text[end:].strip():
+                raise ValueError(f"값 뒤에 남은 글자: {value_text[end:end + 20]}")
+        except ValueError as e:
+            self.errors[name] = str(e)
+            return None
+        self.fields[name] = value
+        self.errors.pop(name, None)
+        return name
+
+def parse_json_fields(text: str) -> JsonStreamParser:
+    """완성된 응답 텍스트를 한 번에 파싱 (배치 결과 등)"""
+    parser = JsonStreamParser()
+    parser.feed(text)
+    parser.close()
+    return parser
+
+_TYPES = {
+    'string': str,
+    'array': list,
+    'object': dict,
+    'boolean': bool,
+    'integer': int,
+    'number': (int, float),
+}
+
+def _matches(value, schema: Dict) -> bool:
+    """값이 스키마의 type/required/items/properties를 만족하는지 확인 (길이 제한은 확인하지 않음)"""
+    expected = _TYPES.get(schema.get('type'))
+    if expected is not None:
+        if not isinstance(value, expected) or (expected is not bool and isinstance(value, bool)):
+            return False
+    if isinstance(value, list) and isinstance(schema.get('items'), dict):
+        return all(_matches(item, schema['items']) for item in value)
+    if isinstance(value, dict):
+        properties = schema.get('properties') or {}
+        if any(name not in value for name in schema.get('required') or []):
+            return False
+        return all(_matches(value[name], properties[name]) for name in value if name in properties)
+    return True
+
+def invalid_fields(fields: Dict, schema: Dict, errors: Optional[Dict[str, str]] = None) -> List[str]:
+    """스키마의 최상위 속성 중 없거나(required) 형식이 맞지 않거나 파싱에 실패한 필드 목록"""
+    properties = schema.get('properties') or {}
+    required = schema.get('required') or list(properties)
+    invalid = []
+    for name, property_schema in properties.items():
+        if name in fields:
+            if not _matches(fields[name], property_schema):
+                invalid.append(name)
+        elif name in required or (errors and name in errors):
+            invalid.append(name)
+    return invalid
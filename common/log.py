@@ -0,0 +1,106 @@
+import sys
+import json
+import logging
+import threading
+from typing import Callable, Dict, Optional
+
+# 파이프라인 로거 공통 이름 공간 (외부 라이브러리 로그와 분리)
+ROOT_LOGGER = 'pipeline'
+
+class lazy:
+    """로그가 실제로 출력될 때만 계산되는 메시지 인자
+
+    예: logger.debug("미리보기: %s", lazy(lambda: chunk[:100]))
+    """
+
+    __slots__ = ('func',)
+
+    def __init__(self, func: Callable[[], object]):
+        self.func = func
+
+    def __str__(self) -> str:
+        return str(self.func())
+
+class SampleFilter(logging.Filter):
+    """반복되는 DEBUG 로그 샘플링
+
+    같은 로거의 같은 메시지 템플릿(청크별 미리보기 등)은 처음 first개를 출력한 뒤
+    every개마다 하나씩만 출력한다. INFO 이상은 항상 출력한다.
+    """
+
+    def __init__(self, first: int = 3, every: int = 100):
+        super().__init__()
+        self.first = first
+        self.every = every
+        self._counts: Dict[tuple, int] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG:
+            return True
+        key = (record.name, record.msg)
+        with self._lock:
+            count = self._counts.get(key, 0) + 1
+            self._counts[key] = count
+        if count <= self.first:
+            return True
+        return self.every > 0 and (count - self.first) % self.every == 0
+
+class JsonFormatter(logging.Formatter):
+    """로그 레코드를 JSON 한 줄로 변환 (파일 출력용)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            'time': self.formatTime(record, '%Y-%m-%dT%H:%M:%S'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        if record.exc_info:
+            data['exc_info'] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False)
+
+class _StdoutHandler(logging.StreamHandler):
+    """출력 시점의 sys.stdout 사용 (redirect_stdout 등과 호환)"""
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value):
+        pass
+
+def get_logger(name: str) -> logging.Logger:
+    """모듈별 로거 반환 (pipeline.<name>)"""
+    return logging.getLogger(f"{ROOT_LOGGER}.{name}")
+
+def configure_logging(level: str = 'INFO', path: Optional[str] = None,
+                      sample_first: int = 3, sample_every: int = 100) -> logging.Logger:
+    """파이프라인 로깅 설정
+
+    Args:
+        level: 로그 레벨 (DEBUG/INFO/WARNING/ERROR)
+        path: JSONL 로그 파일 경로 (옵션)
+        sample_first: 반복 DEBUG 로그를 그대로 출력할 개수
+        sample_every: 이후 출력할 반복 DEBUG 로그 간격 (0이면 출력 안 함)
+    """
+    root = logging.getLogger(ROOT_LOGGER)
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+        handler.close()
+    root.setLevel(getattr(logging, str(level).upper(), logging.INFO))
+    root.propagate = False
+
+    sampler = SampleFilter(first=sample_first, every=sample_every)
+    console = _StdoutHandler()
+    console.setFormatter(logging.Formatter('%(message)s'))
+    console.addFilter(sampler)
+    root.addHandler(console)
+
+    if path:
+        file_handler = logging.FileHandler(path, encoding='utf-8')
+        file_handler.setFormatter(JsonFormatter())
+        file_handler.addFilter(sampler)
+        root.addHandler(file_handler)
+    return root
@@ -0,0 +1,238 @@
+import json
+import time
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Optional
+
+# 현재 처리 중인 항목 기록 (스레드/비동기 작업별로 분리)
+_current_item: ContextVar[Optional[Dict]] = ContextVar('metrics_item', default=None)
+
+class Metrics:
+    """항목별 단계 시간, 토큰 수, 이벤트 횟수 계측
+
+    metrics.item()으로 감싼 구간이 항목 하나이며, 그 안에서 호출한 stage/observe_llm/
+    incr/set 결과가 해당 항목 기록에 누적된다. 항목이 끝나면 JSONL 한 줄로 저장하고,
+    전체 누적값은 Prometheus 텍스트 형식으로 노출할 수 있다. 항목 밖에서 기록한 값은
+    전체 누적값에만 반영된다.
+    """
+
+    PREFIX = 'summarizer'
+
+    def __init__(self):
+        self.path: Optional[Path] = None
+        self._file = None
+        self._server = None
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """누적값 초기화"""
+        with self._lock:
+            self.stage_seconds: Dict[str, float] = {}
+            self.stage_calls: Dict[str, int] = {}
+            self.counters: Dict[str, float] = {}
+            self.items: Dict[tuple, int] = {}
+            self.llm_calls = 0
+            self.prompt_tokens = 0
+            self.cached_tokens = 0
+            self.completion_tokens = 0
+
+    def configure(self, path: Optional[str] = None, port: Optional[int] = None, host: str = '127.0.0.1') -> None:
+        """JSONL 저장 경로 및 Prometheus 엔드포인트 주소 설정"""
+        self.close()
+        if path:
+            self.path = Path(path)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, 'a', encoding='utf-8')
+        if port is not None:
+            self.serve(port, host)
+
+    def close(self) -> None:
+        if self._file:
+            self._file.close()
+            self._file = None
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    # ------------------------------------------------------------------
+    # 기록
+    # ------------------------------------------------------------------
+    @contextmanager
+    def item(self, source: str, key: str):
+        """항목 하나의 처리 구간 (종료 시 JSONL 기록)"""
+        record = {
+            'source': source,
+            'key': key,
+            'started_at': datetime.now().isoformat(timespec='seconds'),
+            'status': 'ok',
+            'stages': {},
+            'llm_calls': [],
+            'counters': {},
+            'values': {},
+        }
+        token = _current_item.set(record)
+        started = time.perf_counter()
+        try:
+            yield record
+        except Exception as e:
+            record['status'] = 'error'
+            record['error'] = str(e)
+            raise
+        finally:
+            record['total_seconds'] = round(time.perf_counter() - started, 4)
+            _current_item.reset(token)
+            self._finish(record)
+
+    @contextmanager
+    def stage(self, name: str):
+        """단계 소요 시간 측정"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe_stage(name, time.perf_counter() - started)
+
+    def observe_stage(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self.stage_seconds[name] = self.stage_seconds.get(name, 0.0) + seconds
+            self.stage_calls[name] = self.stage_calls.get(name, 0) + 1
+        record = _current_item.get()
+        if record is not None:
+            stages = record['stages']
+            stages[name] = round(stages.get(name, 0.0) + seconds, 4)
+
+    def observe_llm(self, model: str, prompt_tokens: int, completion_tokens: int,
+                    seconds: Optional[float] = None, cached_tokens: int = 0, **extra) -> None:
+        """LLM 호출 한 번의 토큰 수(프롬프트 캐시로 처리된 입력 토큰 포함)와 소요 시간 기록"""
+        prompt_tokens = prompt_tokens or 0
+        completion_tokens = completion_tokens or 0
+        cached_tokens = cached_tokens or 0
+        with self._lock:
+            self.llm_calls += 1
+            self.prompt_tokens += prompt_tokens
+            self.cached_tokens += cached_tokens
+            self.completion_tokens += completion_tokens
+        if seconds is not None:
+            self.observe_stage('llm', seconds)
+        record = _current_item.get()
+        if record is not None:
+            call = {'model': model, 'prompt_tokens': prompt_tokens, 'completion_tokens': completion_tokens}
+            if cached_tokens:
+                call['cached_tokens'] = cached_tokens
+            if seconds is not None:
+                call['seconds'] = round(seconds, 4)
+            call.update(extra)
+            record['llm_calls'].append(call)
+
+    def incr(self, name: str, value: float = 1) -> None:
+        """이벤트 횟수 증가 (재시도, 번역 호출 등)"""
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+        record = _current_item.get()
+        if record is not None:
+            record['counters'][name] = record['counters'].get(name, 0) + value
+
+    def mark_error(self, error: Exception) -> None:
+        """현재 항목을 실패로 표시 (예외를 처리한 뒤에도 기록에 남기기 위함)"""
+        record = _current_item.get()
+        if record is not None:
+            record['status'] = 'error'
+            record['error'] = str(error)
+
+    def current_item(self) -> Optional[Dict]:
+        """현재 처리 중인 항목 기록 (항목 밖이면 None)"""
+        return _current_item.get()
+
+    def set(self, name: str, value) -> None:
+        """현재 항목의 값 기록 (자막 길이, 청크 수 등)"""
+        record = _current_item.get()
+        if record is not None:
+            record['values'][name] = value
+
+    def _finish(self, record: Dict) -> None:
+        record['prompt_tokens'] = sum(call['prompt_tokens'] for call in record['llm_calls'])
+        record['completion_tokens'] = sum(call['completion_tokens'] for call in record['llm_calls'])
+        record['cached_tokens'] = sum(call.get('cached_tokens', 0) for call in record['llm_calls'])
+        with self._lock:
+            key = (record['source'], record['status'])
+            self.items[key] = self.items.get(key, 0) + 1
+            if self._file:
+                self._file.write(json.dumps(record, ensure_ascii=False) + '\n')
+                self._file.flush()
+
+    # ------------------------------------------------------------------
+    # 출력
+    # ------------------------------------------------------------------
+    def render_prometheus(self) -> str:
+        """누적값을 Prometheus 텍스트 형식으로 변환"""
+        p = self.PREFIX
+        lines = []
+
+        def metric(name: str, kind: str, help_text: str, samples):
+            lines.append(f"# HELP {p}_{name} {help_text}")
+            lines.append(f"# TYPE {p}_{name} {kind}")
+            for labels, value in samples:
+                label_text = ','.join(f'{k}="{v}"' for k, v in labels.items())
+                lines.append(f"{p}_{name}{{{label_text}}} {value}" if label_text else f"{p}_{name} {value}")
+
+        with self._lock:
+            metric('items_total', 'counter', 'Processed items',
+                   [({'source': s, 'status': st}, n) for (s, st), n in sorted(self.items.items())])
+            metric('stage_seconds_total', 'counter', 'Time spent per stage',
+                   [({'stage': s}, round(v, 6)) for s, v in sorted(self.stage_seconds.items())])
+            metric('stage_calls_total', 'counter', 'Calls per stage',
+                   [({'stage': s}, v) for s, v in sorted(self.stage_calls.items())])
+            metric('llm_calls_total', 'counter', 'LLM calls', [({}, self.llm_calls)])
+            metric('llm_tokens_total', 'counter', 'LLM tokens',
+                   [({'type': 'prompt'}, self.prompt_tokens), ({'type': 'cached'}, self.cached_tokens),
+                    ({'type': 'completion'}, self.completion_tokens)])
+            metric('events_total', 'counter', 'Retries, translation calls and other events',
+                   [({'name': n}, v) for n, v in sorted(self.counters.items())])
+        return '\n'.join(lines) + '\n'
+
+    def serve(self, port: int, host: str = '127.0.0.1') -> int:
+        """Prometheus 텍스트 엔드포인트(/metrics) 시작, 실제 포트 반환 (기본은 로컬에서만 접근)"""
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                data = metrics.render_prometheus().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self._server.server_address[1]
+
+    def report(self) -> str:
+        """단계별 소요 시간 및 토큰 합계 요약"""
+        with self._lock:
+            # 단계는 중첩될 수 있음 (예: summarize 안의 llm)
+            lines = ["=== 단계별 소요 시간 ==="]
+            for name, seconds in sorted(self.stage_seconds.items(), key=lambda kv: -kv[1]):
+                calls = self.stage_calls[name]
+                lines.append(f"{name:<16}{seconds:>10.2f}s {calls:>6}회 (평균 {seconds / calls:.3f}s)")
+            lines.append(f"LLM 호출: {self.llm_calls}회, 입력 {self.prompt_tokens} (캐시 {self.cached_tokens}) / "
+                         f"출력 {self.completion_tokens} 토큰")
+            if self.counters:
+                lines.append("이벤트: " + ', '.join(f"{k}={v:g}" for k, v in sorted(self.counters.items())))
+        return '\n'.join(lines)
+
+# 프로세스 전역 계측 인스턴스
+metrics = Metrics()
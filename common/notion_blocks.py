@@ -0,0 +1,80 @@
+import json
+from typing import Callable, Dict, List, Optional
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Notion API: 요청 하나에 담을 수 있는 최대 자식 블록 수 (pages.create, blocks.children.append)
+MAX_BLOCKS_PER_REQUEST = 100
+
+def dumps(obj) -> bytes:
+    """Notion 요청 본문 직렬화 (orjson이 있으면 사용)"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def plain_text(content: str) -> List[Dict]:
+    return [{"type": "text", "text": {"content": content}}]
+
+def block(block_type: str, rich_text: List[Dict]) -> Dict:
+    """rich_text를 담는 블록 (paragraph, heading_1/2, bulleted_list_item 등)"""
+    return {"object": "block", "type": block_type, block_type: {"rich_text": rich_text}}
+
+# 요약마다 같은 내용인 블록은 한 번만 만들어 재사용 (직렬화만 되고 수정되지 않음)
+TABLE_OF_CONTENTS = {"object": "block", "type": "table_of_contents", "table_of_contents": {}}
+SECTIONS_HEADING = block("heading_1", plain_text("Detailed Section Summaries"))
+EMPTY_PARAGRAPH = block("paragraph", plain_text(""))
+
+def image_block(url: str) -> Dict:
+    return {"object": "block", "type": "image", "image": {"type": "external", "external": {"url": url}}}
+
+def chapter_headings(chapters: List[Dict]) -> Dict[int, str]:
+    """챕터가 시작하는 섹션 번호 -> 챕터 제목 블록 텍스트 (빈 챕터 제외)"""
+    headings = {}
+    for idx, chapter in enumerate(chapters or []):
+        indices = chapter.get('section_indices', {})
+        start, end = indices.get('start'), indices.get('end')
+        if start is None or end is None or start >= end:
+            continue
+        headings.setdefault(start, f"{idx + 1}. {chapter.get('chapter_title', '')}")
+    return headings
+
+def build_summary_blocks(summary: Dict, highlight: Callable[[str], List[Dict]],
+                         chapters: Optional[List[Dict]] = None, thumbnail: Optional[str] = None) -> List[Dict]:
+    """섹션 요약을 Notion 블록 목록으로 변환 (섹션을 한 번만 순회)
+
+    Args:
+        summary: 'sections' 목록을 포함한 요약
+        highlight: 텍스트 -> rich_text 변환 함수 (키워드 강조)
+        chapters: 챕터 목록 (section_indices 기준으로 챕터 제목 삽입)
+        thumbnail: 썸네일 이미지 URL
+    """
+    blocks = [TABLE_OF_CONTENTS]
+    if thumbnail:
+        blocks.append(image_block(thumbnail))
+
+    sections = summary.get('sections') if isinstance(summary, dict) else None
+    if not sections:
+        return blocks
+
+    blocks.append(SECTIONS_HEADING)
+    headings = chapter_headings(chapters)
+    for i, segment in enumerate(sections):
+        heading = headings.get(i)
+        if heading is not None:
+            blocks.append(block("heading_1", plain_text(heading)))
+        if not isinstance(segment, dict):
+            continue
+        blocks.append(block("heading_2", highlight(f'{i+1}. {segment.get("title", "")}')))
+        items = segment.get('summary', [])
+        if isinstance(items, list):
+            blocks.extend(block("bulleted_list_item", highlight(str(item))) for item in items)
+        blocks.append(EMPTY_PARAGRAPH)
+    return blocks
+
+def block_batches(blocks: List[Dict], size: int = MAX_BLOCKS_PER_REQUEST) -> List[List[Dict]]:
+    """요청당 블록 수 제한에 맞춰 분할 (첫 묶음은 pages.create, 나머지는 append)"""
+    return [blocks[i:i + size] for i in range(0, len(blocks), size)]
@@ -0,0 +1,199 @@
+from typing import Dict, List, Optional, Tuple
+from common.notion_blocks import block, dumps, MAX_BLOCKS_PER_REQUEST
+from common.metrics import metrics
+from common.resilience import resilience
+
+# Notion API 제한
+MAX_TEXT_LENGTH = 2000        # rich_text 조각 하나의 content 길이
+MAX_RICH_TEXT_ITEMS = 100     # 속성/블록 하나의 rich_text 조각 수
+MAX_PAYLOAD_BYTES = 500_000   # 요청 본문 크기
+# 속성 하나/블록 하나가 차지할 수 있는 최대 크기 (한 요청에 여러 개가 함께 담기도록 여유를 둠)
+MAX_ITEM_BYTES = 100_000
+
+def split_text(text: str, limit: int = MAX_TEXT_LENGTH) -> List[str]:
+    """텍스트를 limit 글자 이하 조각으로 분할 (이어 붙이면 원문과 동일)"""
+    if not text:
+        return ['']
+    return [text[i:i + limit] for i in range(0, len(text), limit)]
+
+def rich_text(text) -> List[Dict]:
+    """긴 텍스트를 잘라내지 않고 여러 rich_text 조각으로 변환"""
+    return [{"text": {"content": part}} for part in split_text('' if text is None else str(text))]
+
+def text_property(text) -> Dict:
+    return {"rich_text": rich_text(text)}
+
+def split_rich_text(parts: List[Dict]) -> List[Dict]:
+    """content가 긴 rich_text 조각을 서식(annotations 등)을 유지한 채 분할"""
+    result = []
+    for part in parts:
+        content = part.get('text', {}).get('content')
+        if content is None or len(content) <= MAX_TEXT_LENGTH:
+            result.append(part)
+            continue
+        for piece in split_text(content):
+            result.append({**part, "text": {**part['text'], "content": piece}})
+    return result
+
+def _group(parts: List[Dict]) -> List[Tuple[List[Dict], int]]:
+    """rich_text 조각을 개수/크기 제한에 맞는 묶음으로 순서대로 나눔
+
+    Returns:
+        (묶음, 묶음 조각들의 직렬화 크기 합 + 구분자) 목록
+    """
+    groups, current, size = [], [], 0
+    for part in parts:
+        part_size = len(dumps(part)) + 1
+        if current and (len(current) >= MAX_RICH_TEXT_ITEMS or size + part_size > MAX_ITEM_BYTES):
+            groups.append((current, size))
+            current, size = [], 0
+        current.append(part)
+        size += part_size
+    groups.append((current, size))
+    return groups
+
+def _within_limits(parts: List[Dict]) -> bool:
+    """조각 수와 조각별 글자 수가 제한 안인지 (직렬화 없이 확인)"""
+    return len(parts) <= MAX_RICH_TEXT_ITEMS and all(
+        len(part.get('text', {}).get('content') or '') <= MAX_TEXT_LENGTH for part in parts)
+
+def _fit_rich_text(value: Dict, wrap) -> List[Tuple[Dict, int]]:
+    """rich_text를 가진 값(블록 본문/속성)을 제한에 맞게 나누고 각각의 직렬화 크기와 함께 반환
+
+    대부분의 값은 제한 안이므로 한 번만 직렬화한다. 나눠야 할 때만 조각별로 크기를 재고,
+    나뉜 값의 크기는 조각 크기 합으로 계산한다.
+
+    Args:
+        value: rich_text 키를 가진 dict
+        wrap: rich_text 목록 -> 전송할 값(블록 또는 속성) 생성 함수
+    """
+    parts = value['rich_text']
+    if _within_limits(parts):
+        fitted = wrap(parts)
+        size = len(dumps(fitted))
+        if size <= MAX_ITEM_BYTES:
+            return [(fitted, size)]
+    # 빈 rich_text일 때의 크기 + 조각 크기 합 - 마지막 구분자
+    overhead = len(dumps(wrap([])))
+    return [(wrap(group), overhead + group_size - 1 if group else overhead)
+            for group, group_size in _group(split_rich_text(parts))]
+
+def _fit_block_sized(notion_block: Dict) -> List[Tuple[Dict, int]]:
+    block_type = notion_block.get('type')
+    body = notion_block.get(block_type)
+    if not isinstance(body, dict) or 'rich_text' not in body:
+        return [(notion_block, len(dumps(notion_block)))]
+    return _fit_rich_text(body, lambda group: {**notion_block, block_type: {**body, "rich_text": group}})
+
+def fit_block(notion_block: Dict) -> List[Dict]:
+    """제한을 넘는 블록을 같은 종류의 연속 블록들로 분할"""
+    return [fitted for fitted, _ in _fit_block_sized(notion_block)]
+
+def _pack_properties_sized(properties: Dict) -> Tuple[Dict, List[Tuple[Dict, int]], int]:
+    """pack_properties + 속성 전체의 직렬화 크기, 넘친 블록의 크기"""
+    packed, overflow, size = {}, [], 1  # 중괄호 2 - 마지막 구분자 1
+    for name, value in properties.items():
+        if not isinstance(value, dict) or 'rich_text' not in value:
+            packed[name] = value
+            value_size = len(dumps(value))
+        else:
+            groups = _fit_rich_text(value, lambda group: {**value, "rich_text": group})
+            packed[name], value_size = groups[0]
+            if len(groups) > 1:
+                overflow.extend(_fit_block_sized(
+                    block("heading_3", [{"type": "text", "text": {"content": f"{name} (continued)"}}])))
+                for fitted, _ in groups[1:]:
+                    overflow.extend(_fit_block_sized(block("paragraph", fitted['rich_text'])))
+        # "이름": 값,
+        size += len(dumps(name)) + 1 + value_size + 1
+    return packed, overflow, max(size, 2)
+
+def pack_properties(properties: Dict) -> Tuple[Dict, List[Dict]]:
+    """rich_text 속성을 제한에 맞추고 넘치는 내용은 본문 블록으로 옮김
+
+    Returns:
+        (제한에 맞춘 속성, 페이지 본문 앞에 붙일 블록 목록)
+    """
+    packed, overflow, _ = _pack_properties_sized(properties)
+    return packed, [notion_block for notion_block, _ in overflow]
+
+def pack_batches(blocks: List[Dict], first_budget: int = MAX_PAYLOAD_BYTES,
+                 sizes: Optional[List[int]] = None) -> List[List[Dict]]:
+    """블록을 요청 수가 최소가 되도록 순서대로 묶음 (요청당 100개, 본문 크기 제한)
+
+    제한이 모두 단조이므로 앞에서부터 가득 채우는 방식이 요청 수를 최소로 만든다.
+    첫 묶음은 pages.create에 속성과 함께 실리므로 first_budget 바이트만 사용한다.
+    sizes는 블록별 직렬화 크기 (이미 잰 값이 있으면 다시 직렬화하지 않음).
+    """
+    if sizes is None:
+        sizes = [len(dumps(notion_block)) for notion_block in blocks]
+    batches, current, size = [], [], 0
+    budget = first_budget
+    for notion_block, block_size in zip(blocks, sizes):
+        block_size += 1
+        # 첫 요청에 자리가 없으면 첫 묶음을 비워 두고 append로 넘김
+        overflows = size + block_size > budget and (current or budget < MAX_PAYLOAD_BYTES)
+        if len(current) >= MAX_BLOCKS_PER_REQUEST or overflows:
+            batches.append(current)
+            current, size, budget = [], 0, MAX_PAYLOAD_BYTES
+        current.append(notion_block)
+        size += block_size
+    if current or not batches:
+        batches.append(current)
+    return batches
+
+def _pack_page_sized(properties: Dict, children: Optional[List[Dict]] = None) -> Tuple[Dict, List[List[Dict]], int]:
+    """pack_page + 전송할 속성/블록의 직렬화 크기 합 (블록마다 한 번만 직렬화)"""
+    properties, overflow, properties_size = _pack_properties_sized(properties)
+    sized = overflow + [fitted for notion_block in children or [] for fitted in _fit_block_sized(notion_block)]
+    blocks = [notion_block for notion_block, _ in sized]
+    sizes = [size for _, size in sized]
+    # 부모/속성/키 이름 등 첫 요청에서 블록 외에 차지하는 크기
+    first_budget = MAX_PAYLOAD_BYTES - properties_size - 1_000
+    return properties, pack_batches(blocks, first_budget, sizes), properties_size + sum(sizes)
+
+def pack_page(properties: Dict, children: Optional[List[Dict]] = None) -> Tuple[Dict, List[List[Dict]]]:
+    """페이지 생성 요청을 제한에 맞게 구성
+
+    Returns:
+        (속성, 블록 묶음 목록) - 첫 묶음은 pages.create, 나머지는 blocks.children.append로 전송
+    """
+    properties, batches, _ = _pack_page_sized(properties, children)
+    return properties, batches
+
+def create_page(client, database_id: str, properties: Dict, children: Optional[List[Dict]] = None) -> Dict:
+    """내용을 잘라내지 않고 최소 요청 수로 Notion 페이지 생성"""
+    properties, batches, payload_bytes = _pack_page_sized(properties, children)
+    metrics.set('notion_blocks', sum(len(batch) for batch in batches))
+    metrics.set('notion_payload_bytes', payload_bytes)
+    metrics.incr('notion_requests', len(batches))
+    page = resilience.call(
+        client.pages.create,
+        parent={"database_id": database_id},
+        properties=properties,
+        children=batches[0],
+        endpoint='notion'
+    )
+    for batch in batches[1:]:
+        resilience.call(client.blocks.children.append, block_id=page['id'], children=batch, endpoint='notion')
+    return page
+
+async def create_page_async(client, database_id: str, properties: Dict,
+                            children: Optional[List[Dict]] = None) -> Dict:
+    """create_page의 비동기 버전 (client는 notion_client.AsyncClient)"""
+    properties, batches, payload_bytes = _pack_page_sized(properties, children)
+    metrics.set('notion_blocks', sum(len(batch) for batch in batches))
+    metrics.set('notion_payload_bytes', payload_bytes)
+    metrics.incr('notion_requests', len(batches))
+    page = await resilience.acall(
+        client.pages.create,
+        parent={"database_id": database_id},
+        properties=properties,
+        children=batches[0],
+        endpoint='notion'
+    )
+    # 블록 순서를 지키기 위해 append는 차례대로 전송
+    for batch in batches[1:]:
+        await resilience.acall(client.blocks.children.append, block_id=page['id'], children=batch,
+                               endpoint='notion')
+    return page
@@ -0,0 +1,48 @@
+import asyncio
+from typing import Awaitable, Callable, Optional, Sequence
+from common.metrics import metrics
+from common.log import get_logger
+
+logger = get_logger(__name__)
+
+async def overlap_writes(items: Sequence, source: str, key: Callable, prepare: Callable,
+                         write: Callable[..., Awaitable], max_pending: int = 4,
+                         stop: Optional[Callable[[int], bool]] = None) -> None:
+    """항목별 준비(수집/요약)는 순서대로 하나씩, 저장은 비동기로 겹쳐 실행
+
+    prepare(item)은 별도 스레드에서 실행되는 동기 함수로, 저장할 데이터(없으면 None)를 반환한다.
+    항목의 prepare가 끝나면 바로 다음 항목의 prepare를 시작하고, 그동안 write(데이터) 코루틴이
+    이벤트 루프에서 Notion 저장을 진행한다. 저장 대기 항목은 max_pending개로 제한한다.
+    각 항목은 metrics.item 구간 하나로 기록되며 저장 단계까지 포함한다.
+
+    Args:
+        key: 항목 -> 계측 키 (URL 등)
+        stop: 다음 항목을 시작하기 전 남은 항목 수로 확인, True면 중단 (예산 소진 등)
+    """
+    pending = set()
+
+    async def run(item, prepared: asyncio.Future):
+        try:
+            with metrics.item(source, key(item)):
+                try:
+                    # to_thread가 현재 컨텍스트를 복사하므로 prepare 안의 계측도 이 항목에 기록됨
+                    data = await asyncio.to_thread(prepare, item)
+                finally:
+                    prepared.set_result(None)
+                if data is not None:
+                    await write(data)
+        except Exception as e:
+            logger.error("항목 처리 실패 %s: %s", key(item), e)
+
+    loop = asyncio.get_running_loop()
+    for i, item in enumerate(items):
+        if stop is not None and stop(len(items) - i):
+            break
+        prepared = loop.create_future()
+        pending.add(asyncio.create_task(run(item, prepared)))
+        await prepared
+        pending = {task for task in pending if not task.done()}
+        if len(pending) >= max_pending:
+            _, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+    if pending:
+        await asyncio.wait(pending)
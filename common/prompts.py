@@ -0,0 +1,65 @@
+import json
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+from common.usage import estimate_tokens
+from common.log import get_logger
+
+logger = get_logger(__name__)
+
+class CompiledPrompt:
+    """청크 자리({text})를 제외한 부분을 미리 만들어 둔 프롬프트
+
+    시스템 프롬프트, 사용자 템플릿, 함수 스키마(JSON)와 각각의 토큰 수를 한 번만 계산해
+    보관하므로 청크마다 남는 작업은 청크 본문 토큰화뿐이다.
+    """
+
+    def __init__(self, template: str = '{text}', system: str = '', functions: Optional[List[Dict]] = None,
+                 count_tokens: Callable[[str], int] = estimate_tokens, prompt=None):
+        """
+        Args:
+            template: {text} 자리를 포함한 사용자 메시지 템플릿
+            system: 시스템 프롬프트
+            functions: function calling 스키마
+            count_tokens: 토큰 수 계산 함수 (모델별 토크나이저)
+            prompt: 같은 템플릿의 프레임워크 프롬프트 객체 (LangChain PromptTemplate 등)
+        """
+        self.template = template
+        self.system = system
+        self.functions = functions
+        self.functions_json = json.dumps(functions) if functions is not None else ''
+        self.prompt = prompt
+        self.system_tokens = count_tokens(system) if system else 0
+        self.template_tokens = count_tokens(template.replace('{text}', ''))
+        self.functions_tokens = count_tokens(self.functions_json) if self.functions_json else 0
+
+    @property
+    def fixed_tokens(self) -> int:
+        """청크를 제외한 요청 토큰 수"""
+        return self.system_tokens + self.template_tokens + self.functions_tokens
+
+    def format(self, text: str) -> str:
+        return self.template.replace('{text}', text)
+
+class PromptRegistry:
+    """(schema_type, content_type, language, model)별로 한 번만 만드는 프롬프트 저장소"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.entries: Dict[Tuple, CompiledPrompt] = {}
+
+    def get(self, key: Tuple, build: Callable[[], CompiledPrompt]) -> CompiledPrompt:
+        """key의 프롬프트 반환, 없으면 build()로 만들어 보관"""
+        compiled = self.entries.get(key)
+        if compiled is not None:
+            return compiled
+        with self._lock:
+            compiled = self.entries.get(key)
+            if compiled is None:
+                compiled = self.entries[key] = build()
+                logger.debug("프롬프트 생성 %s: 고정 %d 토큰 (시스템 %d, 템플릿 %d, 스키마 %d)", key,
+                             compiled.fixed_tokens, compiled.system_tokens, compiled.template_tokens,
+                             compiled.functions_tokens)
+        return compiled
+
+    def __len__(self) -> int:
+        return len(self.entries)
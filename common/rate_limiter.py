@@ -0,0 +1,90 @@
+import time
+import threading
+from typing import Callable, Optional
+from common.metrics import metrics
+from common.log import get_logger
+
+logger = get_logger(__name__)
+
+class RateLimiter:
+    """분당 요청 수(RPM)와 토큰 수(TPM)를 함께 지키는 프로세스 전역 호출 스케줄러
+
+    요청마다 예상 토큰 수(입력 + 최대 출력)를 미리 받아 두 개의 토큰 버킷에서 차감한다.
+    잔량이 부족하면 잔량을 음수로 예약해 두고 부족분이 다시 채워질 때까지 잠들기 때문에,
+    동시에 호출하는 스레드들이 도착 순서대로 간격을 두고 실행되어 429가 몰리지 않는다.
+    응답 후 reconcile()로 실제 사용량과의 차이를 보정한다.
+    """
+
+    def __init__(self, rpm: Optional[int] = None, tpm: Optional[int] = None, headroom: float = 0.9,
+                 clock: Callable[[], float] = time.monotonic, sleep: Callable[[float], None] = time.sleep):
+        """
+        Args:
+            rpm: 분당 최대 요청 수 (None이면 제한 없음)
+            tpm: 분당 최대 토큰 수 (None이면 제한 없음)
+            headroom: 계정 한도 대비 사용할 비율 (한도 바로 아래로 유지)
+            clock: 현재 시각 함수 (테스트용)
+            sleep: 대기 함수 (테스트용)
+        """
+        self._lock = threading.Lock()
+        self._clock = clock
+        self._sleep = sleep
+        self.configure(rpm, tpm, headroom)
+
+    def configure(self, rpm: Optional[int] = None, tpm: Optional[int] = None, headroom: float = 0.9) -> None:
+        """한도 설정 (버킷은 가득 찬 상태로 시작)"""
+        with self._lock:
+            self.rpm = rpm
+            self.tpm = tpm
+            self.request_capacity = rpm * headroom if rpm else None
+            self.token_capacity = tpm * headroom if tpm else None
+            self._requests = self.request_capacity or 0.0
+            self._tokens = self.token_capacity or 0.0
+            self._updated = self._clock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.request_capacity is not None or self.token_capacity is not None
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._updated = now
+        if self.request_capacity is not None:
+            self._requests = min(self.request_capacity, self._requests + elapsed * self.request_capacity / 60)
+        if self.token_capacity is not None:
+            self._tokens = min(self.token_capacity, self._tokens + elapsed * self.token_capacity / 60)
+
+    def acquire(self, tokens: int = 0) -> float:
+        """요청 한 건(예상 토큰 수 tokens)의 실행 시점까지 대기, 대기 시간(초) 반환"""
+        if not self.enabled:
+            return 0.0
+        with self._lock:
+            self._refill(self._clock())
+            wait = 0.0
+            if self.request_capacity is not None:
+                self._requests -= 1
+                if self._requests < 0:
+                    wait = max(wait, -self._requests * 60 / self.request_capacity)
+            if self.token_capacity is not None:
+                # 한도보다 큰 요청은 버킷이 가득 찼을 때 실행되도록 한도로 제한
+                self._tokens -= min(tokens, self.token_capacity)
+                if self._tokens < 0:
+                    wait = max(wait, -self._tokens * 60 / self.token_capacity)
+
+        if wait > 0:
+            metrics.incr('rate_limited')
+            metrics.observe_stage('rate_limit_wait', wait)
+            logger.debug("RPM/TPM 한도 대기: %.2fs (예상 %d 토큰)", wait, tokens)
+            self._sleep(wait)
+        return wait
+
+    def reconcile(self, estimated_tokens: int, actual_tokens: int) -> None:
+        """예상 토큰 수와 실제 사용량의 차이 보정"""
+        if self.token_capacity is None:
+            return
+        with self._lock:
+            self._refill(self._clock())
+            self._tokens = min(self.token_capacity,
+                               self._tokens + min(estimated_tokens, self.token_capacity) - actual_tokens)
+
+# 프로세스 전역 OpenAI 호출 스케줄러
+limiter = RateLimiter()
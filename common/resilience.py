@@ -0,0 +1,269 @@
+import time
+import random
+import asyncio
+import threading
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Optional
+from common.metrics import metrics
+from common.log import get_logger
+
+logger = get_logger(__name__)
+
+# 재시도할 HTTP 상태 코드 (요청 시간 초과, 충돌, 한도 초과, 서버 오류)
+RETRYABLE_STATUS = {408, 409, 425, 429, 500, 502, 503, 504}
+
+# 상태 코드 없이 발생하는 일시적 오류 (연결 끊김, 시간 초과)
+_TRANSIENT_ERRORS = [ConnectionError, TimeoutError]
+try:
+    import requests
+    _TRANSIENT_ERRORS += [requests.exceptions.ConnectionError, requests.exceptions.Timeout]
+except ImportError:
+    pass
+try:
+    import httpx
+    _TRANSIENT_ERRORS += [httpx.TransportError]
+except ImportError:
+    pass
+try:
+    import openai
+    _TRANSIENT_ERRORS += [openai.APIConnectionError]
+except ImportError:
+    pass
+try:
+    from notion_client.errors import RequestTimeoutError
+    _TRANSIENT_ERRORS += [RequestTimeoutError]
+except ImportError:
+    pass
+_TRANSIENT_ERRORS = tuple(_TRANSIENT_ERRORS)
+
+def _status_of(error: BaseException) -> Optional[int]:
+    """예외에서 HTTP 상태 코드 추출 (requests/openai/notion-client/googleapiclient)"""
+    for attr in ('status_code', 'status'):
+        status = getattr(error, attr, None)
+        if isinstance(status, int):
+            return status
+    for attr in ('response', 'resp'):
+        response = getattr(error, attr, None)
+        status = getattr(response, 'status_code', None) or getattr(response, 'status', None)
+        if isinstance(status, int):
+            return status
+    return None
+
+def _headers_of(error: BaseException):
+    headers = getattr(error, 'headers', None)
+    if headers is not None:
+        return headers
+    response = getattr(error, 'response', None)
+    if response is not None and getattr(response, 'headers', None) is not None:
+        return response.headers
+    # googleapiclient HttpError.resp는 헤더 사전
+    resp = getattr(error, 'resp', None)
+    return resp if isinstance(resp, dict) else None
+
+def is_retryable(error: BaseException) -> bool:
+    """일시적 오류인지 판단 (재시도해도 결과가 같은 4xx 오류는 제외)"""
+    if isinstance(error, CircuitOpenError):
+        return False
+    status = _status_of(error)
+    if status is not None:
+        return status in RETRYABLE_STATUS
+    if isinstance(error, _TRANSIENT_ERRORS):
+        return True
+    # 라이브러리가 HTTP 오류를 자체 예외로 감싼 경우 (youtube_transcript_api 등) 원인 확인
+    cause = error.__cause__ or error.__context__
+    return cause is not None and is_retryable(cause)
+
+def retry_after(error: BaseException) -> Optional[float]:
+    """예외의 응답 헤더에 Retry-After가 있으면 대기 시간(초)"""
+    return parse_retry_after(_headers_of(error))
+
+def parse_retry_after(headers) -> Optional[float]:
+    """Retry-After 헤더(초 또는 HTTP 날짜)가 지정한 대기 시간(초)"""
+    if not headers:
+        return None
+    value = headers.get('retry-after') or headers.get('Retry-After')
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+class CircuitOpenError(Exception):
+    """엔드포인트 차단기가 열려 있어 호출하지 않음"""
+
+class CircuitBreaker:
+    """엔드포인트별 차단기
+
+    연속 실패가 failure_threshold번 이어지면 열려서 reset_timeout초 동안 호출을 즉시 거부하고,
+    이후 한 번의 시험 호출(half-open)이 성공하면 다시 닫힌다. 장애가 난 서비스에 항목마다
+    재시도 대기를 반복하지 않고 빠르게 건너뛰기 위함이다.
+    """
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 60.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return 'closed'
+        if self._clock() - self.opened_at >= self.reset_timeout:
+            return 'half_open'
+        return 'open'
+
+    def allow(self) -> bool:
+        """호출 허용 여부 (half-open 상태에서는 시험 호출 하나만 허용)"""
+        with self._lock:
+            state = self.state
+            if state == 'closed':
+                return True
+            if state == 'half_open' and not self._trial:
+                self._trial = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self.opened_at is not None:
+                logger.info("차단기 닫힘: %s", self.name)
+            self.failures = 0
+            self.opened_at = None
+            self._trial = False
+
+    def release_trial(self) -> None:
+        """시험 호출 자리만 반납 (엔드포인트 상태를 알 수 없는 결과: 닫지도 다시 열지도 않음)"""
+        with self._lock:
+            self._trial = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self._trial or self.failures >= self.failure_threshold:
+                if self.opened_at is None or self._trial:
+                    metrics.incr('circuit_open')
+                    logger.warning("차단기 열림: %s (연속 실패 %d회, %.0fs 동안 호출 중단)",
+                                   self.name, self.failures, self.reset_timeout)
+                self.opened_at = self._clock()
+                self._trial = False
+
+class Resilience:
+    """외부 호출 재시도와 엔드포인트별 차단기
+
+    일시적 오류(연결 끊김, 시간 초과, 429, 5xx)는 full jitter 지수 백오프로 재시도하고,
+    Retry-After 헤더가 있으면 그만큼 기다린다. 재시도할 수 없는 오류나 마지막 시도의 오류는
+    그대로 전달하므로 호출부의 기존 예외 처리(로그 후 None 반환 등)가 그대로 동작한다.
+    """
+
+    def __init__(self, max_attempts: int = 4, base_delay: float = 1.0, max_delay: float = 30.0,
+                 failure_threshold: int = 5, reset_timeout: float = 60.0,
+                 sleep: Callable[[float], None] = time.sleep):
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self.configure(max_attempts, base_delay, max_delay, failure_threshold, reset_timeout)
+
+    def configure(self, max_attempts: int = 4, base_delay: float = 1.0, max_delay: float = 30.0,
+                  failure_threshold: int = 5, reset_timeout: float = 60.0) -> None:
+        """재시도/차단기 설정 (기존 차단기 초기화)
+
+        Args:
+            max_attempts: 최대 시도 횟수 (첫 시도 포함)
+            base_delay: 첫 재시도 대기 상한(초), 재시도마다 두 배
+            max_delay: 재시도 대기 상한(초), Retry-After도 이 값으로 제한
+            failure_threshold: 차단기가 열리는 연속 실패 횟수
+            reset_timeout: 차단기가 열려 있는 시간(초)
+        """
+        with self._lock:
+            self.max_attempts = max_attempts
+            self.base_delay = base_delay
+            self.max_delay = max_delay
+            self.failure_threshold = failure_threshold
+            self.reset_timeout = reset_timeout
+            self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def breaker(self, endpoint: str) -> CircuitBreaker:
+        """엔드포인트 차단기 반환 (없으면 생성)"""
+        with self._lock:
+            breaker = self._breakers.get(endpoint)
+            if breaker is None:
+                breaker = CircuitBreaker(endpoint, self.failure_threshold, self.reset_timeout)
+                self._breakers[endpoint] = breaker
+            return breaker
+
+    def delay(self, attempt: int, error: BaseException) -> float:
+        """attempt번째 실패 후 대기 시간 (Retry-After가 있으면 우선)"""
+        backoff = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+        hinted = retry_after(error)
+        if hinted is not None:
+            return min(self.max_delay, max(hinted, backoff))
+        return backoff
+
+    def call(self, func: Callable, *args, endpoint: str, attempts: Optional[int] = None, **kwargs):
+        """endpoint 차단기를 거쳐 func 호출, 일시적 오류는 재시도
+
+        Args:
+            endpoint: 차단기 이름 (서비스 또는 호스트)
+            attempts: 최대 시도 횟수 (기본값: max_attempts, 자체 재시도하는 SDK 호출은 1)
+        """
+        breaker = self.breaker(endpoint)
+        max_attempts = attempts or self.max_attempts
+        attempt = 0
+        while True:
+            if not breaker.allow():
+                raise CircuitOpenError(f"{endpoint} 차단기 열림, 호출 생략")
+            attempt += 1
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                self._sleep(self._backoff(breaker, endpoint, attempt, max_attempts, e))
+                continue
+            breaker.record_success()
+            return result
+
+    async def acall(self, func: Callable, *args, endpoint: str, attempts: Optional[int] = None, **kwargs):
+        """call의 비동기 버전 (func는 코루틴 함수, 대기 중에도 이벤트 루프를 막지 않음)"""
+        breaker = self.breaker(endpoint)
+        max_attempts = attempts or self.max_attempts
+        attempt = 0
+        while True:
+            if not breaker.allow():
+                raise CircuitOpenError(f"{endpoint} 차단기 열림, 호출 생략")
+            attempt += 1
+            try:
+                result = await func(*args, **kwargs)
+            except Exception as e:
+                await asyncio.sleep(self._backoff(breaker, endpoint, attempt, max_attempts, e))
+                continue
+            breaker.record_success()
+            return result
+
+    def _backoff(self, breaker: CircuitBreaker, endpoint: str, attempt: int, max_attempts: int,
+                 error: Exception) -> float:
+        """실패 기록 후 재시도 대기 시간 반환 (재시도하지 않을 오류면 그대로 전달)"""
+        if not is_retryable(error):
+            # 요청 자체의 문제(4xx, 로컬 예외 등)는 장애도 정상 응답도 아니므로 차단기 상태는 그대로
+            breaker.release_trial()
+            raise error
+        breaker.record_failure()
+        if attempt >= max_attempts:
+            metrics.incr('retries_exhausted')
+            raise error
+        wait = self.delay(attempt, error)
+        metrics.incr('retries')
+        logger.warning("%s 일시적 오류, %.1fs 후 재시도 (%d/%d): %s",
+                       endpoint, wait, attempt, max_attempts - 1, error)
+        return wait
+
+# 프로세스 전역 재시도/차단기
+resilience = Resilience()
@@ -0,0 +1,163 @@
+import re
+import math
+import zlib
+from bisect import bisect_left
+from typing import Callable, Dict, List, Optional
+
+class SentenceSegmenter:
+    """문장 부호가 거의 없는 한국어/CJK 자막까지 처리하는 문장 분리기
+
+    문장 부호, 한국어 종결 어미(~다/~요/~죠 등), 줄바꿈(자막 휴지)을 하나의
+    컴파일된 정규식으로 표현하여 텍스트를 한 번만 훑으며 문장 경계를 찾는다.
+    분리된 문장은 최대 길이 안에서 청크 길이가 고르도록 묶는다.
+    """
+
+    # 받침이 ㅂ인 한글 음절 (습/합/입/됩 등): '-ㅂ니까'만 의문형 종결 어미이고
+    # 그 밖의 '-니까'(비가 오니까)는 연결 어미이므로 구분에 사용
+    _B_FINAL_SYLLABLES = ''.join(chr(code) for code in range(0xAC00, 0xD7A4) if (code - 0xAC00) % 28 == 17)
+
+    # 문장 끝으로 볼 한국어 종결 어미 (조사/연결 어미와 겹치지 않는 형태만 사용)
+    KOREAN_ENDINGS = (
+        rf'니다|[{_B_FINAL_SYLLABLES}]니까|[었았였했겠한된는인]다|[이있없같]다'
+        r'|[어아여해에예네지군걸데래까세게나가]요|죠'
+    )
+
+    BOUNDARY_PATTERN = re.compile(
+        r'\s*\n\s*'                                             # 줄바꿈 (자막 휴지 포함)
+        r'|[。！？]+[」』”’)\]]*\s*'                             # CJK 문장 부호 (공백 없이도 경계)
+        rf'|(?:[.!?]+|(?:{KOREAN_ENDINGS})[.!?~]*)["\'”’)\]]*\s+'  # 문장 부호 또는 종결 어미 + 공백
+    )
+
+    def __init__(self, pause_seconds: float = 0.5):
+        """
+        Args:
+            pause_seconds: 문장 경계로 볼 자막 구간 사이 최소 공백 시간(초)
+        """
+        self.pause_seconds = pause_seconds
+
+    def join_segments(self, segments: List[Dict]) -> str:
+        """자막 구간을 이어붙이되, 휴지가 긴 구간 사이는 줄바꿈으로 구분"""
+        parts = []
+        prev_end = None
+        for segment in segments:
+            text = ' '.join(segment.get('text', '').split())
+            if not text:
+                continue
+            start = segment.get('start')
+            if parts:
+                gap = start - prev_end if start is not None and prev_end is not None else 0
+                parts.append('\n' if gap >= self.pause_seconds else ' ')
+            parts.append(text)
+            prev_end = start + segment.get('duration', 0) if start is not None else None
+        return ''.join(parts)
+
+    def split(self, text: str) -> List[str]:
+        """문장 단위 분리"""
+        sentences = []
+        start = 0
+        for match in self.BOUNDARY_PATTERN.finditer(text):
+            sentence = text[start:match.end()].strip()
+            if sentence:
+                sentences.append(sentence)
+            start = match.end()
+        tail = text[start:].strip()
+        if tail:
+            sentences.append(tail)
+        return sentences
+
+    def split_long(self, sentence: str, max_length: int,
+                   length_function: Callable[[str], int] = len) -> List[str]:
+        """최대 길이를 넘는 문장을 단어 경계(공백이 없는 CJK는 글자)에서 분할"""
+        if length_function(sentence) <= max_length:
+            return [sentence]
+        pieces = self._pack_words(sentence.split(), ' ', max_length, length_function)
+        result = []
+        for piece in pieces:
+            if length_function(piece) > max_length:
+                # 공백 없이 이어진 CJK 텍스트나 긴 단어는 글자 단위로 분할
+                result.extend(self._pack_words(list(piece), '', max_length, length_function))
+            else:
+                result.append(piece)
+        return result
+
+    @staticmethod
+    def _pack_words(words: List[str], joiner: str, max_length: int,
+                    length_function: Callable[[str], int]) -> List[str]:
+        pieces, current = [], []
+        for word in words:
+            if current and length_function(joiner.join(current + [word])) > max_length:
+                pieces.append(joiner.join(current))
+                current = [word]
+            else:
+                current.append(word)
+        if current:
+            pieces.append(joiner.join(current))
+        return pieces
+
+    def chunk(self, text: str, max_length: int, length_function: Callable[[str], int] = len) -> List[str]:
+        """문장 경계를 유지하며 길이가 고른 청크로 분할"""
+        sentences = []
+        for sentence in self.split(text):
+            sentences.extend(self.split_long(sentence, max_length, length_function))
+        if not sentences:
+            return []
+
+        # 문장 사이 구분자(공백) 1을 포함한 누적 길이
+        cumlen = [0]
+        for sentence in sentences:
+            cumlen.append(cumlen[-1] + length_function(sentence) + 1)
+        total = cumlen[-1]
+
+        # 길이 제한을 지키는 최소 청크 수부터 시작하여 분할 지점이 모두 제한을 지킬 때까지 증가
+        # (내용 기준 경계는 각 청크가 제한 안에 머무는 범위에서만 고르고, 그래도 넘으면 균등 분할)
+        n_chunks = max(1, math.ceil(total / (max_length + 1)))
+        found = False
+        while n_chunks < len(sentences) and not found:
+            for anchors in (sentences, None):
+                cuts = self._balanced_cuts(cumlen, n_chunks, anchors, max_length)
+                if all(cumlen[end] - cumlen[start] - 1 <= max_length for start, end in zip(cuts, cuts[1:])):
+                    found = True
+                    break
+            else:
+                n_chunks += 1
+        if not found:
+            cuts = list(range(len(sentences) + 1))
+        return [' '.join(sentences[start:end]) for start, end in zip(cuts, cuts[1:])]
+
+    # 내용 기준 경계를 찾는 범위 (평균 청크 길이 대비 목표 지점 앞뒤 비율)
+    ANCHOR_SLACK = 0.1
+
+    @classmethod
+    def _balanced_cuts(cls, cumlen: List[int], n_chunks: int, sentences: Optional[List[str]] = None,
+                       max_length: Optional[int] = None) -> List[int]:
+        """누적 길이에서 total * j / n 에 가까운 문장 경계 선택
+
+        sentences를 주면 목표 지점 주변 범위에서 경계 앞 문장의 해시가 가장 작은 경계를 고른다.
+        경계가 위치가 아닌 내용으로 정해지므로 자막/기사 일부가 바뀌어도 바뀐 곳 밖의 청크는
+        그대로 유지되어 청크 요약 캐시를 재사용할 수 있다. max_length를 주면 현재 청크와 남은
+        청크들이 길이 제한 안에 들어가는 경계만 후보로 삼는다.
+        """
+        n = len(cumlen) - 1
+        total = cumlen[-1]
+        slack = total / n_chunks * cls.ANCHOR_SLACK
+        cuts = [0]
+        for j in range(1, n_chunks):
+            target = total * j / n_chunks
+            idx = bisect_left(cumlen, target)
+            if idx > 0 and target - cumlen[idx - 1] < cumlen[min(idx, n)] - target:
+                idx -= 1
+            if sentences is not None:
+                lo, hi = bisect_left(cumlen, target - slack), bisect_left(cumlen, target + slack + 1)
+                candidates = range(max(lo, 1), min(hi, n))
+                if max_length is not None:
+                    limit = max_length + 1
+                    candidates = [b for b in candidates if cumlen[b] - cumlen[cuts[-1]] <= limit
+                                  and total - cumlen[b] <= (n_chunks - j) * limit]
+                if candidates:
+                    idx = min(candidates, key=lambda b: (zlib.crc32(sentences[b - 1].encode('utf-8')),
+                                                         abs(cumlen[b] - target)))
+            # 빈 청크가 생기지 않도록 경계 위치 보정
+            idx = min(max(idx, cuts[-1] + 1), n - (n_chunks - j))
+            cuts.append(idx)
+        cuts.append(n)
+        return cuts
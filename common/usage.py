@@ -0,0 +1,187 @@
+import threading
+from typing import Dict, Optional, Tuple
+from common.metrics import metrics
+from common.log import get_logger
+
+logger = get_logger(__name__)
+
+# 모델별 100만 토큰당 가격 (USD, 입력/출력)
+MODEL_PRICES: Dict[str, Tuple[float, float]] = {
+    'gpt-3.5-turbo': (0.50, 1.50),
+    'gpt-4o-mini': (0.15, 0.60),
+    'gpt-4o': (2.50, 10.00),
+    'gpt-4-turbo': (10.00, 30.00),
+    'gpt-4': (30.00, 60.00),
+}
+
+# Batch API 요청은 동기 요청 단가의 절반
+BATCH_DISCOUNT = 0.5
+
+# 프롬프트 캐시에서 처리된 입력 토큰은 입력 단가의 절반 (앞부분 1024 토큰 이상이 같은 요청)
+CACHED_INPUT_DISCOUNT = 0.5
+
+# 모델별 컨텍스트 길이 (토큰)
+CONTEXT_WINDOWS: Dict[str, int] = {
+    'gpt-3.5-turbo': 16385,
+    'gpt-4o-mini': 128000,
+    'gpt-4o': 128000,
+    'gpt-4-turbo': 128000,
+    'gpt-4': 8192,
+}
+
+def _lookup(table: Dict, model: str):
+    """모델 이름 접두사로 조회 (예: gpt-4o-mini-2024-07-18 -> gpt-4o-mini)"""
+    model = model or ''
+    for name in sorted(table, key=len, reverse=True):
+        if model.startswith(name):
+            return table[name]
+    return None
+
+def context_window(model: str) -> Optional[int]:
+    return _lookup(CONTEXT_WINDOWS, model)
+
+def cached_tokens(usage) -> int:
+    """응답 usage(SDK 객체 또는 dict)에서 프롬프트 캐시로 처리된 입력 토큰 수"""
+    if usage is None:
+        return 0
+    details = usage.get('prompt_tokens_details') if isinstance(usage, dict) else getattr(usage, 'prompt_tokens_details', None)
+    if details is None:
+        return 0
+    value = details.get('cached_tokens') if isinstance(details, dict) else getattr(details, 'cached_tokens', None)
+    return value or 0
+
+def estimate_tokens(text: str) -> int:
+    """토큰 수 추정 (UTF-8 3바이트 ≈ 1토큰: 한글은 1글자 ≈ 1토큰, 영문은 다소 과대 추정)"""
+    return len(text.encode('utf-8')) // 3 + 1
+
+class BudgetExceeded(Exception):
+    """실행 예산(비용/토큰) 초과"""
+
+class UsageLedger:
+    """OpenAI 사용량(토큰/비용) 장부와 실행 예산
+
+    LLM 호출마다 response.usage를 기록하여 실행 전체, 소스별, 항목별로 집계한다.
+    항목은 metrics.item() 구간의 (source, key)를 사용한다. max_cost/max_tokens가
+    설정되면 allows()로 호출 전 예상 사용량이 남은 예산 안에 드는지 확인할 수 있다.
+    """
+
+    def __init__(self, max_cost: Optional[float] = None, max_tokens: Optional[int] = None):
+        self._lock = threading.Lock()
+        self._unpriced = set()
+        self.configure(max_cost, max_tokens)
+        self.reset()
+
+    def configure(self, max_cost: Optional[float] = None, max_tokens: Optional[int] = None) -> None:
+        """실행 예산 설정 (None이면 제한 없음)"""
+        self.max_cost = max_cost
+        self.max_tokens = max_tokens
+
+    def reset(self) -> None:
+        with self._lock:
+            self.total = self._empty()
+            self.by_source: Dict[str, Dict] = {}
+            self.by_item: Dict[Tuple[str, str], Dict] = {}
+            self.by_model: Dict[str, Dict] = {}
+
+    @staticmethod
+    def _empty() -> Dict:
+        return {'calls': 0, 'prompt_tokens': 0, 'cached_tokens': 0, 'completion_tokens': 0, 'cost': 0.0}
+
+    def cost(self, model: str, prompt_tokens: int, completion_tokens: int, batch: bool = False,
+             cached_tokens: int = 0) -> float:
+        """토큰 수를 비용(USD)으로 환산 (가격을 모르는 모델은 0)
+
+        cached_tokens는 prompt_tokens 중 프롬프트 캐시로 처리된 토큰 수이다.
+        """
+        price = _lookup(MODEL_PRICES, model)
+        if price is None:
+            if model not in self._unpriced:
+                self._unpriced.add(model)
+                logger.warning("가격 정보가 없는 모델: %s (비용 0으로 집계)", model)
+            return 0.0
+        input_tokens = prompt_tokens - cached_tokens + cached_tokens * CACHED_INPUT_DISCOUNT
+        cost = (input_tokens * price[0] + completion_tokens * price[1]) / 1_000_000
+        return cost * BATCH_DISCOUNT if batch else cost
+
+    def record(self, model: str, prompt_tokens: int, completion_tokens: int, batch: bool = False,
+               cached_tokens: int = 0) -> float:
+        """LLM 호출 한 번의 사용량 기록, 비용 반환"""
+        prompt_tokens = prompt_tokens or 0
+        completion_tokens = completion_tokens or 0
+        cached_tokens = cached_tokens or 0
+        cost = self.cost(model, prompt_tokens, completion_tokens, batch, cached_tokens)
+
+        item = metrics.current_item()
+        buckets = [('total', None), ('by_model', model or 'unknown')]
+        if item is not None:
+            buckets += [('by_source', item['source']), ('by_item', (item['source'], item['key']))]
+        with self._lock:
+            for attr, key in buckets:
+                if key is None:
+                    entry = self.total
+                else:
+                    entry = getattr(self, attr).setdefault(key, self._empty())
+                entry['calls'] += 1
+                entry['prompt_tokens'] += prompt_tokens
+                entry['cached_tokens'] += cached_tokens
+                entry['completion_tokens'] += completion_tokens
+                entry['cost'] += cost
+        metrics.incr('cost_usd', cost)
+        return cost
+
+    # ------------------------------------------------------------------
+    # 예산
+    # ------------------------------------------------------------------
+    @property
+    def tokens_used(self) -> int:
+        return self.total['prompt_tokens'] + self.total['completion_tokens']
+
+    def remaining_cost(self) -> Optional[float]:
+        return None if self.max_cost is None else self.max_cost - self.total['cost']
+
+    def remaining_tokens(self) -> Optional[int]:
+        return None if self.max_tokens is None else self.max_tokens - self.tokens_used
+
+    @property
+    def limited(self) -> bool:
+        return self.max_cost is not None or self.max_tokens is not None
+
+    def exceeded(self) -> bool:
+        """예산 소진 여부"""
+        remaining_cost = self.remaining_cost()
+        remaining_tokens = self.remaining_tokens()
+        return ((remaining_cost is not None and remaining_cost <= 0)
+                or (remaining_tokens is not None and remaining_tokens <= 0))
+
+    def allows(self, model: str, prompt_tokens: int, completion_tokens: int, batch: bool = False) -> bool:
+        """예상 사용량이 남은 예산 안에 드는지 확인"""
+        remaining_cost = self.remaining_cost()
+        if remaining_cost is not None and self.cost(model, prompt_tokens, completion_tokens, batch) > remaining_cost:
+            return False
+        remaining_tokens = self.remaining_tokens()
+        if remaining_tokens is not None and prompt_tokens + completion_tokens > remaining_tokens:
+            return False
+        return True
+
+    def report(self) -> str:
+        """실행 전체 및 소스/모델별 사용량 요약"""
+        with self._lock:
+            t = self.total
+            lines = ["=== OpenAI 사용량 ===",
+                     f"전체: {t['calls']}회, 입력 {t['prompt_tokens']} / 출력 {t['completion_tokens']} 토큰, "
+                     f"${t['cost']:.4f}"]
+            if t['prompt_tokens']:
+                lines.append(f"프롬프트 캐시: 입력 {t['cached_tokens']} 토큰 "
+                             f"({t['cached_tokens'] / t['prompt_tokens']:.1%})")
+            for label, table in (('소스', self.by_source), ('모델', self.by_model)):
+                for name, u in sorted(table.items()):
+                    lines.append(f"{label} {name}: {u['calls']}회, "
+                                 f"{u['prompt_tokens'] + u['completion_tokens']} 토큰, ${u['cost']:.4f}")
+            if self.max_cost is not None:
+                lines.append(f"비용 예산: ${t['cost']:.4f} / ${self.max_cost:.4f}")
+            if self.max_tokens is not None:
+                lines.append(f"토큰 예산: {self.tokens_used} / {self.max_tokens}")
+        return '\n'.join(lines)
+
+# 프로세스 전역 사용량 장부
+ledger = UsageLedger()
@@ -2,6 +2,7 @@ import os
 from dotenv import load_dotenv
 from typing import Dict, List, Tuple
 from pathlib import Path
+from datetime import datetime
 
 class Config:
     def __init__(self):
@@ -23,6 +24,11 @@ class Config:
         # Initialize settings
         self._init_summary_settings()
         self._init_llm_settings()
+        self._init_metrics_settings()
+        self._init_logging_settings()
+        self._init_resilience_settings()
+        self._init_notion_settings()
+        self._init_output_settings()
         
         # Initialize schema
         self._initialize_schema()
@@ -35,8 +41,15 @@ class Config:
         self.YOUTUBE_API_KEY = os.getenv("YOUTUBE_API_KEY")
         self.DIFFBOT_API_TOKEN = os.getenv("DIFFBOT_API_TOKEN")
         self.RAINDROP_TOKEN = os.getenv("RAINDROP_TOKEN")
+        self.POCKET_CONSUMER_KEY = os.getenv("POCKET_CONSUMER_KEY")
         self.POCKET_ACCESS_TOKEN = os.getenv("POCKET_ACCESS_TOKEN")
         
+        # API Endpoints (로컬 테스트 서버 등으로 교체 가능, OpenAI는 OPENAI_BASE_URL 사용)
+        self.NOTION_BASE_URL = os.getenv("NOTION_BASE_URL", "https://api.notion.com")
+        self.POCKET_BASE_URL = os.getenv("POCKET_BASE_URL", "https://getpocket.com/v3")
+        self.RAINDROP_BASE_URL = os.getenv("RAINDROP_BASE_URL", "https://api.raindrop.io/rest/v1")
+        self.YOUTUBE_API_ENDPOINT = os.getenv("YOUTUBE_API_ENDPOINT")
+        
         # Notion Database IDs
         self.NOTION_DATABASE_ID = os.getenv("NOTION_DATABASE_ID")
         self.NOTION_DB_YOUTUBE_CH_ID = os.getenv("NOTION_DB_YOUTUBE_CH_ID")
@@ -49,6 +62,10 @@ class Config:
         self.INCLUDE_FULL_TEXT = False
         self.ENABLE_CHAPTERS = True
         self.OUTPUT_LANGUAGE = 'ko'
+        
+        # 유사 중복 콘텐츠는 기존 요약 재사용 (유사도 = 1 - SimHash 해밍 거리/64)
+        self.ENABLE_DEDUP = True
+        self.DEDUP_THRESHOLD = 0.9
     
     def _init_llm_settings(self):
         """LLM 관련 설정 초기화"""
@@ -58,6 +75,64 @@ class Config:
         self.max_token_response = 500
         self.min_token_response = 100
         
+        # 실행 예산 (None이면 제한 없음), 부족하면 FALLBACK_MODEL/stuff 체인으로 전환
+        self.MAX_COST = None  # USD
+        self.MAX_TOKENS = None
+        self.FALLBACK_MODEL = 'gpt-4o-mini'
+        
+        # 계정 분당 한도 (None이면 제한 없음), 모든 OpenAI 호출이 한도의 RATE_LIMIT_HEADROOM 비율 아래로 공유
+        self.OPENAI_RPM = int(os.getenv("OPENAI_RPM")) if os.getenv("OPENAI_RPM") else None
+        self.OPENAI_TPM = int(os.getenv("OPENAI_TPM")) if os.getenv("OPENAI_TPM") else None
+        self.RATE_LIMIT_HEADROOM = 0.9
+        
+        # Batch API 모드 (북마크 백필용): map 단계 요청을 배치로 제출하여 토큰 단가 절반
+        self.ENABLE_BATCH = False
+        self.BATCH_DIR = self.result_path / 'batches'
+        self.BATCH_POLL_INTERVAL = 30  # 초
+        self.BATCH_TIMEOUT = None  # 초, None이면 completion_window(24h)까지 대기
+        
+        # 청크 요약 캐시 (None이면 실행 중 메모리에만 보관): 내용이 바뀐 청크만 다시 map
+        self.CHUNK_CACHE_PATH = self.save_path / 'chunk_cache.jsonl'
+        
+    def _init_metrics_settings(self):
+        """계측 관련 설정 초기화"""
+        # 항목별 단계 시간/토큰 수를 JSONL로 기록, 포트 지정 시 Prometheus 텍스트 엔드포인트 제공
+        self.ENABLE_METRICS = True
+        self.METRICS_PATH = self.result_path / f"metrics_{datetime.now():%Y%m%d_%H%M%S}.jsonl"
+        self.METRICS_PORT = None
+        self.METRICS_HOST = '127.0.0.1'  # 외부 수집기에서 접근하려면 '0.0.0.0'
+        
+    def _init_logging_settings(self):
+        """로깅 관련 설정 초기화"""
+        # 청크별 미리보기 등 반복 DEBUG 로그는 처음 LOG_SAMPLE_FIRST개 이후 LOG_SAMPLE_EVERY개마다 출력
+        self.LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+        self.LOG_PATH = os.getenv("LOG_PATH")
+        self.LOG_SAMPLE_FIRST = 3
+        self.LOG_SAMPLE_EVERY = 100
+        
+    def _init_resilience_settings(self):
+        """외부 호출 재시도/차단기 설정 초기화"""
+        # 일시적 오류(연결 끊김, 429, 5xx)는 지수 백오프(full jitter)로 재시도, Retry-After 우선
+        self.REQUEST_TIMEOUT = 30  # 초
+        self.RETRY_MAX_ATTEMPTS = 4
+        self.RETRY_BASE_DELAY = 1.0  # 초
+        self.RETRY_MAX_DELAY = 30.0  # 초
+        # 엔드포인트별 연속 실패가 임계값에 이르면 CIRCUIT_RESET_TIMEOUT초 동안 호출 중단
+        self.CIRCUIT_FAILURE_THRESHOLD = 5
+        self.CIRCUIT_RESET_TIMEOUT = 60.0  # 초
+        
+    def _init_notion_settings(self):
+        """Notion 저장 관련 설정 초기화"""
+        # 저장은 AsyncClient로 다음 항목 요약과 겹쳐 실행, 저장 대기 항목 수 제한
+        self.NOTION_MAX_PENDING_WRITES = 4
+        
+    def _init_output_settings(self):
+        """요약 저장 대상 설정 초기화"""
+        # notion, jsonl, parquet(pyarrow 필요), sqlite 중 선택, 여러 개면 모두 기록
+        self.SINKS = ['notion']
+        self.SINK_DIR = self.result_path / 'sinks'
+        self.SINK_BATCH_SIZE = 1000  # 로컬 싱크는 이만큼 모아서 한 번에 기록
+        
     def _initialize_schema(self):
         """요약 스키마 초기화"""
         schemas = self.create_schema()
@@ -8,6 +8,7 @@ class Config:
     def __init__(self):
         # 기본 설정값
         self.INCLUDE_KEYWORDS = True
+        self.HIGHLIGHT_KEYWORDS = True  # 요약 본문에서 키워드 강조
         self.INCLUDE_FULL_TEXT = False
         self.ENABLE_CHAPTERS = True
         
@@ -47,6 +48,26 @@ class Config:
         self.max_token_response = 500
         self.min_token_response = 100
         self.TEMPERATURE = 0.2
+        # 응답을 스트리밍으로 받아 필드 단위로 파싱, 스키마에 맞지 않는 필드만 다시 요청하는 횟수
+        self.STREAM_RESPONSES = True
+        self.JSON_FIELD_RETRIES = 1
+        # 실행 예산 (None이면 제한 없음), 부족하면 FALLBACK_MODEL로 전환
+        self.MAX_COST = None  # USD
+        self.MAX_TOKENS = None
+        self.FALLBACK_MODEL = 'gpt-4o-mini'
+        # 계정 분당 한도 (None이면 제한 없음)
+        self.OPENAI_RPM = int(os.getenv("OPENAI_RPM")) if os.getenv("OPENAI_RPM") else None
+        self.OPENAI_TPM = int(os.getenv("OPENAI_TPM")) if os.getenv("OPENAI_TPM") else None
+        self.RATE_LIMIT_HEADROOM = 0.9
+        # 청크 요약 캐시 (None이면 메모리에만 보관): 내용이 바뀐 청크만 다시 요약
+        self.CHUNK_CACHE_PATH = os.path.join(self.save_path, 'chunk_cache.jsonl')
+        # 외부 호출 재시도/차단기
+        self.REQUEST_TIMEOUT = 30  # 초
+        self.RETRY_MAX_ATTEMPTS = 4
+        self.RETRY_BASE_DELAY = 1.0  # 초
+        self.RETRY_MAX_DELAY = 30.0  # 초
+        self.CIRCUIT_FAILURE_THRESHOLD = 5
+        self.CIRCUIT_RESET_TIMEOUT = 60.0  # 초
         self.system_content = """You are a helpful assistant that creates summaries in JSON format. Follow these rules strictly: 
             Use clear language.
             Avoid redundancy while keeping key details.
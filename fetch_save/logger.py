@@ -1,159 +1,96 @@
-from notion_client import Client
+from notion_client import Client, AsyncClient
 import requests
 from datetime import datetime
 import re
 from typing import List, Dict, Optional
 import time
 import random   
+from common.metrics import metrics
+from common.highlight import KeywordHighlighter
+from common.notion_blocks import build_summary_blocks, block, plain_text, TABLE_OF_CONTENTS
+from common.notion_payload import create_page, create_page_async, text_property
+from common.log import get_logger
+
+logger = get_logger('fetch_save.logger')
 
 class NotionBase:
     def __init__(self, config, verbose=False, quiet=False):
         self.config = config
         self.client = Client(auth=self.config.NOTION_TOKEN)
+        self._async_client = None
         self.database_id = self.config.NOTION_DATABASE_ID
         self.keywords = []
         self.verbose = verbose
         self.quiet = quiet
+        self._highlighter = None
+        self._highlighter_key = None
 
     def change_id(self, id):
         self.database_id = id
 
+    @property
+    def async_client(self) -> AsyncClient:
+        """비동기 클라이언트 (처음 사용할 때 생성)"""
+        if self._async_client is None:
+            self._async_client = AsyncClient(auth=self.config.NOTION_TOKEN)
+        return self._async_client
+
+    async def aclose(self):
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+
     def save_to_notion(self, data, properties, children=None):
         try:
-            self.client.pages.create(
-                parent={"database_id": self.database_id},
-                properties=properties,
-                children=children or []
-            )
-            print(f"Summary for '{data['title']}' has been saved to Notion.\n")
+            # 긴 속성/블록은 잘라내지 않고 나눠서 최소 요청 수로 전송
+            with metrics.stage('notion_write'):
+                create_page(self.client, self.database_id, properties, children)
+            logger.info("Summary for '%s' has been saved to Notion.", data['title'])
         except Exception as e:
-            print(f"Error saving to Notion: {e}")
+            metrics.incr('notion_errors')
+            logger.error("Error saving to Notion: %s", e)
+
+    async def save_to_notion_async(self, data, properties, children=None):
+        """save_to_notion의 비동기 버전 (AsyncClient 사용)"""
+        try:
+            with metrics.stage('notion_write'):
+                await create_page_async(self.async_client, self.database_id, properties, children)
+            logger.info("Summary for '%s' has been saved to Notion.", data['title'])
+        except Exception as e:
+            metrics.incr('notion_errors')
+            logger.error("Error saving to Notion: %s", e)
     # organize_summary 메소드 수정
     def create_text_block(self, content: str, block_type: str = "paragraph", keywords: List[str] = None) -> Dict:
         """키워드 강조가 포함된 텍스트 블록을 생성합니다."""
-        if keywords:
-            rich_text = self.highlight_keywords(content, keywords)
-        else:
-            rich_text = [{"type": "text", "text": {"content": content}}]
-        
-        return {
-            "object": "block",
-            "type": block_type,
-            block_type: {
-                "rich_text": rich_text
-            }
-        }
+        rich_text = self.highlight_keywords(content, keywords) if keywords else plain_text(content)
+        return block(block_type, rich_text)
 
     def create_bulleted_list_item(self, content: str, keywords: List[str] = None) -> Dict:
         """키워드 강조가 포함된 글머리 기호 항목을 생성합니다."""
-        if keywords:
-            rich_text = self.highlight_keywords(content, keywords)
-        else:
-            rich_text = [{"type": "text", "text": {"content": content}}]
-        
-        return {
-            "object": "block",
-            "type": "bulleted_list_item",
-            "bulleted_list_item": {
-                "rich_text": rich_text
-            }
-        }
+        rich_text = self.highlight_keywords(content, keywords) if keywords else plain_text(content)
+        return block("bulleted_list_item", rich_text)
 
     def organize_summary(self, data, heading='Section summary', contents='summary'):
-        children = [
-            {"object": "block", "type": "table_of_contents", "table_of_contents": {}},
-        ]
-        
+        summary = data.get('summary', {})
         try:
-            if 'thumbnail' in data:
-                children.append({
-                    "object": "block",
-                    "type": "image",
-                    "image": {
-                        "type": "external",
-                        "external": {"url": data['thumbnail']}
-                    }
-                })
-
-            summary = data.get('summary', {})
             keywords = []
-            if self.config.INCLUDE_KEYWORDS and self.config.HIGHLIGHT_KEYWORDS:
-                keywords = summary.get('keywords', [])  # keywords_original 사용
-
-            if isinstance(summary, dict):
-                chapters = summary.get('chapters', []) if self.config.ENABLE_CHAPTERS else []
-                
-                if 'sections' in summary:
-                    children.append(self.create_text_block("Detailed Section Summaries", "heading_1"))
-                    
-                    # 챕터 정보가 있는 경우
-                    if chapters:
-                        current_chapter_idx = 0
-                        current_chapter = chapters[current_chapter_idx]
-                        
-                        for i, segment in enumerate(summary['sections']):
-                            # 새로운 챕터의 시작인지 확인
-                            while (current_chapter_idx < len(chapters) and 
-                                   i >= current_chapter['section_indices']['end']):
-                                current_chapter_idx += 1
-                                if current_chapter_idx < len(chapters):
-                                    current_chapter = chapters[current_chapter_idx]
-                            
-                            # 현재 섹션이 새로운 챕터의 시작이면 챕터 제목 추가
-                            if current_chapter_idx < len(chapters) and \
-                               i == current_chapter['section_indices']['start']:
-                                children.append(self.create_text_block(
-                                    f"{current_chapter_idx + 1}. {current_chapter['chapter_title']}",
-                                    "heading_1"
-                                ))
-                            
-                            # 섹션 추가
-                            if isinstance(segment, dict):
-                                # 섹션 제목
-                                children.append(self.create_text_block(
-                                    f'{i+1}. {segment.get("title", "")}',
-                                    "heading_2",
-                                    keywords if keywords else None
-                                ))
-                                
-                                # 섹션 내용
-                                summary_content = segment.get('summary', [])
-                                if isinstance(summary_content, list):
-                                    for item in summary_content:
-                                        children.append(self.create_bulleted_list_item(
-                                            item,
-                                            keywords if keywords else None
-                                        ))
-                                
-                                children.append(self.create_text_block(""))  # 빈 줄
-                    else:
-                        # 챕터가 없는 경우의 처리
-                        for i, segment in enumerate(summary['sections']):
-                            if isinstance(segment, dict):
-                                children.append(self.create_text_block(
-                                    f'{i+1}. {segment.get("title", "")}',
-                                    "heading_2",
-                                    keywords if keywords else None
-                                ))
-                                
-                                summary_content = segment.get('summary', [])
-                                if isinstance(summary_content, list):
-                                    for item in summary_content:
-                                        children.append(self.create_bulleted_list_item(
-                                            item,
-                                            keywords if keywords else None
-                                        ))
-                                
-                                children.append(self.create_text_block(""))  # 빈 줄
-
+            if self.config.INCLUDE_KEYWORDS and self.config.HIGHLIGHT_KEYWORDS and isinstance(summary, dict):
+                # keywords는 {'term', 'count'} 목록이므로 용어만 사용
+                keywords = summary.get('keywords_original') or [
+                    keyword['term'] if isinstance(keyword, dict) else keyword
+                    for keyword in summary.get('keywords', [])
+                ]
+            chapters = summary.get('chapters', []) if self.config.ENABLE_CHAPTERS and isinstance(summary, dict) else []
+            
+            # 강조 정규식은 요약당 한 번만 만들고 섹션은 한 번만 순회
+            highlight = (lambda text: self.highlight_keywords(text, keywords)) if keywords else plain_text
+            return build_summary_blocks(summary, highlight, chapters, data.get('thumbnail'))
         except Exception as e:
-            print(f'Error organizing summary: {e}')
-        
-        return children
+            logger.exception("Error organizing summary: %s", e)
+            return [TABLE_OF_CONTENTS]
 
     def common_properties(self, data):
-        playlist = data.get('playlist', '')
-        print(playlist)
+        logger.debug("Playlist: %s", data.get('playlist', ''))
         properties = {
             "Title": {"title": [{"text": {"content": data.get('title', '')}}]},
             "URL": {"url": data.get('url', '')},
@@ -173,74 +110,24 @@ class NotionBase:
             elif not isinstance(full_summary, str):
                 full_summary = str(full_summary)
             
-            properties["Summary"] = {"rich_text": [{"text": {"content": full_summary[:2000]}}]}
+            properties["Summary"] = text_property(full_summary)
             
             one_sentence_summary = summary.get('one_sentence_summary', '')
             
             if not isinstance(one_sentence_summary, str):
                 one_sentence_summary = str(one_sentence_summary)
-            properties["One Sentence Summary"] = {"rich_text": [{"text": {"content": one_sentence_summary[:2000]}}]}
+            properties["One Sentence Summary"] = text_property(one_sentence_summary)
         
         return properties
 
     def highlight_keywords(self, text: str, keywords: List[str]) -> List[Dict]:
         """텍스트에서 키워드를 찾아 강조 표시를 추가합니다."""
-        if not text or not keywords:
-            return [{"type": "text", "text": {"content": text or ""}}]
-
-        result = []
-        current_pos = 0
-        text_lower = text.lower()
-        
-        # 키워드를 길이 순으로 정렬 (긴 키워드부터 처리)
-        sorted_keywords = sorted(keywords, key=len, reverse=True)
-        
-        while current_pos < len(text):
-            found_keyword = False
-            
-            for keyword in sorted_keywords:
-                keyword_lower = keyword.lower()
-                pos = text_lower.find(keyword_lower, current_pos)
-                
-                if pos == current_pos:
-                    # 키워드 이전 텍스트 추가
-                    if pos > 0:
-                        result.append({
-                            "type": "text",
-                            "text": {"content": text[current_pos:pos]}
-                        })
-                    
-                    # 키워드 추가 (강조 표시)
-                    result.append({
-                        "type": "text",
-                        "text": {
-                            "content": text[pos:pos + len(keyword)],
-                        },
-                        "annotations": {
-                            "bold": True,
-                            "color": "yellow_background"
-                        }
-                    })
-                    
-                    current_pos = pos + len(keyword)
-                    found_keyword = True
-                    break
-            
-            if not found_keyword:
-                # 키워드를 찾지 못한 경우, 다음 문자를 일반 텍스트로 추가
-                next_pos = len(text)
-                for keyword in sorted_keywords:
-                    keyword_pos = text_lower.find(keyword_lower, current_pos + 1)
-                    if keyword_pos != -1 and keyword_pos < next_pos:
-                        next_pos = keyword_pos
-                
-                result.append({
-                    "type": "text",
-                    "text": {"content": text[current_pos:next_pos]}
-                })
-                current_pos = next_pos
-        
-        return result
+        # 같은 요약의 키워드로 반복 호출되므로 컴파일한 정규식 재사용
+        key = tuple(keywords or ())
+        if self._highlighter is None or self._highlighter_key != key:
+            self._highlighter = KeywordHighlighter(keywords)
+            self._highlighter_key = key
+        return self._highlighter.highlight(text)
 
     
 class Pocket2Notion(NotionBase):
@@ -265,6 +152,26 @@ class Pocket2Notion(NotionBase):
         """
         self.pocket_client = pocket_client
         
+    def pocket_page(self, data):
+        """Pocket 아이템의 Notion 속성과 본문 블록"""
+        children = self.organize_summary(data)
+        properties = self.common_properties(data)
+        
+        # Pocket 특화 properties 추가
+        properties.update({
+            "Excerpt": text_property(data.get('excerpt', '')),
+            "Word count": {"number": int(data.get('word_count', 0))},
+            "Date": {"date": {"start": data.get('time_added', '')}},
+            "Language": {"select": {"name": data.get('lang', 'unknown')}},
+            "Favorite": {"select": {"name": str(data.get('favorite', False))}},
+            "Status": {"select": {"name": data.get('status', 'unread')}},
+            "Video": {"select": {"name": str(data.get('has_video', False))}}
+        })
+        
+        if not self.quiet:
+            logger.debug("Saving to Notion: %s", data.get('title', 'Untitled'))
+        return properties, children
+
     def save_to_notion_pocket(self, data):
         """
         Pocket 아이템을 Notion에 저장
@@ -272,45 +179,46 @@ class Pocket2Notion(NotionBase):
             data: 처리된 Pocket 아이템 데이터
         """
         try:
-            children = self.organize_summary(data)
-            properties = self.common_properties(data)
-            
-            # Pocket 특화 properties 추가
-            properties.update({
-                "Excerpt": {"rich_text": [{"text": {"content": data.get('excerpt', '')[:2000]}}]},
-                "Word count": {"number": int(data.get('word_count', 0))},
-                "Date": {"date": {"start": data.get('time_added', '')}},
-                "Language": {"select": {"name": data.get('lang', 'unknown')}},
-                "Favorite": {"select": {"name": str(data.get('favorite', False))}},
-                "Status": {"select": {"name": data.get('status', 'unread')}},
-                "Video": {"select": {"name": str(data.get('has_video', False))}}
-            })
+            properties, children = self.pocket_page(data)
+            self.save_to_notion(data, properties, children)
             
+        except Exception as e:
             if not self.quiet:
-                print(f"Saving to Notion: {data.get('title', 'Untitled')}")
-                
-            self.save_to_notion(data, properties, children)
+                logger.error("Error saving to Notion: %s", e)
+            raise
+
+    async def save_to_notion_pocket_async(self, data):
+        """Pocket 아이템을 Notion에 비동기로 저장"""
+        try:
+            properties, children = self.pocket_page(data)
+            await self.save_to_notion_async(data, properties, children)
             
         except Exception as e:
             if not self.quiet:
-                print(f"Error saving to Notion: {str(e)}")
+                logger.error("Error saving to Notion: %s", e)
             raise
             
 
 class Raindrop2Notion(NotionBase):
-    def save_to_notion_raindrop(self, data):
+    def raindrop_page(self, data):
         properties = self.common_properties(data)
         properties.update({
             "Collection": {"select": {"name": data['collection']}}
         })
         children = self.organize_summary(data)
-        self.save_to_notion(data, properties, children)
+        return properties, children
+
+    def save_to_notion_raindrop(self, data):
+        self.save_to_notion(data, *self.raindrop_page(data))
+
+    async def save_to_notion_raindrop_async(self, data):
+        await self.save_to_notion_async(data, *self.raindrop_page(data))
 
 class YouTube2Notion(NotionBase):
     def __init__(self, config, verbose=False, quiet=False):
         super().__init__(config, verbose, quiet)
         
-    def save_to_notion_youtube_ch(self, data):
+    def youtube_ch_page(self, data):
         properties = self.common_properties(data)
         properties.update({
             "Subscribers": {"number": int(data['Subscribers'])},
@@ -319,14 +227,20 @@ class YouTube2Notion(NotionBase):
             "Country": {"select": {"name": data['Country']}},
             "Category": {"multi_select": [{"name": topic} for topic in data['Category']]},
             "Publish Date": {"date": {"start": data['Published At']}},
-            "Description": {"rich_text": [{"text": {"content": data['Description']}}]},
+            "Description": text_property(data['Description']),
             
 
         })
         children = self.organize_summary(data)
-        self.save_to_notion(data, properties, children)
+        return properties, children
 
-    def save_to_notion_youtube(self, data):
+    def save_to_notion_youtube_ch(self, data):
+        self.save_to_notion(data, *self.youtube_ch_page(data))
+
+    async def save_to_notion_youtube_ch_async(self, data):
+        await self.save_to_notion_async(data, *self.youtube_ch_page(data))
+
+    def youtube_page(self, data):
         children = self.organize_summary(data)
         properties = self.common_properties(data)
         summary = data.get('summary', {})
@@ -347,8 +261,13 @@ class YouTube2Notion(NotionBase):
           
             "Playlist": {"select": {"name": data.get('playlist', '')}}
         })
-        
-        self.save_to_notion(data, properties, children)
+        return properties, children
+
+    def save_to_notion_youtube(self, data):
+        self.save_to_notion(data, *self.youtube_page(data))
+
+    async def save_to_notion_youtube_async(self, data):
+        await self.save_to_notion_async(data, *self.youtube_page(data))
 
 
 
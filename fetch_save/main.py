@@ -6,9 +6,15 @@ from langchain_summarizer.fetch_save.test_fetch import YouTube, WebContent, Rain
 from summarizer import BaseSummarizer#, TextSummarizer, VideoSummarizer
 from logger import Pocket2Notion, YouTube2Notion, Raindrop2Notion
 from utils import Utils
-import logging
+from common.metrics import metrics
+from common.log import get_logger, configure_logging, lazy
+from common.usage import ledger
+from common.rate_limiter import limiter
+from common.resilience import resilience
+from common.chunk_cache import chunk_cache
 import argparse
-logging.basicConfig(level=logging.INFO)
+
+log = get_logger('fetch_save.main')
 utils = Utils()
 
 def parse_arguments():
@@ -39,6 +45,12 @@ def parse_arguments():
     parser.add_argument('--no-chapters', action='store_false', dest='chapters',
                         help='챕터별 요약 비활성화')
     
+    # 예산 옵션
+    parser.add_argument('--max-cost', type=float, default=None, dest='max_cost',
+                        help='실행당 최대 OpenAI 비용(USD)')
+    parser.add_argument('--max-tokens', type=int, default=None, dest='max_tokens',
+                        help='실행당 최대 OpenAI 토큰 수')
+    
     parser.add_argument('--verbose', action='store_true', default=False,
                         help='상세 로그 출력')
     
@@ -57,16 +69,20 @@ def summarize_youtube(config, summarizer, log_youtube, playlist_url):
     if id[1]:
         videos = youtube.fetch_playlist_videos(id[0])
         playlist_name = youtube.get_playlist_name(id[0])
-        print(f'Fetch playlist:  {playlist_name}/ {len(videos)}')
+        log.info("Fetch playlist: %s/ %d", playlist_name, len(videos))
         for i, video in enumerate(tqdm(videos)):
             i_id = video['video_id']
             i_title = video['title']
-            print(f'{i}. {i_title}')
-            video_info = youtube.fetch_content(i_id)
-            transcript = youtube.get_transcript(i_id)
-            video_info['playlist'] = playlist_name
-            video_info['summary'] = summarizer.summarize(transcript, i_title)
-            log_youtube.save_to_notion_youtube(video_info)
+            log.debug("%d. %s", i, i_title)
+            with metrics.item('youtube', i_id):
+                with metrics.stage('fetch'):
+                    video_info = youtube.fetch_content(i_id)
+                    transcript = youtube.get_transcript(i_id)
+                metrics.set('transcript_chars', len(transcript or ''))
+                video_info['playlist'] = playlist_name
+                with metrics.stage('summarize'):
+                    video_info['summary'] = summarizer.summarize(transcript, i_title)
+                log_youtube.save_to_notion_youtube(video_info)
             #'published_date': video.publish_date.isoformat() if video.publish_date else None,
 
 def summarize_raindrop(config, summarizer, log_raindrop):
@@ -80,7 +96,7 @@ def summarize_raindrop(config, summarizer, log_raindrop):
         if len(i_text) > 300:
             raindrop_items[item]['summary']  = summarizer.summarize_content(i_text, item['title'])
         else:
-            print('Too small to summarize.')
+            log.info('Too small to summarize: %s', item['url'])
             raindrop_items[item]['summary'] = {'full_summary':'',
                                'one_sentence_summary':'',
                                'chapter_summary':''}
@@ -89,7 +105,7 @@ def summarize_web_text(processed_items, summarizer, extractor, logger, tags):
     for item in tqdm(processed_items, desc="Processing items"):
         try:
             # 2-1. 웹 콘텐츠 수집
-            print(f"4. 웹 콘텐츠 수집 시작: {item['title']} - {item['url']}")
+            log.info("4. 웹 콘텐츠 수집 시작: %s - %s", item['title'], item['url'])
             
             article_url = item['url']
             # Extract the main text and essential details
@@ -98,14 +114,14 @@ def summarize_web_text(processed_items, summarizer, extractor, logger, tags):
             
             # Display the extracted information
             if article_data:
-                print(len(article_data['text']))
+                log.debug("본문 길이: %d", len(article_data['text']))
                 if len(article_data['text']) > 10000:
-                    print('Too long to summarize.')
+                    log.info('Too long to summarize: %s', item['url'])
                     continue
-                print("Title:", article_data['title'])
-                print("Author:", article_data['author'])
-                print("Date:", article_data['date'])
-                print("Text:", article_data['text'][:500], "...") 
+                log.debug("Title: %s", article_data['title'])
+                log.debug("Author: %s", article_data['author'])
+                log.debug("Date: %s", article_data['date'])
+                log.debug("Text: %s ...", lazy(lambda: article_data['text'][:500]))
             
             #content = pocket._fetch_single_content(item)
             
@@ -120,16 +136,30 @@ def summarize_web_text(processed_items, summarizer, extractor, logger, tags):
                 
                 logger.save_to_notion_pocket(item)
             else:
-                print(f"콘텐츠 수집 실패: {item['url']}")
+                log.warning("콘텐츠 수집 실패: %s", item['url'])
                 
         except Exception as e:
-            print(f"아이템 처리 중 오류 발생 ({item['url']}): {str(e)}")
+            log.exception("아이템 처리 중 오류 발생 (%s): %s", item['url'], e)
             continue
     #summarize_text(config, df_raindrop, texts, summarizer, log_raindrop, config.NOTION_DB_RAINDROP_ID)
 
 def main():
     args = parse_arguments()
     config = Config()
+    configure_logging(level='DEBUG' if args.verbose else 'INFO')
+    ledger.configure(
+        max_cost=args.max_cost if args.max_cost is not None else config.MAX_COST,
+        max_tokens=args.max_tokens if args.max_tokens is not None else config.MAX_TOKENS
+    )
+    limiter.configure(rpm=config.OPENAI_RPM, tpm=config.OPENAI_TPM, headroom=config.RATE_LIMIT_HEADROOM)
+    resilience.configure(
+        max_attempts=config.RETRY_MAX_ATTEMPTS,
+        base_delay=config.RETRY_BASE_DELAY,
+        max_delay=config.RETRY_MAX_DELAY,
+        failure_threshold=config.CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout=config.CIRCUIT_RESET_TIMEOUT
+    )
+    chunk_cache.configure(config.CHUNK_CACHE_PATH)
     
     # Config 객체에 실행 시 설정 적용
     config.update_runtime_settings(
@@ -138,7 +168,7 @@ def main():
         chapters=args.chapters
     )
     
-    summarizer = BaseSummarizer(config)
+    summarizer = BaseSummarizer(config, verbose=args.verbose)
     
     if args.source == 'youtube':
         if not args.playlist_url:
@@ -155,6 +185,9 @@ def main():
         
         processed_items = pocket.fetch_content(tags=args.tags)
         summarize_web_text(processed_items, summarizer, extractor, logger, args.tags)
+        log.info("Pocket 요청 간격: %s", pocket.pacer.report())
+    
+    log.info("%s", ledger.report())
 
 if __name__ == "__main__":
     main()
@@ -6,9 +6,48 @@ from deep_translator import GoogleTranslator
 from typing import List, Dict, Optional
 import tiktoken
 import re
+import time
 from utils import Utils
+from common.metrics import metrics
+from common.log import get_logger, lazy
+from common.usage import ledger, cached_tokens
+from common.rate_limiter import limiter
+from common.resilience import resilience
+from common.chunk_cache import chunk_cache
+from common.prompts import CompiledPrompt, PromptRegistry
+from common.json_stream import JsonStreamParser, parse_json_fields, invalid_fields
+
+logger = get_logger('fetch_save.summarizer')
+
+def _attr(obj, name):
+    return obj.get(name) if isinstance(obj, dict) else getattr(obj, name, None)
+
+def output_text(message) -> str:
+    """응답 메시지/스트리밍 delta(SDK 객체 또는 dict)의 JSON 텍스트 (본문 또는 도구 호출 인자)"""
+    tool_calls = _attr(message, 'tool_calls')
+    if tool_calls:
+        return _attr(_attr(tool_calls[0], 'function'), 'arguments') or ''
+    function_call = _attr(message, 'function_call')
+    if function_call:
+        return _attr(function_call, 'arguments') or ''
+    return _attr(message, 'content') or ''
 
 class BaseSummarizer:
+    # Structured Outputs(response_format: json_schema)를 지원하는 모델 별칭/스냅샷 (이름 전체로 비교)
+    # 목록에 없는 모델(gpt-4o-2024-05-13, gpt-3.5-turbo 등)은 tools 호출로 받음
+    STRUCTURED_OUTPUT_MODELS = frozenset([
+        'gpt-4o', 'gpt-4o-2024-08-06', 'gpt-4o-2024-11-20',
+        'gpt-4o-mini', 'gpt-4o-mini-2024-07-18',
+        'gpt-4.1', 'gpt-4.1-2025-04-14', 'gpt-4.1-mini', 'gpt-4.1-mini-2025-04-14',
+        'gpt-4.1-nano', 'gpt-4.1-nano-2025-04-14',
+        'o1', 'o1-2024-12-17', 'o3-mini', 'o3-mini-2025-01-31', 'o3', 'o3-2025-04-16',
+        'o4-mini', 'o4-mini-2025-04-16',
+    ])
+    # tools/system 메시지를 지원하지 않는 초기 추론 모델: 스키마를 프롬프트에 넣어 JSON 본문으로 받음
+    PROMPT_JSON_MODELS = frozenset(['o1-mini', 'o1-mini-2024-09-12', 'o1-preview', 'o1-preview-2024-09-12'])
+    # 추론 모델(o 시리즈): temperature 미지원, 출력 길이는 max_completion_tokens로 지정
+    REASONING_MODEL_PREFIXES = ('o1', 'o3', 'o4')
+
     def __init__(self, config, verbose=True):
         self.config = config
         self.verbose = verbose
@@ -19,7 +58,8 @@ class BaseSummarizer:
             self.output_language_full = 'Korean'
         else:
             self.output_language_full = 'English'
-        self.client = OpenAI(api_key=config.OPENAI_API_KEY)
+        # 재시도는 resilience에서 처리 (SDK 자체 재시도와 중복 방지)
+        self.client = OpenAI(api_key=config.OPENAI_API_KEY, max_retries=0)
         self.json_function_full = config.json_function_full
         self.json_function_section = config.json_function_section
         self.json_function_final = config.json_function_final
@@ -32,13 +72,21 @@ class BaseSummarizer:
         self.max_response_token = 600
 
         self.MAX_CHUNKS_PER_CHAPTER =  6  # 한 챕터당 최대 청크 수
+        # 응답을 스트리밍으로 받아 필드 단위로 파싱, 스키마에 맞지 않는 필드는 그 필드만 재요청
+        self.stream_responses = getattr(config, 'STREAM_RESPONSES', True)
+        self.max_field_retries = getattr(config, 'JSON_FIELD_RETRIES', 1)
+        self.prefetched = {}  # 배치 모드에서 미리 받은 청크 요약 결과 (요청 모델, 필드)
+        self.prompts = PromptRegistry()  # (스키마, 언어, 모델)별 시스템 프롬프트/스키마 토큰 수
+        self.schema_types = {'section': self.json_function_section, 'final': self.json_function_final,
+                             'full': self.json_function_full}
 
-        print( '\n'+'#'*7 +' Initialization of Summarizer ' +'#'*7+ f"\nGPT 모델 = {self.gpt_model}\n초기화: 대상 언어 = {self.output_language}")
-        self.system_token = Utils.num_tokens_from_string(self.system_content, self.gpt_model)
-        self.json_token = Utils.num_tokens_from_string(json.dumps(self.json_function_full), self.gpt_model)
+        logger.info("Initialization of Summarizer: GPT 모델 = %s, 대상 언어 = %s", self.gpt_model, self.output_language)
+        compiled = self.compiled_prompt(self.json_function_full)
+        self.system_token = compiled.system_tokens
+        self.json_token = compiled.functions_tokens
         self.prompt_token = self.max_token - self.system_token - self.json_token - self.response_token  -self.buffer_token
-        if self.verbose:
-            print(f'\nPutative Max/System/Json/Response:{self.max_token}/{self.system_token}/{self.json_token}/{self.response_token}\nPrompt:{self.prompt_token}')
+        logger.debug("Putative Max/System/Json/Response: %d/%d/%d/%d, Prompt: %d", self.max_token,
+                     self.system_token, self.json_token, self.response_token, self.prompt_token)
         
     def summarize(self, text: str, title: str) -> Optional[Dict]:
         try:
@@ -46,9 +94,7 @@ class BaseSummarizer:
             self.source_lang = detect(processed_text)
             chunks = Utils.split_text_into_chunks(text=processed_text, max_length=self.prompt_token, by_token=True, gpt_model=self.gpt_model)
             n_chunks = len(chunks)
-            if self.verbose:
-                print('Max token per chunk:', self.prompt_token)
-                print(f'청크 수: {n_chunks}')
+            logger.debug("Max token per chunk: %d, 청크 수: %d", self.prompt_token, n_chunks)
             
             # 청크가 너무 많은 경우 (예: 10개 이상) 챕터 단위로 처리
             MAX_CHUNKS_PER_CHAPTER =  self.MAX_CHUNKS_PER_CHAPTER  # 한 챕터당 최대 청크 수
@@ -72,20 +118,19 @@ class BaseSummarizer:
             elif n_chunks > MAX_CHUNKS_PER_CHAPTER: # chapter 단위로 요약
                 return self.process_large_text(chunks, title, MAX_CHUNKS_PER_CHAPTER)
             
-            summary["keywords"] = list({keyword['term']: keyword for keyword in summary["keywords"]}.values())
+            summary["keywords"] = list({keyword['term']: keyword for keyword in summary.get("keywords", [])}.values())
 
             if self.source_lang != self.output_language or self.source_lang == 'unknown':
                 summary = self.translate_summary(summary)
 
             summary['keywords_original'] = [item['term'] for item in summary["keywords"]]
             final_summary = self.format_summary(summary, processed_text)
-            if self.verbose:
-                print(final_summary['one_sentence_summary'], final_summary['full_summary'])
+            logger.debug("%s %s", final_summary['one_sentence_summary'], final_summary['full_summary'])
 
             return final_summary
             
         except Exception as e:
-            print(f"요약 처리 중 오류 발생: {e}")
+            logger.error("요약 처리 중 오류 발생: %s", e)
             return None
 
     def divide_chunks_into_chapters(self, chunks: List[str], max_chunks_per_chapter: int) -> List[List[str]]:
@@ -115,16 +160,15 @@ class BaseSummarizer:
             chapters.append(chunks[start_idx:end_idx])
             start_idx = end_idx
         
-        if self.verbose:
-            print(f'총 {n_chunks}개 청크를 {n_chapters}개 챕터로 나눔')
-            print(f'챕터별 청크 수: {[len(chapter) for chapter in chapters]}')
+        logger.debug("총 %d개 청크를 %d개 챕터로 나눔, 챕터별 청크 수: %s", n_chunks, n_chapters,
+                     lazy(lambda: [len(chapter) for chapter in chapters]))
         
         return chapters
 
     def process_large_text(self, chunks: List[str], title: str, max_chunks_per_chapter: int) -> Optional[Dict]:
         try:
             chapters = self.divide_chunks_into_chapters(chunks, max_chunks_per_chapter)
-            print(f'챕터 수: {len(chapters)}')
+            logger.info("챕터 수: %d", len(chapters))
             
             chapter_info = []
             chapter_summaries = []
@@ -132,7 +176,7 @@ class BaseSummarizer:
             
             for i, chapter_chunks in enumerate(chapters):
                 chapter_num = i + 1
-                print(f'챕터 {chapter_num} 처리 중... (청크 수: {len(chapter_chunks)})')
+                logger.debug("챕터 %d 처리 중... (청크 수: %d)", chapter_num, len(chapter_chunks))
                 
                 # 각 챕터의 청크들을 요약
                 chunk_summaries = [self.get_chunk_summary(chunk, 
@@ -193,7 +237,7 @@ class BaseSummarizer:
             return self.format_summary(final_summary, ' '.join(chunks))
             
         except Exception as e:
-            print(f"대용량 텍스트 처리 중 오류 발생: {e}")
+            logger.error("대용량 텍스트 처리 중 오류 발생: %s", e)
             return None
 
     def translate_chapter_info(self, chapter_info: List[Dict]) -> List[Dict]:
@@ -216,86 +260,250 @@ class BaseSummarizer:
                 
             return chapter_info
         except Exception as e:
-            print(f"챕터 정보 번역 중 오류 발생: {e}")
+            logger.error("챕터 정보 번역 중 오류 발생: %s", e)
             return chapter_info
 
     def get_chunk_summary(self, chunk: str, json_function: List[Dict] = None) -> Optional[Dict]:
         try:
-            system_content = self.system_content + f'Respond in {self.output_language_full}, maintain consistency in formatting throughout the response.'#
-             # When encountering proper nouns, English abbreviations, or technical terminology from the original text, preserve them in their original English form without translation.'
-            #f'Always respond in {self.output_language_full} language, and maintain consistency in language and formatting throughout the response. Keep proper nouns, English abbreviations, and technical terms in their original English form.'
-            system_token = Utils.num_tokens_from_string(system_content, self.gpt_model)
-            json_token = Utils.num_tokens_from_string(json.dumps(json_function), self.gpt_model)
+            # 배치로 미리 받은 결과나 이전에 요약한 같은 청크가 있으면 재사용
+            # 캐시 키는 실제 요청한 모델 기준 (예산 부족으로 대체 모델을 쓰면 다른 키)
+            compiled = self.compiled_prompt(json_function)
+            prefetched = self.prefetched.get(self._request_key(chunk, compiled))
+            if prefetched is not None:
+                model, fields = prefetched
+                fields, errors = dict(fields), {}
+            else:
+                request = self.build_chat_request(chunk, json_function)
+                if request is None:
+                    return None
+                model = request['model']
+                cached = chunk_cache.get(self._cache_key(chunk, compiled, model))
+                if cached is not None:
+                    return cached
+                fields, errors = self.request_fields(request)
             
-            prompt = chunk
-            prompt_token = Utils.num_tokens_from_string(prompt, self.gpt_model)
-            response_token = self.max_token - system_token - json_token - prompt_token
-            #response_token = max(response_token, self.max_response_token)
-            if self.verbose:
-                print(f'Response Token: {response_token}')
-            #print(f'\nActual Max/System/Json/Response/Prompt:{self.max_token}/{self.system_token}/{self.json_token}/{self.response_token}/{prompt_token}: buffer = {self.RESPONSE_BUFFER}')
-        
-            response = self.client.chat.completions.create(
-                model=self.gpt_model,
-                messages=[
-                    {"role": "system", "content": system_content},
-                    {"role": "user", "content": prompt  }
-                ],
-                functions = json_function,
-                function_call={"name": "create_summary"},
-                max_tokens=response_token,
-                temperature=self.config.TEMPERATURE
-            )
-            result_json = response.choices[0].message.function_call.arguments
+            # 스키마에 맞지 않거나 파싱에 실패한 필드만 다시 요청 (응답 전체를 버리지 않음)
+            schema = json_function[0]['parameters']
+            invalid = invalid_fields(fields, schema, errors)
+            for _ in range(self.max_field_retries):
+                if not invalid:
+                    break
+                logger.warning("스키마에 맞지 않는 필드 재요청: %s", ', '.join(invalid))
+                metrics.incr('json_field_retries', len(invalid))
+                request = self.build_chat_request(chunk, self.field_function(json_function, invalid))
+                if request is None:
+                    break
+                retried, errors = self.request_fields(request)
+                fields.update({name: retried[name] for name in invalid if name in retried})
+                invalid = invalid_fields(fields, schema, {name: error for name, error in errors.items()
+                                                          if name in invalid})
             
-            keys = json_function[0]['parameters']['properties'].keys()
-            default_structure = {key: [] for key in keys}
-            result = self.process_json_response(result_json, default_structure)
-            if self.verbose:
-                print(f'OutputTokens: {Utils.num_tokens_from_string(result_json, self.gpt_model)}')
+            result = self.normalize_result(fields, json_function)
+            if invalid:
+                # 끝내 채우지 못한 필드는 빈 값으로 두고 캐시하지 않음
+                metrics.incr('json_field_errors', len(invalid))
+                logger.error("스키마에 맞지 않는 필드: %s", ', '.join(invalid))
+            else:
+                chunk_cache.put(self._cache_key(chunk, compiled, model), result)
             return result
         except Exception as e:
-            print(f"요약 오류: {e}")
+            logger.error("요약 오류: %s", e)
             return None
 
-    def process_json_response(self, response_text: str, default_structure: Dict[str, List] = None) -> Optional[Dict]:
-        try:
-            # 불필요한 공백, 줄바꿈, 탭 제거
-            response_text = re.sub(r'\s+', ' ', response_text.strip())
-
-            # 기본 구조 설정
-            if default_structure is None:
-                default_structure = {
-                    "keywords": [],
-                    "sections": [],
-                    "full_summary": [],
-                    "one_sentence_summary": []
-                }
-            
-            # JSON 파싱 시도
+    def request_fields(self, request: Dict) -> tuple:
+        """요청을 보내고 응답 JSON을 필드 단위로 파싱
+        
+        스트리밍 응답은 조각이 도착하는 대로 파싱하여 응답 전체를 다시 훑지 않는다.
+        
+        Returns:
+            (파싱된 필드, 필드별 파싱 오류)
+        """
+        # 전역 RPM/TPM 스케줄러에서 실행 시점 확보 (입력 + 최대 출력 토큰 = MAX_TOKEN 예약)
+        estimated = self.max_token
+        
+        def create():
+            limiter.acquire(estimated)
             try:
-                result = json.loads(response_text)
-            except json.JSONDecodeError as e:
-                print(f"JSON 파싱 오류: {e}\n{response_text}")
-                return default_structure
-            
-            # 결과 타입 확인
-            if not isinstance(result, dict):
-                print(f"예상치 못한 결과 타입: {type(result)}")
-                return default_structure
-            
-            # 기본 구조에 따라 결과 보정
-            for key in default_structure.keys():
-                if key not in result:
-                    result[key] = default_structure[key]
-                elif not isinstance(result[key], list):
-                    result[key] = [result[key]] if result[key] else []
-            
-            return result
+                if not self.stream_responses:
+                    response = self.client.chat.completions.create(**request)
+                    return parse_json_fields(output_text(response.choices[0].message)), response.usage
+                parser, usage = JsonStreamParser(), None
+                with self.client.chat.completions.create(**request, stream=True,
+                                                         stream_options={"include_usage": True}) as stream:
+                    for event in stream:
+                        usage = event.usage or usage
+                        if event.choices:
+                            parser.feed(output_text(event.choices[0].delta))
+                parser.close()
+                return parser, usage
+            except Exception:
+                limiter.reconcile(estimated, 0)
+                raise
         
-        except Exception as e:
-            print(f"JSON 처리 중 예외 발생: {e}")
+        started = time.perf_counter()
+        parser, usage = resilience.call(create, endpoint='openai')
+        prompt_tokens = usage.prompt_tokens if usage else 0
+        completion_tokens = usage.completion_tokens if usage else 0
+        cached = cached_tokens(usage)
+        limiter.reconcile(estimated, prompt_tokens + completion_tokens)
+        metrics.observe_llm(request['model'], prompt_tokens, completion_tokens, time.perf_counter() - started,
+                            cached_tokens=cached)
+        ledger.record(request['model'], prompt_tokens, completion_tokens, cached_tokens=cached)
+        logger.debug("OutputTokens: %d", completion_tokens)
+        return parser.fields, parser.errors
+
+    def compiled_prompt(self, json_function: List[Dict]) -> CompiledPrompt:
+        """함수 스키마에 맞는 시스템 프롬프트/스키마와 토큰 수 (스키마/언어/모델별로 한 번만 계산)"""
+        schema_type = next((name for name, function in self.schema_types.items() if function is json_function),
+                           None)
+        if schema_type is None:
+            # 설정에 없는 스키마는 내용으로 구분
+            schema_type = json.dumps(json_function, sort_keys=True)
+        key = (schema_type, None, self.output_language, self.gpt_model)
+
+        def build() -> CompiledPrompt:
+            system_content = self.system_content + f'Respond in {self.output_language_full}, maintain consistency in formatting throughout the response.'#
+             # When encountering proper nouns, English abbreviations, or technical terminology from the original text, preserve them in their original English form without translation.'
+            #f'Always respond in {self.output_language_full} language, and maintain consistency in language and formatting throughout the response. Keep proper nouns, English abbreviations, and technical terms in their original English form.'
+            return CompiledPrompt(system=system_content, functions=json_function,
+                                  count_tokens=lambda text: Utils.num_tokens_from_string(text, self.gpt_model))
+
+        return self.prompts.get(key, build)
+
+    def build_chat_request(self, chunk: str, json_function: List[Dict], batch: bool = False) -> Optional[Dict]:
+        """청크 요약 요청 본문 생성 (예산이 부족하면 None)"""
+        # 시스템 프롬프트/함수 스키마 토큰 수는 미리 계산된 값을 사용하고 청크만 토큰화
+        compiled = self.compiled_prompt(json_function)
+        
+        prompt = compiled.format(chunk)
+        prompt_token = Utils.num_tokens_from_string(prompt, self.gpt_model)
+        response_token = self.max_token - compiled.fixed_tokens - prompt_token
+        #response_token = max(response_token, self.max_response_token)
+        logger.debug("Response Token: %d", response_token)
+        
+        # 남은 예산에 맞는 모델 선택 (부족하면 저렴한 모델, 그래도 부족하면 요약 생략)
+        model = self.select_model(compiled.fixed_tokens + prompt_token, response_token, batch)
+        if model is None:
             return None
+        #print(f'\nActual Max/System/Json/Response/Prompt:{self.max_token}/{self.system_token}/{self.json_token}/{self.response_token}/{prompt_token}: buffer = {self.RESPONSE_BUFFER}')
+        
+        # 함수 스키마와 시스템 프롬프트는 스키마/언어/모델별로 바이트 단위까지 같으므로 청크만 다른
+        # 요청들은 앞부분이 프롬프트 캐시로 처리됨 (청크/제목은 항상 마지막 user 메시지에만 둠)
+        function = json_function[0]
+        request = {
+            "model": model,
+            "messages": [
+                {"role": "system", "content": compiled.system},
+                {"role": "user", "content": prompt}
+            ]
+        }
+        if model.startswith(self.REASONING_MODEL_PREFIXES):
+            request["max_completion_tokens"] = response_token
+        else:
+            request["max_tokens"] = response_token
+            request["temperature"] = self.config.TEMPERATURE
+        
+        if model in self.STRUCTURED_OUTPUT_MODELS:
+            # Structured Outputs: 응답 본문이 스키마를 따르는 JSON
+            # (maxLength 등 strict 모드가 지원하지 않는 키워드가 있어 strict는 끄고 응답을 직접 검증)
+            request["response_format"] = {
+                "type": "json_schema",
+                "json_schema": {"name": function['name'], "schema": function['parameters'], "strict": False}
+            }
+        elif model in self.PROMPT_JSON_MODELS:
+            schema_json = json.dumps(function['parameters'], ensure_ascii=False)
+            request["messages"] = [{
+                "role": "user",
+                "content": f"{compiled.system}\nRespond only with a JSON object that follows this JSON schema:\n"
+                           f"{schema_json}\n\n{prompt}"
+            }]
+        else:
+            request["tools"] = [{"type": "function", "function": function}]
+            request["tool_choice"] = {"type": "function", "function": {"name": function['name']}}
+        return request
+
+    @staticmethod
+    def field_function(json_function: List[Dict], names: List[str]) -> List[Dict]:
+        """names 속성만 남긴 함수 스키마 (잘못된 필드만 다시 요청할 때 사용)"""
+        function = json_function[0]
+        parameters = function['parameters']
+        properties = {name: parameters['properties'][name] for name in names}
+        return [{**function, "parameters": {**parameters, "properties": properties, "required": list(names)}}]
+
+    @staticmethod
+    def normalize_result(fields: Dict, json_function: List[Dict]) -> Dict:
+        """파싱된 필드를 스키마 기본 구조에 맞춤 (없는 필드는 빈 목록, 목록이 아닌 값은 목록으로)"""
+        result = dict(fields)
+        for key in json_function[0]['parameters']['properties']:
+            if key not in result:
+                result[key] = []
+            elif not isinstance(result[key], list):
+                result[key] = [result[key]] if result[key] else []
+        return result
+
+    @staticmethod
+    def _request_key(chunk: str, compiled: CompiledPrompt) -> tuple:
+        return (compiled.functions_json, chunk)
+
+    @staticmethod
+    def _cache_key(chunk: str, compiled: CompiledPrompt, model: str) -> str:
+        """청크 요약 캐시 키 (요청 모델, 시스템 프롬프트(출력 언어 포함), 함수 스키마, 청크)"""
+        return chunk_cache.key(model, compiled.system, compiled.functions_json, chunk)
+
+    def map_requests(self, text: str, title: str) -> List[tuple]:
+        """summarize()가 map 단계에서 요청할 (프롬프트, 함수 스키마) 목록"""
+        processed_text = Utils.preprocess_text(text)
+        chunks = Utils.split_text_into_chunks(text=processed_text, max_length=self.prompt_token, by_token=True, gpt_model=self.gpt_model)
+        if len(chunks) == 1:
+            return [(f'Title: {title}/ {chunks[0]}', self.json_function_full)]
+        return [(chunk, self.json_function_section) for chunk in chunks if chunk]
+
+    def summarize_batch(self, items: List[tuple], runner) -> List[Optional[Dict]]:
+        """여러 (텍스트, 제목)을 Batch API로 요약
+        
+        모든 항목의 map 단계(청크별 요약) 요청을 하나의 배치로 실행한 뒤, 항목별
+        reduce 단계(통합 요약)는 기존 summarize()로 진행한다. 배치에서 실패한
+        요청은 summarize() 중 동기 호출로 다시 시도된다.
+        """
+        requests, pending = [], {}
+        seen = set()
+        for text, title in items:
+            for prompt, json_function in self.map_requests(text, title):
+                compiled = self.compiled_prompt(json_function)
+                key = self._request_key(prompt, compiled)
+                if key in seen:
+                    continue
+                body = self.build_chat_request(prompt, json_function, batch=True)
+                if body is None or chunk_cache.peek(self._cache_key(prompt, compiled, body['model'])) is not None:
+                    continue
+                seen.add(key)
+                custom_id = f"map-{len(requests)}"
+                requests.append({'custom_id': custom_id, 'body': body})
+                pending[custom_id] = (key, body['model'])
+        
+        try:
+            results = runner.run(requests, description=f"fetch_save map {len(items)} items")
+            for custom_id, body in results.items():
+                if body is None:
+                    continue
+                key, model = pending[custom_id]
+                # 잘못된 필드는 summarize() 중 get_chunk_summary에서 그 필드만 다시 요청
+                self.prefetched[key] = (model, parse_json_fields(output_text(body['choices'][0]['message'])).fields)
+            return [self.summarize(text, title) for text, title in items]
+        finally:
+            self.prefetched.clear()
+
+    def select_model(self, prompt_tokens: int, response_tokens: int, batch: bool = False) -> Optional[str]:
+        """예상 사용량이 남은 예산 안에 드는 모델 반환 (없으면 None)"""
+        if ledger.allows(self.gpt_model, prompt_tokens, response_tokens, batch):
+            return self.gpt_model
+        fallback = getattr(self.config, 'FALLBACK_MODEL', None)
+        if fallback and ledger.allows(fallback, prompt_tokens, response_tokens, batch):
+            metrics.incr('budget_fallbacks')
+            logger.warning("예산 부족 - %s로 전환", fallback)
+            return fallback
+        logger.warning("예산 초과 - 요약 생략 (예상 %d 토큰)", prompt_tokens + response_tokens)
+        return None
 
     def merge_summaries(self, summaries: List[Dict], chunks: List[str]) -> tuple[str, list, list]:
         merged = {
@@ -308,7 +516,7 @@ class BaseSummarizer:
         # 각 chunk의 섹션들을 순차적으로 리
         for i, summary in enumerate(summaries):
             if not isinstance(summary, dict):
-                print(f"Warning: Invalid summary type: {type(summary)}")
+                logger.warning("Invalid summary type: %s", type(summary))
                 continue
             
             sections = summary.get('sections', [])
@@ -350,6 +558,7 @@ class BaseSummarizer:
             for i in range(0, len(text), max_length):
                 chunk = text[i:i + max_length]
                 translated_text += translator.translate(chunk)
+                metrics.incr('translation_calls')
             return self.clean_text(translated_text)
 
         try:
@@ -377,17 +586,17 @@ class BaseSummarizer:
             one_sentence = summary.get('one_sentence_summary', '')
             
             if isinstance(one_sentence, str):
-                print(f"Warning: Unexpected one_sentence_summary type (list): {type(one_sentence)}")
+                logger.warning("Unexpected one_sentence_summary type (list): %s", type(one_sentence))
             elif isinstance(one_sentence, list):
                 one_sentence = ''.join(one_sentence)
             else:
-                print(f"Warning: Unexpected one_sentence_summary type: {type(one_sentence)}")
+                logger.warning("Unexpected one_sentence_summary type: %s", type(one_sentence))
                 
             summary['one_sentence_summary'] = translate_text(one_sentence, translator)
             
             return summary
         except Exception as e:
-            print(f"번역 중 오류 발생: {e}")
+            logger.error("번역 중 오류 발생: %s", e)
     def format_summary(self, merged_summary: Dict, processed_text: str) -> Dict:
         try:
             one_sentence = merged_summary.get('one_sentence_summary', '')
@@ -419,7 +628,7 @@ class BaseSummarizer:
             return formatted_summary
             
         except Exception as e:
-            print(f"포맷팅 중 오류 발생: {e}")
+            logger.error("포맷팅 중 오류 발생: %s", e)
             return {
                 'sections': [],
                 'full_summary': '',
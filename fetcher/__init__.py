@@ -1,6 +1,10 @@
 # fetcher 패키지 초기화
 from .fetch import YouTube, PocketClient, RaindropClient
 from .logger import YouTubeLogger, PocketLogger, RaindropLogger
+from .extractor import HTMLExtractor
+from .pacer import HostPacer
+from .paginator import paginate
+from .sinks import create_sink, JsonlSink, ParquetSink, SqliteSink, NotionSink, FanoutSink
 
 __all__ = [
     'YouTube',
@@ -8,5 +12,14 @@ __all__ = [
     'RaindropClient',
     'YouTubeLogger',
     'PocketLogger',
-    'RaindropLogger'
+    'RaindropLogger',
+    'HTMLExtractor',
+    'HostPacer',
+    'paginate',
+    'create_sink',
+    'JsonlSink',
+    'ParquetSink',
+    'SqliteSink',
+    'NotionSink',
+    'FanoutSink'
 ]
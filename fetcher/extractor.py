@@ -0,0 +1,311 @@
+import re
+from typing import Callable, Dict, List, Optional
+
+try:
+    import lxml.html
+    from lxml import etree
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+from bs4 import BeautifulSoup
+from bs4.element import Tag, NavigableString, Comment, Doctype, ProcessingInstruction, Declaration
+
+# 텍스트 흐름 안에 놓이는 인라인 태그 (앞뒤에 공백을 넣지 않음)
+INLINE_TAGS = frozenset([
+    'a', 'abbr', 'b', 'bdi', 'bdo', 'cite', 'code', 'data', 'del', 'dfn', 'em', 'font', 'i', 'ins', 'kbd',
+    'mark', 'q', 'rp', 'rt', 'ruby', 's', 'samp', 'small', 'span', 'strong', 'sub', 'sup', 'time', 'u', 'var',
+])
+
+_WHITESPACE = re.compile(r'\s+')
+
+class _Block:
+    """파싱 결과를 파서와 무관하게 표현하는 경량 노드"""
+
+    __slots__ = ('tag', 'role', 'hint', 'parent', 'items', 'text_len', 'link_len', 'commas')
+
+    def __init__(self, tag: str, role: str = '', hint: str = '', parent: '_Block' = None):
+        self.tag = tag
+        self.role = role
+        self.hint = hint  # class + id (소문자)
+        self.parent = parent
+        self.items: List = []  # str 또는 _Block (문서 순서 유지)
+        self.text_len = 0
+        self.link_len = 0
+        self.commas = 0
+
+    @property
+    def link_density(self) -> float:
+        return self.link_len / self.text_len if self.text_len else 0.0
+
+    def iter_text(self, skip: Callable = None):
+        """하위 텍스트 조각을 문서 순서대로 반환 (skip 조건에 맞는 블록 제외)
+
+        블록 수준 태그의 앞뒤에만 공백을 넣으므로 인라인 태그로 나뉜 단어(H<sub>2</sub>O)는
+        붙은 채로 유지된다.
+        """
+        for item in self.items:
+            if isinstance(item, str):
+                yield item
+            elif skip is None or not skip(item):
+                if item.tag in INLINE_TAGS:
+                    yield from item.iter_text(skip)
+                else:
+                    yield ' '
+                    yield from item.iter_text(skip)
+                    yield ' '
+
+    def iter_blocks(self):
+        """자신을 포함한 모든 하위 블록 순회"""
+        yield self
+        for item in self.items:
+            if isinstance(item, _Block):
+                yield from item.iter_blocks()
+
+class HTMLExtractor:
+    """HTML 문서를 한 번만 파싱하여 본문 텍스트 추출
+
+    lxml이 설치되어 있으면 lxml로 파싱하고, 없거나 파싱에 실패하면
+    html.parser(BeautifulSoup)로 대체한다. 어느 경우든 파싱 결과를 한 번만
+    순회하여 보일러플레이트를 건너뛴 경량 트리를 만든 뒤, readability 방식의
+    텍스트 밀도/링크 밀도 점수로 본문 블록을 고른다.
+    """
+
+    # 본문과 무관한 보일러플레이트 태그
+    BOILERPLATE_TAGS = frozenset([
+        'script', 'style', 'noscript', 'template', 'svg', 'iframe',
+        'nav', 'header', 'footer', 'aside', 'form', 'button',
+        'head', 'meta', 'link',
+    ])
+
+    # 문단으로 취급하는 태그 (점수를 부모/조부모 블록에 전달)
+    PARAGRAPH_TAGS = frozenset(['p', 'pre', 'blockquote', 'td'])
+
+    # 정리 대상이 되는 컨테이너 태그
+    CONTAINER_TAGS = frozenset(['div', 'section', 'ul', 'ol', 'table', 'dl'])
+
+    # 본문 후보 태그 (점수 계산이 불가능할 때의 우선순위)
+    MAIN_TAGS = ('article', 'main')
+
+    POSITIVE_HINTS = re.compile(r'article|content|post|entry|main|body|text|story|blog')
+    # class/id를 공백, '-', '_'로 나눈 토큰 단위로 비교 (stage, inside, thread-, loads 등은 제외)
+    # 뜻이 분명한 단어는 토큰 앞부분(comments, navbar), 짧은 단어는 토큰 전체가 일치해야 함
+    NEGATIVE_HINTS = re.compile(
+        r'(?:^|[\s_-])(?:'
+        r'(?:comment|footer|nav|menu|sidebar|related|popular|cookie|consent|banner|promo|share|social|'
+        r'subscribe|newsletter|sponsor|popup|modal|widget|advert)[a-z]*'
+        r'|ad|ads|tags?|side|foot'
+        r')(?=$|[\s_-])'
+    )
+
+    MIN_PARAGRAPH_LENGTH = 25
+
+    def __init__(self, parser: Optional[str] = None, count_tokens: Optional[Callable[[str], int]] = None):
+        """
+        Args:
+            parser: 'lxml' 또는 'html.parser' (기본값: 설치 여부에 따라 자동 선택)
+            count_tokens: 토큰 수 계산 함수 (지정 시 토큰 절감량 통계 포함)
+        """
+        if parser is None:
+            parser = 'lxml' if HAS_LXML else 'html.parser'
+        if parser == 'lxml' and not HAS_LXML:
+            parser = 'html.parser'
+        self.parser = parser
+        self.count_tokens = count_tokens
+
+    def extract(self, html: str) -> Dict:
+        """제목과 본문 텍스트 추출"""
+        title, root, raw_text = self._build(html)
+        block = self._select_main_block(root)
+        text = ' '.join(''.join(block.iter_text(self._is_noise)).split())
+        result = {
+            'title': title,
+            'text': text,
+        }
+        if self.count_tokens:
+            result['token_stats'] = self._token_stats(raw_text, text)
+        return result
+
+    def extract_text(self, html: str) -> str:
+        """본문 텍스트만 반환"""
+        return self.extract(html)['text']
+
+    def _token_stats(self, raw_text: str, text: str) -> Dict:
+        """전체 페이지 텍스트(기존 get_text 결과) 대비 본문 토큰 절감량"""
+        raw_tokens = self.count_tokens(raw_text)
+        text_tokens = self.count_tokens(text)
+        return {
+            'raw_tokens': raw_tokens,
+            'text_tokens': text_tokens,
+            'reduction': 1 - text_tokens / raw_tokens if raw_tokens else 0.0,
+        }
+
+    def _build(self, html: str):
+        """lxml 우선 파싱, 실패 시 html.parser로 대체"""
+        if self.parser == 'lxml' and html and html.strip():
+            try:
+                return self._build_lxml(html)
+            except (etree.ParserError, ValueError, RecursionError):
+                pass
+        return self._build_soup(html)
+
+    def _build_lxml(self, html: str):
+        doc = lxml.html.document_fromstring(html)
+        title_node = doc.find('.//title')
+        title = ' '.join(title_node.text_content().split()) if title_node is not None else ''
+        root = _Block('html')
+        self._walk_lxml(doc, root)
+        raw_text = ' '.join(doc.text_content().split()) if self.count_tokens else None
+        return title, root, raw_text
+
+    def _walk_lxml(self, element, block: _Block) -> None:
+        if element.text:
+            self._add_text(block, element.text)
+        for child in element:
+            tag = child.tag
+            if isinstance(tag, str) and tag not in self.BOILERPLATE_TAGS:
+                hint = f"{child.get('class', '')} {child.get('id', '')}".lower()
+                child_block = _Block(tag, child.get('role', ''), hint, block)
+                self._walk_lxml(child, child_block)
+                self._attach(block, child_block)
+            # 주석 및 제거된 태그의 tail은 부모 텍스트에 속함
+            if child.tail:
+                self._add_text(block, child.tail)
+
+    def _build_soup(self, html: str):
+        soup = BeautifulSoup(html or '', 'html.parser')
+        title = ' '.join(soup.title.get_text().split()) if soup.title else ''
+        root = _Block('html')
+        try:
+            self._walk_soup(soup, root)
+        except RecursionError:
+            # 중첩이 너무 깊은 문서는 블록 구분 없이 전체 텍스트 사용
+            root = _Block('html')
+            self._add_text(root, soup.get_text(' '))
+        raw_text = ' '.join(soup.get_text().split()) if self.count_tokens else None
+        return title, root, raw_text
+
+    def _walk_soup(self, node, block: _Block) -> None:
+        for child in node.children:
+            if isinstance(child, Tag):
+                if child.name in self.BOILERPLATE_TAGS:
+                    continue
+                classes = child.get('class', [])
+                if isinstance(classes, list):
+                    classes = ' '.join(classes)
+                role = child.get('role', '')
+                hint = f"{classes} {child.get('id', '')}".lower()
+                child_block = _Block(child.name, role if isinstance(role, str) else '', hint, block)
+                self._walk_soup(child, child_block)
+                self._attach(block, child_block)
+            elif isinstance(child, NavigableString) and not isinstance(
+                    child, (Comment, Doctype, ProcessingInstruction, Declaration)):
+                self._add_text(block, str(child))
+
+    @staticmethod
+    def _add_text(block: _Block, text: str) -> None:
+        # 공백은 하나로 줄이되 앞뒤 공백은 남겨 인라인 태그 경계의 띄어쓰기 유지
+        text = _WHITESPACE.sub(' ', text)
+        if text:
+            block.items.append(text)
+            block.text_len += len(text.strip())
+            block.commas += text.count(',') + text.count('，') + text.count('、')
+
+    @staticmethod
+    def _attach(parent: _Block, child: _Block) -> None:
+        if not child.items:
+            return
+        if child.tag == 'a':
+            child.link_len = child.text_len
+        parent.items.append(child)
+        parent.text_len += child.text_len
+        parent.link_len += child.link_len
+        parent.commas += child.commas
+
+    def _class_weight(self, block: _Block) -> int:
+        weight = 0
+        if block.hint.strip():
+            if self.NEGATIVE_HINTS.search(block.hint):
+                weight -= 25
+            if self.POSITIVE_HINTS.search(block.hint):
+                weight += 25
+        if block.tag in self.MAIN_TAGS or block.role == 'main':
+            weight += 10
+        return weight
+
+    def _is_paragraph(self, block: _Block) -> bool:
+        if block.tag in self.PARAGRAPH_TAGS:
+            return True
+        # 하위 블록 없이 텍스트만 가진 div는 문단으로 취급
+        return block.tag == 'div' and all(isinstance(item, str) for item in block.items)
+
+    def _is_noise(self, block: _Block) -> bool:
+        """본문 내부의 광고, 관련 링크, 쿠키 배너 등 제외 조건"""
+        if block.tag not in self.CONTAINER_TAGS:
+            return False
+        if block.hint.strip() and self.NEGATIVE_HINTS.search(block.hint) \
+                and not self.POSITIVE_HINTS.search(block.hint):
+            return True
+        return block.link_density > 0.5
+
+    def _select_main_block(self, root: _Block) -> _Block:
+        """텍스트 밀도/링크 밀도 점수로 본문 블록 선택"""
+        scores: Dict[int, float] = {}
+        blocks: Dict[int, _Block] = {}
+
+        for block in root.iter_blocks():
+            if not self._is_paragraph(block) or block.text_len < self.MIN_PARAGRAPH_LENGTH:
+                continue
+            score = 1 + block.commas + min(block.text_len // 100, 3)
+            parent = block.parent
+            for share in (1.0, 0.5):
+                if parent is None:
+                    break
+                key = id(parent)
+                if key not in scores:
+                    blocks[key] = parent
+                    scores[key] = self._class_weight(parent)
+                scores[key] += score * share
+                parent = parent.parent
+
+        if not scores:
+            return self._fallback_block(root)
+
+        # 링크 비율이 높은 블록일수록 점수 감소
+        best_key = max(scores, key=lambda key: scores[key] * (1 - blocks[key].link_density))
+        best = blocks[best_key]
+        best_score = scores[best_key] * (1 - best.link_density)
+        if best_score <= 0:
+            return self._fallback_block(root)
+
+        # 본문이 형제 블록으로 나뉜 경우 점수가 충분한 형제 블록 포함
+        parent = best.parent
+        if parent is None:
+            return best
+        threshold = max(10, best_score * 0.2)
+        siblings = [
+            item for item in parent.items
+            if isinstance(item, _Block) and (
+                item is best or
+                scores.get(id(item), 0) * (1 - item.link_density) >= threshold
+            )
+        ]
+        if len(siblings) == 1:
+            return best
+        merged = _Block(best.tag, best.role, best.hint, parent)
+        for item in siblings:
+            merged.items.append(item)
+            merged.text_len += item.text_len
+            merged.link_len += item.link_len
+        return merged
+
+    def _fallback_block(self, root: _Block) -> _Block:
+        """점수 계산이 불가능할 때 article > main > role=main > 전체 순으로 선택"""
+        for tag in self.MAIN_TAGS:
+            candidates = [b for b in root.iter_blocks() if b.tag == tag]
+            if candidates:
+                return max(candidates, key=lambda b: b.text_len)
+        candidates = [b for b in root.iter_blocks() if b.role == 'main']
+        if candidates:
+            return max(candidates, key=lambda b: b.text_len)
+        return root
@@ -1,16 +1,29 @@
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional
 import requests
-from bs4 import BeautifulSoup
 import cloudscraper
 import random
+import time
+import tiktoken
 from pathlib import Path
+from urllib.parse import urlparse
+from openai import OpenAI
 from youtube_transcript_api import YouTubeTranscriptApi, TranscriptsDisabled, NoTranscriptFound
 from googleapiclient.discovery import build
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.oauth2.credentials import Credentials
 from google.auth.transport.requests import Request
 
+from .extractor import HTMLExtractor
+from common.sentences import SentenceSegmenter
+from common.metrics import metrics
+from common.usage import ledger, estimate_tokens, cached_tokens
+from common.rate_limiter import limiter
+from common.resilience import resilience
+from common.log import get_logger
+
+logger = get_logger(__name__)
+
 class MediaSource(ABC):
     """데이터 소스의 기본 인터페이스"""
     
@@ -30,27 +43,55 @@ class WebContent(MediaSource):
         self.scraper = cloudscraper.create_scraper(
             browser={'browser': 'chrome', 'platform': 'windows', 'mobile': False}
         )
+        self.extractor = HTMLExtractor(count_tokens=self._get_token_counter())
         
     def fetch_content(self, url: str) -> Optional[Dict]:
         try:
-            response = self.session.get(url)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
-            text = self.clean_text(soup.get_text())
+            started = time.perf_counter()
+            response = resilience.call(self._get, url, endpoint=urlparse(url).netloc or 'web')
+            extracted = self.extractor.extract(response.text)
             
-            return {
+            content = {
                 'url': url,
-                'text': text,
-                'title': soup.title.string if soup.title else '',
+                'text': extracted['text'],
+                'title': extracted['title'],
+                'fetch_seconds': time.perf_counter() - started,
             }
+            
+            # 본문 추출로 인한 토큰 절감량 보고
+            token_stats = extracted.get('token_stats')
+            if token_stats:
+                content['token_stats'] = token_stats
+                logger.debug("본문 추출: %d -> %d 토큰 (%.1f%% 절감) %s", token_stats['raw_tokens'],
+                             token_stats['text_tokens'], token_stats['reduction'] * 100, url)
+            
+            return content
         except Exception as e:
-            print(f"Error fetching content: {e}")
+            logger.error("Error fetching content: %s", e)
             return None
             
+    def _get(self, url: str) -> requests.Response:
+        """GET 요청 (HTTP 오류는 예외로 변환하여 재시도 판단에 사용)"""
+        response = self.session.get(url, timeout=self.config.REQUEST_TIMEOUT)
+        response.raise_for_status()
+        return response
+
     def clean_text(self, text: str) -> str:
         """HTML 태그 제거 및 텍스트 정리"""
-        soup = BeautifulSoup(text, "html.parser")
-        return ' '.join(soup.stripped_strings)
+        return self.extractor.extract_text(text)
+    
+    def _get_token_counter(self):
+        """요약 모델 기준 토큰 카운터 생성 (인코딩을 불러올 수 없으면 None)"""
+        try:
+            model = getattr(self.config, 'GPT_MODEL', 'gpt-3.5-turbo')
+            try:
+                encoding = tiktoken.encoding_for_model(model)
+            except KeyError:
+                encoding = tiktoken.get_encoding('cl100k_base')
+            return lambda text: len(encoding.encode(text, disallowed_special=()))
+        except Exception as e:
+            logger.warning("토큰 카운터 초기화 실패: %s", e)
+            return None
     
     def _get_random_headers(self) -> Dict[str, str]:
         """랜덤 User-Agent 헤더 생성"""
@@ -70,16 +111,31 @@ class YouTube(MediaSource):
     
     def __init__(self, config):
         self.config = config
+        self.segmenter = SentenceSegmenter()  # 자막 구간 사이 휴지를 문장 경계로 보존
+        self._openai_client = None
         self._init_youtube_client()
-        print('#'*7+'YouTube Client Initialized'+'#'*7)
+        logger.info("YouTube Client Initialized")
         
     def _init_youtube_client(self):
         """YouTube API 클라이언트 초기화"""
         self.api_key = self.config.YOUTUBE_API_KEY
+        endpoint = self.config.YOUTUBE_API_ENDPOINT
+        if endpoint:
+            # 엔드포인트가 지정된 경우 (로컬 테스트 서버 등) API 키로 조회 전용 접근
+            self.youtube = build("youtube", "v3", developerKey=self.api_key,
+                                 client_options={"api_endpoint": endpoint}, static_discovery=True)
+            return
         SCOPES = ['https://www.googleapis.com/auth/youtube.force-ssl']
         creds = self._get_or_refresh_credentials(SCOPES)
         self.youtube = build("youtube", "v3", credentials=creds)
 
+    def _get_openai_client(self):
+        """자막 번역용 OpenAI 클라이언트 (번역이 필요할 때 생성)"""
+        if self._openai_client is None:
+            # 재시도는 resilience에서 처리 (SDK 자체 재시도와 중복 방지)
+            self._openai_client = OpenAI(api_key=self.config.OPENAI_API_KEY, max_retries=0)
+        return self._openai_client
+
     def _get_or_refresh_credentials(self, SCOPES: List[str]) -> Credentials:
         """인증 정보 가져오기 또는 갱신"""
         token_file = self.config.src_path / 'token.json'
@@ -158,23 +214,25 @@ class YouTube(MediaSource):
                 return None
             
             # 자막 가져오기
-            transcript = self.get_transcript(video_id)
+            with metrics.stage('transcript'):
+                transcript = self.get_transcript(video_id)
             if transcript:
                 video_info['transcript'] = transcript
             
             return video_info
             
         except Exception as e:
-            print(f"Error fetching video content: {e}")
+            logger.error("Error fetching video content: %s", e)
             return None
 
     def _fetch_video_info(self, video_id: str) -> Optional[Dict]:
         """비디오 상세 정보 가져오기"""
         try:
-            response = self.youtube.videos().list(
+            request = self.youtube.videos().list(
                 part="snippet,statistics,contentDetails",
                 id=video_id
-            ).execute()
+            )
+            response = resilience.call(request.execute, endpoint='youtube')
             
             if not response.get("items"):
                 return None
@@ -197,7 +255,7 @@ class YouTube(MediaSource):
                 'thumbnail': self._get_best_thumbnail(snippet['thumbnails']),
             }
         except Exception as e:
-            print(f"Error fetching video info: {e}")
+            logger.error("Error fetching video info: %s", e)
             return None
 
     @staticmethod
@@ -208,45 +266,51 @@ class YouTube(MediaSource):
                 return thumbnails[res].get("url")
         return None
 
+    def _fetch_transcript(self, transcript) -> str:
+        """자막 내려받기 (문장 경계 보존하여 결합)"""
+        segments = resilience.call(transcript.fetch, endpoint='youtube_transcript')
+        return self.segmenter.join_segments(segments)
+
     def get_transcript(self, video_id: str) -> Optional[str]:
         """자막 가져오기 (우선순위: ko > en > ja > auto > others)"""
         try:
-            transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
-            print(f"\n=== 자막 탐색 시작 ===")
+            transcript_list = resilience.call(YouTubeTranscriptApi.list_transcripts, video_id,
+                                              endpoint='youtube_transcript')
+            logger.debug("자막 탐색 시작: %s", video_id)
             
             # 1. 선호 언어 순서대로 시도
             preferred_langs = ['ko', 'en', 'ja']
             for lang in preferred_langs:
                 try:
                     transcript = transcript_list.find_transcript([lang])
-                    print(f"'{lang}' 자막 발견")
-                    return ' '.join(item['text'] for item in transcript.fetch())
+                    logger.debug("'%s' 자막 발견", lang)
+                    return self._fetch_transcript(transcript)
                 except NoTranscriptFound:
-                    print(f"'{lang}' 자막 없음")
+                    logger.debug("'%s' 자막 없음", lang)
                     continue
             
             # 2. 자동 생성 자막 시도
             try:
                 for lang in preferred_langs:
                     transcript = transcript_list.find_generated_transcript([lang])
-                    print(f"'{lang}' 자동 생성 자막 발견")
-                    return ' '.join(item['text'] for item in transcript.fetch())
+                    logger.debug("'%s' 자동 생성 자막 발견", lang)
+                    return self._fetch_transcript(transcript)
             except NoTranscriptFound:
-                print("선호 언어 자동 생성 자막 없음")
+                logger.debug("선호 언어 자동 생성 자막 없음")
             
             # 3. 가용한 모든 자막 확인
             available_transcripts = transcript_list.manual + transcript_list.generated
             if available_transcripts:
                 # 가장 많이 사용되는 언어 선택
                 transcript = available_transcripts[0]
-                print(f"대체 자막 사용: {transcript.language}")
+                logger.info("대체 자막 사용: %s", transcript.language)
                 
                 # 영어가 아닌 경우 번역
                 if transcript.language_code != 'en':
                     transcript = transcript.translate('en')
-                    print("영어로 번역됨")
+                    logger.debug("영어로 번역됨")
                 
-                text = ' '.join(item['text'] for item in transcript.fetch())
+                text = self._fetch_transcript(transcript)
                 
                 # 한국어로 번역 (OpenAI API 사용)
                 system_prompt = "You are a translator. Translate the following English text to Korean."
@@ -255,21 +319,43 @@ class YouTube(MediaSource):
                     {"role": "user", "content": f"Translate this to Korean:\n\n{text}"}
                 ]
                 
-                response = self.llm.chat.completions.create(
-                    model="gpt-3.5-turbo",
-                    messages=messages,
-                    temperature=0.3
-                )
+                metrics.incr('translation_calls')
+                model = "gpt-3.5-turbo"
+                # 번역 결과는 원문과 비슷한 길이이므로 입력 토큰의 두 배를 예약
+                estimated = 2 * estimate_tokens(messages[0]['content'] + messages[1]['content'])
+                
+                def translate():
+                    limiter.acquire(estimated)
+                    try:
+                        return self._get_openai_client().chat.completions.create(
+                            model=model,
+                            messages=messages,
+                            temperature=0.3
+                        )
+                    except Exception:
+                        limiter.reconcile(estimated, 0)
+                        raise
+                
+                started = time.perf_counter()
+                response = resilience.call(translate, endpoint='openai')
+                usage = response.usage
+                prompt_tokens = usage.prompt_tokens if usage else 0
+                completion_tokens = usage.completion_tokens if usage else 0
+                cached = cached_tokens(usage)
+                limiter.reconcile(estimated, prompt_tokens + completion_tokens)
+                metrics.observe_llm(model, prompt_tokens, completion_tokens, time.perf_counter() - started,
+                                    cached_tokens=cached)
+                ledger.record(model, prompt_tokens, completion_tokens, cached_tokens=cached)
                 
                 translated_text = response.choices[0].message.content
-                print("한국어로 번역 완료")
+                logger.debug("한국어로 번역 완료")
                 return translated_text
                 
-            print("이용 가능한 자막 없음")
+            logger.info("이용 가능한 자막 없음: %s", video_id)
             return None
             
         except Exception as e:
-            print(f"자막 처리 중 오류: {e}")
+            logger.error("자막 처리 중 오류: %s", e)
             return None
 
     def fetch_playlist_videos(self, playlist_url: str) -> List[Dict]:
@@ -293,7 +379,7 @@ class YouTube(MediaSource):
                     maxResults=50,
                     pageToken=next_page_token
                 )
-                response = request.execute()
+                response = resilience.call(request.execute, endpoint='youtube')
                 
                 for item in response['items']:
                     video_id = item['snippet']['resourceId']['videoId']
@@ -314,7 +400,7 @@ class YouTube(MediaSource):
             return videos
             
         except Exception as e:
-            print(f"Error fetching playlist: {e}")
+            logger.error("Error fetching playlist: %s", e)
             return []
 
     def get_playlist_name(self, playlist_id: str) -> Optional[str]:
@@ -324,13 +410,13 @@ class YouTube(MediaSource):
                 part='snippet',
                 id=playlist_id
             )
-            response = request.execute()
+            response = resilience.call(request.execute, endpoint='youtube')
             
             if response['items']:
                 return response['items'][0]['snippet']['title']
             return None
         except Exception as e:
-            print(f"Error fetching playlist name: {e}")
+            logger.error("Error fetching playlist name: %s", e)
             return None
 
 class PocketClient(WebContent):
@@ -339,7 +425,7 @@ class PocketClient(WebContent):
     def __init__(self, config):
         super().__init__(config)
         self.access_token = config.POCKET_ACCESS_TOKEN
-        self.base_url = "https://getpocket.com/v3"
+        self.base_url = config.POCKET_BASE_URL
 
     def fetch_content(self, params: Dict = None) -> List[Dict]:
         """Pocket 항목 가져오기"""
@@ -356,20 +442,25 @@ class PocketClient(WebContent):
         })
         
         try:
-            response = requests.post(
-                f"{self.base_url}/get",
-                json=params,
-                headers={'Content-Type': 'application/json'}
-            )
-            response.raise_for_status()
+            response = resilience.call(self._post, f"{self.base_url}/get", params, endpoint='pocket')
             
             items = response.json().get("list", {}).values()
             return self._process_items(items)
             
         except Exception as e:
-            print(f"Error fetching Pocket items: {e}")
+            logger.error("Error fetching Pocket items: %s", e)
             return []
 
+    def _post(self, url: str, params: Dict) -> requests.Response:
+        response = requests.post(
+            url,
+            json=params,
+            headers={'Content-Type': 'application/json'},
+            timeout=self.config.REQUEST_TIMEOUT
+        )
+        response.raise_for_status()
+        return response
+
     def _process_items(self, items: List[Dict]) -> List[Dict]:
         """Pocket 항목 처리"""
         processed = []
@@ -387,6 +478,8 @@ class PocketClient(WebContent):
             content = super().fetch_content(processed_item['url'])
             if content:
                 processed_item['text'] = content['text']
+                processed_item['token_stats'] = content.get('token_stats')
+                processed_item['fetch_seconds'] = content['fetch_seconds']
             
             processed.append(processed_item)
         
@@ -398,25 +491,30 @@ class RaindropClient(WebContent):
     def __init__(self, config):
         super().__init__(config)
         self.api_key = config.RAINDROP_TOKEN
-        self.base_url = "https://api.raindrop.io/rest/v1"
+        self.base_url = config.RAINDROP_BASE_URL
 
     def fetch_content(self, collection_id: str = None) -> List[Dict]:
         """Raindrop 항목 가져오기"""
         try:
             url = f"{self.base_url}/raindrops/{collection_id or 0}"
-            response = requests.get(
-                url,
-                headers={"Authorization": f"Bearer {self.api_key}"}
-            )
-            response.raise_for_status()
+            response = resilience.call(self._get_raindrops, url, endpoint='raindrop')
             
             items = response.json().get('items', [])
             return self._process_items(items)
             
         except Exception as e:
-            print(f"Error fetching Raindrop items: {e}")
+            logger.error("Error fetching Raindrop items: %s", e)
             return []
 
+    def _get_raindrops(self, url: str) -> requests.Response:
+        response = requests.get(
+            url,
+            headers={"Authorization": f"Bearer {self.api_key}"},
+            timeout=self.config.REQUEST_TIMEOUT
+        )
+        response.raise_for_status()
+        return response
+
     def _process_items(self, items: List[Dict]) -> List[Dict]:
         """Raindrop 항목 처리"""
         processed = []
@@ -433,6 +531,8 @@ class RaindropClient(WebContent):
             content = super().fetch_content(processed_item['url'])
             if content:
                 processed_item['text'] = content['text']
+                processed_item['token_stats'] = content.get('token_stats')
+                processed_item['fetch_seconds'] = content['fetch_seconds']
             
             processed.append(processed_item)
         
@@ -1,16 +1,35 @@
-from notion_client import Client
+from notion_client import Client, AsyncClient
 from typing import Dict, List, Optional
 from abc import ABC, abstractmethod
 from datetime import datetime
+from common.metrics import metrics
+from common.notion_payload import create_page, create_page_async, text_property
+from common.log import get_logger
+
+logger = get_logger(__name__)
 
 class NotionLogger(ABC):
     """Notion DB 저장을 위한 기본 클래스"""
     
     def __init__(self, config):
         self.config = config
-        self.client = Client(auth=config.NOTION_TOKEN)
+        self.client = Client(auth=config.NOTION_TOKEN, base_url=config.NOTION_BASE_URL)
+        self._async_client: Optional[AsyncClient] = None
         self.database_id = config.NOTION_DATABASE_ID
     
+    @property
+    def async_client(self) -> AsyncClient:
+        """비동기 클라이언트 (처음 사용할 때 생성, 사용하는 이벤트 루프 안에서 aclose로 정리)"""
+        if self._async_client is None:
+            self._async_client = AsyncClient(auth=self.config.NOTION_TOKEN, base_url=self.config.NOTION_BASE_URL)
+        return self._async_client
+    
+    async def aclose(self) -> None:
+        """비동기 클라이언트 연결 정리"""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+    
     def change_database(self, database_id: str) -> None:
         """데이터베이스 ID 변경"""
         self.database_id = database_id
@@ -24,13 +43,23 @@ class NotionLogger(ABC):
         """데이터를 Notion에 저장"""
         try:
             properties = self.format_properties(data)
-            self.client.pages.create(
-                parent={"database_id": self.database_id},
-                properties=properties
-            )
-            print(f"Saved to Notion: {data.get('title', 'Untitled')}")
+            with metrics.stage('notion_write'):
+                create_page(self.client, self.database_id, properties)
+            logger.info("Saved to Notion: %s", data.get('title', 'Untitled'))
+        except Exception as e:
+            metrics.incr('notion_errors')
+            logger.error("Error saving to Notion: %s", e)
+    
+    async def save_to_notion_async(self, data: Dict) -> None:
+        """데이터를 Notion에 비동기로 저장 (저장 중에도 파이프라인의 다른 작업 진행)"""
+        try:
+            properties = self.format_properties(data)
+            with metrics.stage('notion_write'):
+                await create_page_async(self.async_client, self.database_id, properties)
+            logger.info("Saved to Notion: %s", data.get('title', 'Untitled'))
         except Exception as e:
-            print(f"Error saving to Notion: {e}")
+            metrics.incr('notion_errors')
+            logger.error("Error saving to Notion: %s", e)
 
 class YouTubeLogger(NotionLogger):
     """YouTube 데이터를 Notion에 저장"""
@@ -46,7 +75,7 @@ class YouTubeLogger(NotionLogger):
             "Like Count": {"number": data.get('like_count', 0)},
             "Comment Count": {"number": data.get('comment_count', 0)},
             "Duration": {"rich_text": [{"text": {"content": data.get('duration', '')}}]},
-            "Description": {"rich_text": [{"text": {"content": data.get('description', '')[:2000]}}]},
+            "Description": text_property(data.get('description', '')),
             "Tags": {"multi_select": [{"name": tag} for tag in data.get('tags', [])]},
             "Category": {"select": {"name": str(data.get('category', ''))}},
             "Thumbnail": {"url": data.get('thumbnail', '')},
@@ -54,9 +83,7 @@ class YouTubeLogger(NotionLogger):
         
         # 요약이 있는 경우 추가
         if 'summary' in data:
-            properties["Summary"] = {
-                "rich_text": [{"text": {"content": str(data['summary'])[:2000]}}]
-            }
+            properties["Summary"] = text_property(data['summary'])
             
         # 재생목록 정보가 있는 경우 추가
         if 'playlist' in data:
@@ -74,12 +101,12 @@ class PocketLogger(NotionLogger):
         return {
             "Title": {"title": [{"text": {"content": data.get('title', '')}}]},
             "URL": {"url": data.get('url', '')},
-            "Excerpt": {"rich_text": [{"text": {"content": data.get('excerpt', '')[:2000]}}]},
+            "Excerpt": text_property(data.get('excerpt', '')),
             "Word Count": {"number": data.get('word_count', 0)},
             "Added Date": {"date": {"start": datetime.fromtimestamp(
                 int(data.get('time_added', 0))).isoformat()}},
             "Tags": {"multi_select": [{"name": tag} for tag in data.get('tags', [])]},
-            "Summary": {"rich_text": [{"text": {"content": data.get('summary', '')[:2000]}}]},
+            "Summary": text_property(data.get('summary', '')),
         }
 
 class RaindropLogger(NotionLogger):
@@ -89,8 +116,8 @@ class RaindropLogger(NotionLogger):
         return {
             "Title": {"title": [{"text": {"content": data.get('title', '')}}]},
             "URL": {"url": data.get('url', '')},
-            "Excerpt": {"rich_text": [{"text": {"content": data.get('excerpt', '')[:2000]}}]},
+            "Excerpt": text_property(data.get('excerpt', '')),
             "Created": {"date": {"start": data.get('created', '')}},
             "Tags": {"multi_select": [{"name": tag} for tag in data.get('tags', [])]},
-            "Summary": {"rich_text": [{"text": {"content": data.get('summary', '')[:2000]}}]},
+            "Summary": text_property(data.get('summary', '')),
         } 
\ No newline at end of file
@@ -0,0 +1,111 @@
+import time
+import threading
+from urllib.parse import urlparse
+from typing import Callable, Dict, Optional
+from common.metrics import metrics
+from common.log import get_logger
+
+logger = get_logger(__name__)
+
+# 호스트가 요청 속도를 제한하거나 봇으로 판단했을 때의 상태 코드
+THROTTLE_STATUS = {403, 429, 503}
+
+class _HostState:
+    __slots__ = ('delay', 'next_at')
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.next_at = 0.0
+
+class HostPacer:
+    """호스트별 적응형 요청 간격
+
+    고정 대기 없이 최소 간격으로 시작하고, 429/403/캡차가 감지된 호스트만 간격을 두 배로
+    늘린다 (Retry-After가 있으면 그 이상). 요청이 성공할 때마다 간격을 절반으로 줄여
+    다시 빠른 속도로 돌아온다. 호출부가 기존에 두던 고정 대기 시간(baseline)을 함께 넘기면
+    절감한 대기 시간을 집계한다.
+    """
+
+    def __init__(self, min_delay: float = 0.0, initial_backoff: float = 1.0, max_delay: float = 60.0,
+                 clock: Callable[[], float] = time.monotonic, sleep: Callable[[float], None] = time.sleep):
+        """
+        Args:
+            min_delay: 같은 호스트 요청 사이 최소 간격(초)
+            initial_backoff: 첫 제한 감지 시 간격(초)
+            max_delay: 최대 간격(초)
+            clock: 현재 시각 함수 (테스트용)
+            sleep: 대기 함수 (테스트용)
+        """
+        self.min_delay = min_delay
+        self.initial_backoff = initial_backoff
+        self.max_delay = max_delay
+        self._clock = clock
+        self._sleep = sleep
+        self._hosts: Dict[str, _HostState] = {}
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.backoffs = 0
+        self.waited = 0.0
+        self.baseline = 0.0
+
+    @staticmethod
+    def _host(url: str) -> str:
+        return urlparse(url).netloc or url
+
+    def _state(self, host: str) -> _HostState:
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = _HostState(self.min_delay)
+        return state
+
+    def wait(self, url: str, baseline: float = 0.0) -> float:
+        """호스트의 다음 요청 시점까지 대기, 대기 시간(초) 반환
+
+        Args:
+            url: 요청 URL (호스트 단위로 간격 유지)
+            baseline: 이 요청 앞에 두던 고정 대기 시간(초), 절감량 집계용
+        """
+        with self._lock:
+            state = self._state(self._host(url))
+            now = self._clock()
+            start = max(now, state.next_at)
+            state.next_at = start + state.delay
+            wait = start - now
+            self.requests += 1
+            self.waited += wait
+            self.baseline += baseline
+        metrics.incr('pace_saved_seconds', baseline - wait)
+        if wait > 0:
+            metrics.observe_stage('pace_wait', wait)
+            self._sleep(wait)
+        return wait
+
+    def success(self, url: str) -> None:
+        """요청 성공: 간격을 절반으로 줄임"""
+        with self._lock:
+            state = self._state(self._host(url))
+            state.delay = max(self.min_delay, state.delay / 2)
+            if state.delay < 0.05:
+                state.delay = self.min_delay
+
+    def throttled(self, url: str, retry_after: Optional[float] = None) -> None:
+        """속도 제한/봇 감지: 간격을 두 배로 늘리고 다음 요청을 미룸"""
+        host = self._host(url)
+        with self._lock:
+            state = self._state(host)
+            delay = max(self.initial_backoff, state.delay * 2)
+            if retry_after is not None:
+                delay = max(delay, retry_after)
+            state.delay = min(self.max_delay, delay)
+            state.next_at = max(state.next_at, self._clock() + state.delay)
+            self.backoffs += 1
+        metrics.incr('pace_backoffs')
+        logger.warning("요청 제한 감지: %s, 간격 %.1fs로 증가", host, state.delay)
+
+    def saved(self) -> float:
+        """고정 대기 대비 절감한 대기 시간(초)"""
+        return self.baseline - self.waited
+
+    def report(self) -> str:
+        return (f"요청 {self.requests}회, 대기 {self.waited:.1f}s (고정 대기 {self.baseline:.1f}s 대비 "
+                f"{self.saved():.1f}s 절감), 제한 감지 {self.backoffs}회")
@@ -0,0 +1,67 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, List, Optional
+from common.log import get_logger
+
+logger = get_logger(__name__)
+
+def paginate(fetch_page: Callable[[int], List], page_size: int, concurrency: int = 4,
+             max_items: Optional[int] = None) -> Iterator:
+    """페이지 단위 API를 병렬로 가져와 항목을 순서대로 스트리밍
+
+    첫 페이지가 가득 차서 다음 데이터가 있다고 확인되면 최대 concurrency개 페이지를 동시에
+    요청한다. 결과는 페이지 순서대로 내보내며, 한 페이지를 소비할 때마다 다음 페이지를
+    하나씩 요청하므로 메모리에는 많아야 concurrency개 페이지만 올라간다. 가득 차지 않은
+    페이지를 받았거나 요청 중인 페이지로 max_items를 채울 수 있으면 더 요청하지 않는다.
+
+    Args:
+        fetch_page: 페이지 번호(0부터)를 받아 항목 목록을 반환하는 함수
+        page_size: 페이지당 최대 항목 수
+        concurrency: 동시에 요청할 최대 페이지 수
+        max_items: 최대 항목 수 (None이면 전체)
+    """
+    remaining = max_items
+
+    def emit(items: List):
+        nonlocal remaining
+        for item in items:
+            if remaining is not None:
+                if remaining <= 0:
+                    return
+                remaining -= 1
+            yield item
+
+    first = fetch_page(0)
+    yield from emit(first)
+    if len(first) < page_size or (remaining is not None and remaining <= 0):
+        return
+
+    pool = ThreadPoolExecutor(max_workers=concurrency)
+    pending = deque()
+    next_page = 1
+
+    def needed() -> bool:
+        # 요청 중인 페이지만으로 max_items를 채울 수 있으면 더 요청하지 않음
+        return remaining is None or remaining > len(pending) * page_size
+
+    try:
+        while len(pending) < concurrency and needed():
+            pending.append(pool.submit(fetch_page, next_page))
+            next_page += 1
+        exhausted = False
+        while pending:
+            items = pending.popleft().result()
+            logger.debug("페이지 수신: %d개 항목", len(items))
+            yield from emit(items)
+            if remaining is not None and remaining <= 0:
+                return
+            if len(items) < page_size:
+                exhausted = True
+            if not exhausted and needed():
+                pending.append(pool.submit(fetch_page, next_page))
+                next_page += 1
+    finally:
+        # 소비가 중단되면 아직 시작하지 않은 요청 취소
+        for future in pending:
+            future.cancel()
+        pool.shutdown(wait=False)
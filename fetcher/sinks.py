@@ -0,0 +1,246 @@
+import json
+import sqlite3
+from abc import ABC, abstractmethod
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+from common.metrics import metrics
+from common.log import get_logger
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+logger = get_logger(__name__)
+
+SINK_NAMES = ('notion', 'jsonl', 'parquet', 'sqlite')
+
+# 로컬 싱크에 저장하는 열 (요약 전체는 summary_json에 JSON 문자열로 보관)
+COLUMNS = ('source', 'url', 'title', 'saved_at', 'model', 'one_sentence_summary', 'full_summary',
+           'keywords', 'summary_json')
+
+def _text(value) -> str:
+    if value is None:
+        return ''
+    if isinstance(value, list):
+        return ' '.join(str(v) for v in value)
+    return str(value)
+
+def to_record(source: str, item: Dict) -> Dict:
+    """수집/요약 항목을 로컬 싱크 공통 행으로 변환"""
+    summary = item.get('summary')
+    fields = summary if isinstance(summary, dict) else {'full_summary': summary}
+    return {
+        'source': source,
+        'url': item.get('url', ''),
+        'title': item.get('title', ''),
+        'saved_at': datetime.now().isoformat(timespec='seconds'),
+        'model': item.get('model', ''),
+        'one_sentence_summary': _text(fields.get('one_sentence_summary')),
+        'full_summary': _text(fields.get('full_summary')),
+        'keywords': json.dumps(fields.get('keywords') or item.get('keywords') or [], ensure_ascii=False),
+        'summary_json': json.dumps(summary, ensure_ascii=False, default=str),
+    }
+
+class Sink(ABC):
+    """요약 결과 저장소
+
+    write는 항목 하나를 받고, flush/close에서 버퍼를 내보낸다. 비동기 파이프라인에서는
+    write_async를 사용한다 (기본 구현은 write 호출).
+    """
+
+    name = 'sink'
+
+    @abstractmethod
+    def write(self, item: Dict) -> None:
+        pass
+
+    async def write_async(self, item: Dict) -> None:
+        self.write(item)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.flush()
+
+    async def aclose(self) -> None:
+        self.close()
+
+class BufferedSink(Sink):
+    """행을 batch_size개씩 모아 한 번에 기록하는 로컬 싱크"""
+
+    def __init__(self, source: str, path: str, batch_size: int = 1000):
+        self.source = source
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.batch_size = batch_size
+        self.buffer: List[Dict] = []
+        self.written = 0
+
+    def write(self, item: Dict) -> None:
+        self.buffer.append(to_record(self.source, item))
+        if len(self.buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self.buffer:
+            return
+        rows, self.buffer = self.buffer, []
+        with metrics.stage(f'sink_{self.name}'):
+            self._write_rows(rows)
+        self.written += len(rows)
+        metrics.incr(f'sink_{self.name}_rows', len(rows))
+
+    @abstractmethod
+    def _write_rows(self, rows: List[Dict]) -> None:
+        pass
+
+class JsonlSink(BufferedSink):
+    """JSONL 파일에 행 추가"""
+
+    name = 'jsonl'
+
+    def _write_rows(self, rows: List[Dict]) -> None:
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(''.join(json.dumps(row, ensure_ascii=False) + '\n' for row in rows))
+
+class SqliteSink(BufferedSink):
+    """SQLite 테이블에 행 추가 (flush마다 트랜잭션 하나)"""
+
+    name = 'sqlite'
+
+    def __init__(self, source: str, path: str, batch_size: int = 1000, table: str = 'summaries'):
+        super().__init__(source, path, batch_size)
+        self.table = table
+        self.conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self.conn.execute(f"CREATE TABLE IF NOT EXISTS {table} ({', '.join(f'{c} TEXT' for c in COLUMNS)})")
+        self.conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_url ON {table} (url)")
+        self.conn.commit()
+
+    def _write_rows(self, rows: List[Dict]) -> None:
+        placeholders = ', '.join('?' for _ in COLUMNS)
+        with self.conn:
+            self.conn.executemany(
+                f"INSERT INTO {self.table} ({', '.join(COLUMNS)}) VALUES ({placeholders})",
+                [tuple(row[c] for c in COLUMNS) for row in rows]
+            )
+
+    def close(self) -> None:
+        super().close()
+        self.conn.close()
+
+class ParquetSink(BufferedSink):
+    """Parquet 파일에 flush마다 row group 하나씩 기록 (pyarrow 필요)"""
+
+    name = 'parquet'
+
+    def __init__(self, source: str, path: str, batch_size: int = 1000):
+        if not HAS_PYARROW:
+            raise ImportError("ParquetSink를 사용하려면 pyarrow를 설치하세요: pip install pyarrow")
+        super().__init__(source, path, batch_size)
+        self.schema = pa.schema([(c, pa.string()) for c in COLUMNS])
+        self.writer = None
+
+    def _write_rows(self, rows: List[Dict]) -> None:
+        if self.writer is None:
+            self.writer = pq.ParquetWriter(str(self.path), self.schema)
+        table = pa.Table.from_pydict({c: [row[c] for row in rows] for c in COLUMNS}, schema=self.schema)
+        self.writer.write_table(table)
+
+    def close(self) -> None:
+        super().close()
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+
+class NotionSink(Sink):
+    """기존 Notion 로거로 페이지 생성 (항목마다 전송)"""
+
+    name = 'notion'
+
+    def __init__(self, notion_logger):
+        self.logger = notion_logger
+
+    def write(self, item: Dict) -> None:
+        self.logger.save_to_notion(item)
+
+    async def write_async(self, item: Dict) -> None:
+        await self.logger.save_to_notion_async(item)
+
+    async def aclose(self) -> None:
+        await self.logger.aclose()
+
+class FanoutSink(Sink):
+    """여러 싱크에 같은 항목 기록 (한 싱크의 오류가 다른 싱크에 영향을 주지 않음)"""
+
+    name = 'fanout'
+
+    def __init__(self, sinks: List[Sink]):
+        self.sinks = sinks
+
+    def write(self, item: Dict) -> None:
+        for sink in self.sinks:
+            try:
+                sink.write(item)
+            except Exception as e:
+                metrics.incr(f'sink_{sink.name}_errors')
+                logger.error("%s 싱크 기록 실패: %s", sink.name, e)
+
+    async def write_async(self, item: Dict) -> None:
+        for sink in self.sinks:
+            try:
+                await sink.write_async(item)
+            except Exception as e:
+                metrics.incr(f'sink_{sink.name}_errors')
+                logger.error("%s 싱크 기록 실패: %s", sink.name, e)
+
+    def flush(self) -> None:
+        for sink in self.sinks:
+            try:
+                sink.flush()
+            except Exception as e:
+                logger.error("%s 싱크 flush 실패: %s", sink.name, e)
+
+    def close(self) -> None:
+        for sink in self.sinks:
+            try:
+                sink.close()
+            except Exception as e:
+                logger.error("%s 싱크 종료 실패: %s", sink.name, e)
+
+    async def aclose(self) -> None:
+        for sink in self.sinks:
+            try:
+                await sink.aclose()
+            except Exception as e:
+                logger.error("%s 싱크 종료 실패: %s", sink.name, e)
+
+def create_sink(names: List[str], source: str, output_dir: str, notion_logger=None,
+                batch_size: int = 1000) -> FanoutSink:
+    """이름 목록으로 싱크 구성 (파일명: <output_dir>/<source>_<시각>.<확장자>)
+
+    사용할 수 없는 싱크(pyarrow 미설치 등)는 경고 후 제외한다.
+    """
+    stem = Path(output_dir) / f"{source}_{datetime.now():%Y%m%d_%H%M%S}"
+    sinks: List[Sink] = []
+    for name in dict.fromkeys(names):
+        try:
+            if name == 'notion':
+                if notion_logger is None:
+                    raise ValueError("Notion 로거가 없습니다")
+                sinks.append(NotionSink(notion_logger))
+            elif name == 'jsonl':
+                sinks.append(JsonlSink(source, f"{stem}.jsonl", batch_size))
+            elif name == 'parquet':
+                sinks.append(ParquetSink(source, f"{stem}.parquet", batch_size))
+            elif name == 'sqlite':
+                sinks.append(SqliteSink(source, str(Path(output_dir) / 'summaries.db'), batch_size))
+            else:
+                raise ValueError(f"알 수 없는 싱크: {name} (사용 가능: {', '.join(SINK_NAMES)})")
+        except (ImportError, ValueError) as e:
+            logger.warning("싱크 제외 - %s", e)
+    return FanoutSink(sinks)
@@ -21,6 +21,11 @@ import re
 import json
 
 from test_config import Config
+from common.resilience import resilience, parse_retry_after
+from fetcher.pacer import HostPacer, THROTTLE_STATUS
+from fetcher.paginator import paginate
+from common.rate_limiter import RateLimiter
+from concurrent.futures import ThreadPoolExecutor
 
 # Example usage:
 class MediaSource(ABC):
@@ -128,6 +133,12 @@ class WebContent():
         """컨텐츠가 유효한지 확인"""
         if not content or len(content) < 100:
             return False
+        return not self._is_blocked(content)
+
+    def _is_blocked(self, content):
+        """봇 감지/보안 체크 페이지인지 확인"""
+        if not content:
+            return False
         
         # 봇 감지/보안 체크 키워드
         security_keywords = [
@@ -424,7 +435,8 @@ class PocketClient(WebContent):
         self.consumer_key = config.POCKET_CONSUMER_KEY
         self.access_token = config.POCKET_ACCESS_TOKEN
         self.base_url = "https://getpocket.com/v3"
-        self.all_items = []
+        # 고정 대기 대신 호스트별 적응형 간격 (제한 감지 시에만 느려짐)
+        self.pacer = HostPacer()
         print('#'*7+'PocketClient init'+'#'*7)
 
     def fetch_content(self, batch_size=500, state='all', detail_type='complete', sort='newest', offset=0, tags=None):
@@ -445,23 +457,42 @@ class PocketClient(WebContent):
         """단일 아이템의 웹 콘텐츠 수집"""
         for attempt in range(max_retries):
             try:
-                # 요청  딜
-                time.sleep(random.uniform(2, 6))
-                
-                content = self.fetch_web_content(item['url'])
+                # 제한이 감지되면 pacer가 다음 요청을 늦춤 (기존 고정 대기: 2~6초)
+                content = self.fetch_web_content(item['url'], baseline=4.0)
                 if self._is_valid_content(content):
                     print(f"성공: {item['title']}")
                     return content
                     
             except Exception as e:
                 print(f"시도 {attempt + 1}/{max_retries} 실패 ({item['url']}): {str(e)}")
-                if attempt < max_retries - 1:
-                    time.sleep(5 * (attempt + 1))  # 재시도마다 대기 시간 증가
                 continue
                 
         print(f"최종 실패: {item['url']}")
         return None
 
+    def fetch_web_content(self, url: str, baseline: float = 0.0) -> Optional[str]:
+        """웹 페이지 본문 내용 추출 (호스트별 적응형 간격 적용)"""
+        self.pacer.wait(url, baseline)
+        response = self.session.get(url, timeout=10)
+        if response.status_code in THROTTLE_STATUS:
+            self.pacer.throttled(url, parse_retry_after(response.headers))
+            print(f"요청 제한 ({response.status_code}): {url}")
+            return None
+        response.raise_for_status()
+        if self._is_blocked(response.text):
+            self.pacer.throttled(url)
+            print(f"봇 감지 페이지: {url}")
+            return None
+        self.pacer.success(url)
+        
+        soup = BeautifulSoup(response.text, 'html.parser')
+        for tag in soup(['script', 'style', 'meta', 'link']):
+            tag.decompose()
+        article = soup.find('article') or soup.find('main') or soup.find('div', class_='content')
+        text = (article or soup).get_text(separator='\n', strip=True)
+        lines = [line.strip() for line in text.splitlines() if line.strip()]
+        return '\n'.join(lines)
+
     def _get_items_with_params(self, batch_size, state, detail_type, sort, offset, tags):
         """Pocket API 파라미터 설정 및 아이템 수집"""
         params = {
@@ -480,13 +511,14 @@ class PocketClient(WebContent):
             else:
                 params['tag'] = tags
         
-        return self.get_all_items(params)
+        return self.iter_items(params)
 
     def get_contents(self, processed_items, max_retries=3):
         """processed_items의 각 URL에서 실제 컨텐츠 추출"""
         for item in tqdm(processed_items, desc="Fetching contents"):
             try:
-                content = self.fetch_web_content(item['url'])
+                # 기존 고정 대기(0.5~1.5초) 대신 pacer 간격 적용
+                content = self.fetch_web_content(item['url'], baseline=1.0)
                 if self._is_valid_content(content):
                     item['content'] = content
                 else:
@@ -496,55 +528,54 @@ class PocketClient(WebContent):
                 print(f"Error fetching content for {item['url']}: {e}")
                 item['content'] = None
                 
-            # 요청 간 짧은 딜레이 추가
-            time.sleep(random.uniform(0.5, 1.5))
-                
+        print(f"웹 콘텐츠 수집: {self.pacer.report()}")
         return processed_items
 
-    def get_items(self, params, max_retries: int = 3, retry_delay: int = 1) -> List[Dict]:
+    def get_items(self, params) -> List[Dict]:
+        # 일시적 오류는 지수 백오프로 재시도 (Retry-After 준수)
+        response = resilience.call(self._post_get, params, endpoint='pocket')
+        return response.json().get("list", {})
+
+    def _post_get(self, params) -> requests.Response:
         headers = {
             'Content-Type': 'application/json',
             'X-Accept': 'application/json'
         }
-        for attempt in range(max_retries):
-            try:
-                response = requests.post(f"{self.base_url}/get", json=params, headers=headers)
-                response.raise_for_status()
-                return response.json().get("list", {})
-            except requests.exceptions.RequestException as e:
-                if attempt == max_retries - 1:
-                    raise e
-                time.sleep(retry_delay)
+        response = requests.post(f"{self.base_url}/get", json=params, headers=headers, timeout=30)
+        response.raise_for_status()
+        return response
 
     def get_all_items(self, params, max_items = None,batch_size = 500, favorite = None, tag=None, content_type=None ):
-        total_items = 0
-        
+        return list(self.iter_items(params, max_items, batch_size, favorite, tag, content_type))
+
+    def iter_items(self, params, max_items=None, batch_size=500, favorite=None, tag=None, content_type=None,
+                   concurrency=4):
+        """Pocket 항목 스트리밍 (첫 페이지 이후 최대 concurrency개 페이지 병렬 요청)"""
+        params = dict(params)
         if favorite is not None:
             params['favorite'] = favorite
         if tag is not None:
             params['tag'] = tag
         if content_type is not None:
             params['contentType'] = content_type
+        batch_size = params.setdefault('count', batch_size)
+        start = params.get('offset', 0)
 
-        while True:
-            items_batch = self.get_items(params)
-            if not items_batch:
-                break
-            self.all_items.extend(items_batch.values())
-            total_items += len(items_batch)
-            
-            print(f"Retrieved {len(items_batch)} items. Total: {total_items}")
-            
-            if max_items and total_items >= max_items:
-                self.all_items = self.all_items[:max_items]
-                break
-            
-            params['offset'] += batch_size  # 다음 배치를 위해 offset 증가
-           # self.print_pocket_items(items_batch)
-            time.sleep(1)
-            if len(self.all_items) % 500 == 0:
-                print(f'n: {len(self.all_items)}\n')
-        return self.all_items
+        def fetch_page(page):
+            # 429는 resilience가 재시도, 제한이 감지된 경우에만 pacer가 간격을 둠 (기존 고정 대기 1초)
+            self.pacer.wait(self.base_url, baseline=1.0 if page else 0.0)
+            items = self.get_items(dict(params, offset=start + page * batch_size))
+            self.pacer.success(self.base_url)
+            # 빈 결과는 dict 대신 []로 옴
+            return list(items.values()) if items else []
+
+        total_items = 0
+        for item in paginate(fetch_page, batch_size, concurrency=concurrency, max_items=max_items):
+            total_items += 1
+            if total_items % batch_size == 0:
+                print(f"Retrieved {total_items} items")
+            yield item
+        print(f"Total: {total_items} items")
     
     def process_items(self, items):
         processed = []
@@ -570,12 +601,17 @@ class PocketClient(WebContent):
         return []
 
 class RaindropClient(WebContent):
+    PER_PAGE = 50  # raindrops 목록 페이지당 최대 항목 수
+    RATE_LIMIT_RPM = 120
+
     def __init__(self, config):
         super().__init__(config)
         self.api_key = config.RAINDROP_TOKEN
         self.base_url = "https://api.raindrop.io/rest/v1/"
         self.filename_collection = 'raindrop_collections.csv'
         self.filename_item = 'raindrop_items.csv'
+        # API 한도: 사용자당 분당 120회
+        self.limiter = RateLimiter(rpm=self.RATE_LIMIT_RPM)
 
     def fetch_content(self, identifier):
         """Raindrop API를 통해 아이템 가져오기"""
@@ -600,7 +636,6 @@ class RaindropClient(WebContent):
 
     def scrape_save(self):
         ## Export result
-        bookmarks = self.get_bookmarks()
         collections = self.get_collections()
         items = self.get_item_from_collection(collections)
         try:
@@ -608,6 +643,16 @@ class RaindropClient(WebContent):
             Utils.save_file(items, self.filename_item)
         except:
             print('save error')
+
+    def get_response(self, url, params=None):
+        """Raindrop API 목록 조회 (분당 요청 한도 준수, 일시적 오류는 재시도)"""
+        def request():
+            self.limiter.acquire()
+            response = requests.get(url, params=params, headers={"Authorization": f"Bearer {self.api_key}"},
+                                    timeout=30)
+            response.raise_for_status()
+            return response
+        return resilience.call(request, endpoint='raindrop').json().get('items', [])
  
     def get_collections(self):
         url = self.base_url +"collections"
@@ -654,30 +699,36 @@ class RaindropClient(WebContent):
             print(dict_collect)
             results.append(dict_collect)
         return results
+
+    def iter_collection_items(self, collect, concurrency=2):
+        """컬렉션의 raindrop 목록을 페이지 단위로 스트리밍 (항목별 상세 조회 없음)"""
+        url = self.base_url + f"raindrops/{collect['id']}"
+
+        def fetch_page(page):
+            return self.get_response(url, {'perpage': self.PER_PAGE, 'page': page})
+
+        for item in paginate(fetch_page, self.PER_PAGE, concurrency=concurrency):
+            # 목록 응답에 필요한 필드가 모두 있으므로 상세 조회 불필요
+            yield {
+                'collection': collect['title'],
+                'title': item.get('title'),
+                'type': item.get('type'),
+                'excerpt': item.get('excerpt'),
+                'note': item.get('note'),
+                'link': item.get('link'),
+                'id': item['_id'],
+                'cover': item.get('cover')
+            }
         
-    def get_item_from_collection(self, collections):
+    def get_item_from_collection(self, collections, concurrency=4):
+        """여러 컬렉션을 동시에 수집 (결과는 컬렉션 순서대로)"""
         items = []
-        for collect in tqdm(collections):
-            id = collect['id']
-            url = self.base_url+f'raindrops/{id}'
-            collect_items = self.get_response(url)
-            #collect_items = self.get_item_from_collection(collect['id'])
-            print('Items in the collection: ', len(collect_items))
-            for item in tqdm(collect_items):
-                id_item = item['_id']
-                url = self.base_url +"raindrop/{id_item}"
-                item_info = self.get_response(url)
-                dict_item ={
-                    'collection': collect['title'],
-                    'title': item['title'],
-                    'type': item['type'],
-                    'excerpt': item['excerpt'],
-                    'note': item['note'],
-                    'link': item['link'],
-                    'id': id_item,
-                    'cover': item['cover']
-                }
-                items.append(dict_item)
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            futures = [pool.submit(list, self.iter_collection_items(collect)) for collect in collections]
+            for collect, future in tqdm(zip(collections, futures), total=len(collections)):
+                collect_items = future.result()
+                print(f"Items in the collection ({collect['title']}): ", len(collect_items))
+                items.extend(collect_items)
         return items
     
 
@@ -1,10 +1,18 @@
 import time
 import os
 import re
+import sys
 from datetime import datetime
 import pandas as pd
 import tiktoken
 from typing import List, Union, Dict
+
+# 프로젝트 루트의 공용 모듈(common) 사용 (기존 모듈 이름을 가리지 않도록 뒤에 추가)
+_project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _project_root not in sys.path:
+    sys.path.append(_project_root)
+from common.sentences import SentenceSegmenter
+
 class Utils:
     def __init__(self):
         self.script_dir = self.get_script_directory()
@@ -34,56 +42,15 @@ class Utils:
         if not text:
             return []
         
-        # 먼저 기본적인 문장 종결 부호로 시도
-        sentences = [s.strip() for s in re.split(r'(?<=[.!?])\s+', text) if s.strip()]
-        
-        # 문장 종결 부호로 분리가 안 된 경우에만 다른 패턴 시도
-        if len(sentences) <= 1:
-            sentence_patterns = [
-                r'[\n]{2,}',             # 빈 줄
-                r'(?<=[;:])[\s\n]+',     # 세미콜론/콜론 뒤의 공백이나 줄바꿈
-                r'[\s]{2,}',             # 연속된 공백
-                r'(?<=[\,])[\s]+'        # 쉼표 뒤의 공백
-            ]
-            
-            current_text = text.strip()
-            for pattern in sentence_patterns:
-                sentences = [s.strip() for s in re.split(pattern, current_text) if s.strip()]
-                if len(sentences) > 1:
-                    break
-        
-        # 여전히 분리가 안 된 경우 단순 길이 기준 분할
-        if len(sentences) <= 1:
-            sentences = [text[i:i+max_length] for i in range(0, len(text), max_length)]
-        
-        # 청크 생성
-        chunks = []
-        current_chunk = ""
-        
-        for i in range(len(sentences)):
-            sentence = sentences[i].strip()
-            if not sentence:
-                continue
-                
-            potential_chunk = current_chunk + (" " if current_chunk else "") + sentence
-            
-            # 길이 체크 (토큰 또는 문자 기준)
-            if by_token:
-                current_length = Utils.num_tokens_from_string(potential_chunk, gpt_model)  # 토큰 계산 함수 필요
-                length_exceeded = current_length >= max_length
-            else:
-                length_exceeded = len(potential_chunk) >= max_length
-            
-            if length_exceeded and current_chunk:
-                chunks.append(current_chunk.strip())
-                current_chunk = sentence
-            else:
-                current_chunk = potential_chunk
-        
-        if current_chunk:
-            chunks.append(current_chunk.strip())
+        if by_token:
+            # 인코더는 한 번만 로드
+            encoding = tiktoken.encoding_for_model(gpt_model)
+            length_function = lambda s: len(encoding.encode(s))
+        else:
+            length_function = len
         
-        return chunks
+        # 문장 부호가 없는 한국어 자막도 종결 어미/휴지 기준으로 분리한 뒤 길이가 고른 청크로 묶음
+        return SentenceSegmenter().chunk(text, max_length, length_function)
     
     # @staticmethod
     # def prep_text():
@@ -261,28 +228,24 @@ class Utils:
             # 리스트 처리
             if isinstance(text, list):
                 if all(isinstance(item, dict) and 'text' in item for item in text):
-                    # 자막 딕셔너리 리스트 처리
-                    text_parts = []
+                    # 자막 딕셔너리 리스트 처리 (구간 사이 휴지는 줄바꿈으로 보존)
+                    segments = []
                     for entry in text:
                         cleaned_text = entry['text'].strip()
                         if clean_tags:
                             cleaned_text = re.sub(r'\[.*?\]', '', cleaned_text)
                             cleaned_text = re.sub(r'\(.*?\)', '', cleaned_text)
-                        
-                        if cleaned_text:
-                            if not cleaned_text[-1] in '.!?':
-                                cleaned_text += '.'
-                            text_parts.append(cleaned_text)
-                    text = ' '.join(text_parts)
+                        segments.append({**entry, 'text': cleaned_text})
+                    text = SentenceSegmenter().join_segments(segments)
                 else:
                     text = ' '.join(str(item).strip() for item in text if str(item).strip())
             
             elif not isinstance(text, str):
                 raise ValueError("입력은 문자열 또는 리스트 형식이어야 합니다")
 
-            # 기본 전처리
+            # 기본 전처리 (문장 경계로 쓰이는 줄바꿈은 유지)
             text = text.strip()
-            text = ' '.join(text.split())
+            text = '\n'.join(' '.join(line.split()) for line in text.splitlines() if line.strip())
             
             # 선택적 전처리
             if remove_special_chars:
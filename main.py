@@ -1,6 +1,8 @@
 # main.py
 
 import argparse
+import asyncio
+from functools import partial
 from pathlib import Path
 from typing import Optional, List, Dict
 from tqdm import tqdm
@@ -8,8 +10,21 @@ from tqdm import tqdm
 from config.config import Config
 from fetcher.fetch import YouTube, PocketClient, RaindropClient
 from fetcher.logger import YouTubeLogger, PocketLogger, RaindropLogger
+from fetcher.sinks import create_sink, SINK_NAMES
+from openai import OpenAI
 from summarizer.strategies import SummarizationStrategy
 from summarizer.schemas import SectionedSummarySchema
+from summarizer.dedup import DuplicateIndex
+from common.metrics import metrics
+from common.log import get_logger, configure_logging, lazy
+from common.usage import ledger, BudgetExceeded
+from common.batch import BatchRunner
+from common.rate_limiter import limiter
+from common.resilience import resilience
+from common.chunk_cache import chunk_cache
+from common.pipeline import overlap_writes
+
+log = get_logger('main')
 
 DEFAULT_YOUTUBE_PLAYLIST = "https://youtube.com/playlist?list=PLuLudIpu5Vin2cXj55NSzqdWceBQFxTso"
 DEFAULT_LIMIT = 5
@@ -35,6 +50,47 @@ def parse_arguments():
     parser.add_argument('--limit', type=int, default=DEFAULT_LIMIT,
                        help=f'가져올 항목 수 제한 (기본값: {DEFAULT_LIMIT})')
     
+    # 중복 탐지 옵션
+    parser.add_argument('--dedup_threshold', type=float, default=None,
+                       help='유사 중복 판단 임계값 0~1 (기본값: config.DEDUP_THRESHOLD)')
+    parser.add_argument('--no_dedup', action='store_true',
+                       help='유사 중복 탐지 비활성화')
+    
+    # 계측 옵션
+    parser.add_argument('--metrics_path', type=str, default=None,
+                       help='항목별 계측 JSONL 저장 경로 (기본값: config.METRICS_PATH)')
+    parser.add_argument('--metrics_port', type=int, default=None,
+                       help='Prometheus 텍스트 엔드포인트 포트 (옵션)')
+    parser.add_argument('--no_metrics', action='store_true',
+                       help='계측 JSONL 기록 비활성화')
+    
+    # 예산 옵션
+    parser.add_argument('--max_cost', type=float, default=None,
+                       help='실행당 최대 OpenAI 비용(USD), 초과 전 저렴한 모델로 전환 (기본값: config.MAX_COST)')
+    parser.add_argument('--max_tokens', type=int, default=None,
+                       help='실행당 최대 OpenAI 토큰 수 (기본값: config.MAX_TOKENS)')
+    parser.add_argument('--rpm', type=int, default=None,
+                       help='계정 분당 요청 한도, 모든 OpenAI 호출이 공유 (기본값: config.OPENAI_RPM)')
+    parser.add_argument('--tpm', type=int, default=None,
+                       help='계정 분당 토큰 한도 (기본값: config.OPENAI_TPM)')
+    
+    # Batch API 옵션
+    parser.add_argument('--batch', action='store_true',
+                       help='Pocket/Raindrop 요약을 OpenAI Batch API로 일괄 처리 (지연 최대 24시간, 비용 절반)')
+    
+    # 출력 옵션
+    parser.add_argument('--sinks', nargs='+', default=None, choices=SINK_NAMES,
+                       help='요약 저장 대상, 여러 개 지정 시 모두 기록 (기본값: config.SINKS)')
+    parser.add_argument('--sink_dir', type=str, default=None,
+                       help='JSONL/Parquet/SQLite 저장 경로 (기본값: config.SINK_DIR)')
+    
+    # 로깅 옵션
+    parser.add_argument('--log_level', type=str, default=None,
+                       choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
+                       help='로그 레벨 (기본값: config.LOG_LEVEL)')
+    parser.add_argument('--log_path', type=str, default=None,
+                       help='JSONL 로그 파일 경로 (옵션)')
+    
     args = parser.parse_args()
     
     # YouTube URL에서 ID 추출
@@ -48,48 +104,180 @@ def parse_arguments():
     
     return args
 
+def report_token_reduction(items: List[Dict]) -> None:
+    """본문 추출로 절감된 입력 토큰 합계 출력"""
+    stats = [item['token_stats'] for item in items if item.get('token_stats')]
+    if not stats:
+        return
+    raw_tokens = sum(s['raw_tokens'] for s in stats)
+    text_tokens = sum(s['text_tokens'] for s in stats)
+    reduction = 1 - text_tokens / raw_tokens if raw_tokens else 0.0
+    log.info("본문 추출 토큰 절감: %d -> %d 토큰 (%.1f%% 절감, %d개 항목)",
+             raw_tokens, text_tokens, reduction * 100, len(stats))
+
+def create_summarizer(config: Config) -> SummarizationStrategy:
+    """요약 전략 생성 (예산 부족 시 config.FALLBACK_MODEL 사용)"""
+    schema = SectionedSummarySchema(schema_type="full")
+    return SummarizationStrategy(config.GPT_MODEL, schema=schema, fallback_model=config.FALLBACK_MODEL)
+
+def budget_exhausted(remaining: int) -> bool:
+    """예산 소진 시 남은 항목 건너뜀"""
+    if ledger.exceeded():
+        log.warning("예산 소진 - 남은 %d개 항목 건너뜀", remaining)
+        return True
+    return False
+
+def prefetch_summaries(config: Config, summarizer: SummarizationStrategy, items: List[Dict],
+                       dedup: Optional[DuplicateIndex] = None) -> None:
+    """Batch API로 항목 요약을 미리 생성 (기존 요약을 재사용할 수 있는 중복 항목은 제외)"""
+    pending = []
+    for item in items:
+        if not item.get('text'):
+            continue
+        if dedup is not None:
+            match = dedup.find(dedup.fingerprint(item['text']))
+            if match and match['summary'] is not None:
+                continue
+        pending.append(item)
+    if not pending:
+        return
+    
+    runner = BatchRunner(OpenAI(), batch_dir=str(config.BATCH_DIR), poll_interval=config.BATCH_POLL_INTERVAL,
+                         timeout=config.BATCH_TIMEOUT)
+    try:
+        summaries = summarizer.summarize_batch([item['text'] for item in pending], runner)
+    except BudgetExceeded as e:
+        log.warning("예산 초과 - 배치 요약 생략, 항목별 요약으로 진행: %s", e)
+        return
+    for item, summary in zip(pending, summaries):
+        item['summary'] = summary
+        if dedup is not None:
+            dedup.add(item['url'], dedup.fingerprint(item['text']), summary)
+
+def create_dedup_index(config: Config) -> Optional[DuplicateIndex]:
+    """설정에 따라 유사 중복 탐지 인덱스 생성"""
+    if not config.ENABLE_DEDUP:
+        return None
+    return DuplicateIndex(threshold=config.DEDUP_THRESHOLD)
+
+def summarize_item(summarizer: SummarizationStrategy, text: str, key: str,
+                   dedup: Optional[DuplicateIndex] = None):
+    """유사 중복 콘텐츠는 기존 요약을 재사용하고 새 콘텐츠만 요약"""
+    if dedup is None:
+        return summarizer.summarize(text)
+    
+    fingerprint = dedup.fingerprint(text)
+    match = dedup.find(fingerprint)
+    if match and match['summary'] is not None:
+        metrics.incr('dedup_hits')
+        log.info("중복 콘텐츠: %s ≈ %s (유사도 %.2f) - 기존 요약 재사용", key, match['key'], match['similarity'])
+        return match['summary']
+    
+    summary = summarizer.summarize(text)
+    dedup.add(key, fingerprint, summary)
+    return summary
+
+def prepare_item(summarizer: SummarizationStrategy, dedup: Optional[DuplicateIndex], item: Dict) -> Optional[Dict]:
+    """Pocket/Raindrop 항목 요약 (저장할 항목 반환, 본문이 없거나 예산 초과면 None)"""
+    if item.get('fetch_seconds') is not None:
+        metrics.observe_stage('fetch', item['fetch_seconds'])
+    if not item.get('text'):
+        return None
+    metrics.set('text_chars', len(item['text']))
+    try:
+        if item.get('summary') is None:
+            with metrics.stage('summarize'):
+                item['summary'] = summarize_item(summarizer, item['text'], item['url'], dedup)
+    except BudgetExceeded as e:
+        metrics.mark_error(e)
+        log.warning("예산 초과 - 스킵: %s (%s)", item['url'], e)
+        return None
+    return item
+
+def create_output(config: Config, source: str, logger_class, database_id: Optional[str] = None):
+    """config.SINKS에 따라 저장 대상 구성 (Notion을 쓰지 않으면 Notion 로거도 만들지 않음)"""
+    logger = None
+    if 'notion' in config.SINKS:
+        logger = logger_class(config)
+        if database_id:
+            logger.change_database(database_id)
+    return create_sink(config.SINKS, source, config.SINK_DIR, logger, config.SINK_BATCH_SIZE)
+
+def run_pipeline(config: Config, sink, items, source: str, key, prepare) -> None:
+    """항목을 순서대로 준비(요약)하면서 저장은 비동기로 겹쳐 실행"""
+    async def run():
+        try:
+            await overlap_writes(items, source, key, prepare, sink.write_async,
+                                 max_pending=config.NOTION_MAX_PENDING_WRITES, stop=budget_exhausted)
+        finally:
+            await sink.aclose()
+    asyncio.run(run())
+
 def process_youtube(config: Config, video_id: Optional[str] = None, playlist_id: Optional[str] = None) -> None:
     """YouTube 비디오 처리"""
     youtube = YouTube(config)
-    logger = YouTubeLogger(config)
+    sink = create_output(config, 'youtube', YouTubeLogger)
     
     # 요약 설정
-    schema = SectionedSummarySchema(schema_type="full")
-    summarizer = SummarizationStrategy(config.GPT_MODEL, schema=schema)
+    summarizer = create_summarizer(config)
+    dedup = create_dedup_index(config)
     
     if video_id:
-        # 단일 비디오 처리
-        content = youtube.fetch_content(video_id)
-        if content and content.get('transcript'):
-            content['summary'] = summarizer.summarize(content['transcript'])
-            logger.save_to_notion(content)
+        # 단일 비디오 처리 (예산 초과 등으로 중단돼도 버퍼에 남은 기록을 쓰고 파일을 닫음)
+        try:
+            with metrics.item('youtube', video_id):
+                with metrics.stage('fetch'):
+                    content = youtube.fetch_content(video_id)
+                if content and content.get('transcript'):
+                    metrics.set('transcript_chars', len(content['transcript']))
+                    try:
+                        with metrics.stage('summarize'):
+                            content['summary'] = summarizer.summarize(content['transcript'])
+                    except BudgetExceeded as e:
+                        metrics.mark_error(e)
+                        log.warning("예산 초과 - 요약 건너뜀: %s", e)
+                        return
+                    sink.write(content)
+        finally:
+            sink.close()
     
     elif playlist_id:
         # 재생목록 처리
-        videos = youtube.fetch_playlist_videos(playlist_id)
-        print(f"\n총 {len(videos)}개 비디오 처리 중...")
+        with metrics.stage('playlist'):
+            videos = youtube.fetch_playlist_videos(playlist_id)
+        log.info("총 %d개 비디오 처리 중...", len(videos))
         
-        for video in tqdm(videos, desc="Processing videos"):
+        def prepare(video):
             try:
-                content = youtube.fetch_content(video['video_id'])
+                with metrics.stage('fetch'):
+                    content = youtube.fetch_content(video['video_id'])
                 if content and content.get('transcript'):
-                    content['summary'] = summarizer.summarize(content['transcript'])
-                    logger.save_to_notion(content)
-                else:
-                    print(f"스킵: {video['title']} (자막 없음)")
+                    metrics.set('transcript_chars', len(content['transcript']))
+                    with metrics.stage('summarize'):
+                        content['summary'] = summarize_item(
+                            summarizer, content['transcript'], content['url'], dedup)
+                    return content
+                metrics.set('skipped', 'no_transcript')
+                log.info("스킵: %s (자막 없음)", video['title'])
+            except BudgetExceeded as e:
+                metrics.mark_error(e)
+                log.warning("예산 초과 - 스킵: %s (%s)", video['title'], e)
             except Exception as e:
-                print(f"Error processing video {video['title']}: {e}")
-                continue
+                metrics.mark_error(e)
+                log.error("Error processing video %s: %s", video['title'], e)
+            return None
+        
+        run_pipeline(config, sink, tqdm(videos, desc="Processing videos"), 'youtube',
+                     lambda video: video['url'], prepare)
 
 def process_pocket(config: Config, tags: Optional[List[str]] = None, limit: int = 10) -> None:
     """Pocket 항목 처리"""
     pocket = PocketClient(config)
-    logger = PocketLogger(config)
-    logger.change_database(config.NOTION_DB_POCKET_ID)
+    sink = create_output(config, 'pocket', PocketLogger, config.NOTION_DB_POCKET_ID)
     
     # 요약 설정
-    schema = SectionedSummarySchema(schema_type="full")
-    summarizer = SummarizationStrategy(config.GPT_MODEL, schema=schema)
+    summarizer = create_summarizer(config)
+    dedup = create_dedup_index(config)
     
     params = {
         "count": limit,
@@ -100,42 +288,86 @@ def process_pocket(config: Config, tags: Optional[List[str]] = None, limit: int
         params["tags"] = tags
         
     items = pocket.fetch_content(params)
-    for item in tqdm(items, desc="Processing Pocket items"):
-        if item.get('text'):
-            item['summary'] = summarizer.summarize(item['text'])
-            logger.save_to_notion(item)
+    if config.ENABLE_BATCH:
+        prefetch_summaries(config, summarizer, items, dedup)
+    run_pipeline(config, sink, tqdm(items, desc="Processing Pocket items"), 'pocket',
+                 lambda item: item['url'], partial(prepare_item, summarizer, dedup))
+    report_token_reduction(items)
 
 def process_raindrop(config: Config, tags: Optional[List[str]] = None, limit: int = 10) -> None:
     """Raindrop 항목 처리"""
     raindrop = RaindropClient(config)
-    logger = RaindropLogger(config)
-    logger.change_database(config.NOTION_DB_RAINDROP_ID)
+    sink = create_output(config, 'raindrop', RaindropLogger, config.NOTION_DB_RAINDROP_ID)
     
     # 요약 설정
-    schema = SectionedSummarySchema(schema_type="full")
-    summarizer = SummarizationStrategy(config.GPT_MODEL, schema=schema)
+    summarizer = create_summarizer(config)
+    dedup = create_dedup_index(config)
     
     items = raindrop.fetch_content()[:limit]
-    for item in tqdm(items, desc="Processing Raindrop items"):
-        if item.get('text'):
-            item['summary'] = summarizer.summarize(item['text'])
-            logger.save_to_notion(item)
+    if config.ENABLE_BATCH:
+        prefetch_summaries(config, summarizer, items, dedup)
+    run_pipeline(config, sink, tqdm(items, desc="Processing Raindrop items"), 'raindrop',
+                 lambda item: item['url'], partial(prepare_item, summarizer, dedup))
+    report_token_reduction(items)
 
 def main():
     args = parse_arguments()
     config = Config()
+    if args.no_dedup:
+        config.ENABLE_DEDUP = False
+    if args.dedup_threshold is not None:
+        config.DEDUP_THRESHOLD = args.dedup_threshold
+    if args.no_metrics:
+        config.ENABLE_METRICS = False
+    if args.metrics_path:
+        config.METRICS_PATH = Path(args.metrics_path)
+    if args.metrics_port is not None:
+        config.METRICS_PORT = args.metrics_port
+    if args.batch:
+        config.ENABLE_BATCH = True
+    if args.max_cost is not None:
+        config.MAX_COST = args.max_cost
+    if args.max_tokens is not None:
+        config.MAX_TOKENS = args.max_tokens
+    if args.rpm is not None:
+        config.OPENAI_RPM = args.rpm
+    if args.tpm is not None:
+        config.OPENAI_TPM = args.tpm
+    if args.sinks:
+        config.SINKS = args.sinks
+    if args.sink_dir:
+        config.SINK_DIR = Path(args.sink_dir)
+    ledger.configure(max_cost=config.MAX_COST, max_tokens=config.MAX_TOKENS)
+    limiter.configure(rpm=config.OPENAI_RPM, tpm=config.OPENAI_TPM, headroom=config.RATE_LIMIT_HEADROOM)
+    resilience.configure(
+        max_attempts=config.RETRY_MAX_ATTEMPTS,
+        base_delay=config.RETRY_BASE_DELAY,
+        max_delay=config.RETRY_MAX_DELAY,
+        failure_threshold=config.CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout=config.CIRCUIT_RESET_TIMEOUT
+    )
+    chunk_cache.configure(config.CHUNK_CACHE_PATH)
+    if args.log_level:
+        config.LOG_LEVEL = args.log_level
+    if args.log_path:
+        config.LOG_PATH = args.log_path
+    configure_logging(
+        level=config.LOG_LEVEL,
+        path=config.LOG_PATH,
+        sample_first=config.LOG_SAMPLE_FIRST,
+        sample_every=config.LOG_SAMPLE_EVERY
+    )
+    metrics.configure(
+        path=config.METRICS_PATH if config.ENABLE_METRICS else None,
+        port=config.METRICS_PORT,
+        host=config.METRICS_HOST
+    )
     
-    print(f"\n=== 설정 ===")
-    print(f"소스: {args.source}")
     if args.source == 'youtube':
-        if args.video_id:
-            print(f"비디오 ID: {args.video_id}")
-        else:
-            print(f"재생목록 ID: {args.playlist_id}")
+        target = f"비디오 ID: {args.video_id}" if args.video_id else f"재생목록 ID: {args.playlist_id}"
     else:
-        print(f"태그: {args.tags}")
-        print(f"제한: {args.limit}개")
-    print("===========\n")
+        target = f"태그: {args.tags}, 제한: {args.limit}개"
+    log.info("=== 설정 === 소스: %s, %s", args.source, target)
     
     try:
         if args.source == 'youtube':
@@ -146,7 +378,13 @@ def main():
             process_raindrop(config, args.tags, args.limit)
             
     except Exception as e:
-        print(f"Error processing {args.source}: {e}")
+        log.error("Error processing %s: %s", args.source, e)
+    finally:
+        log.info("%s", lazy(metrics.report))
+        log.info("%s", lazy(ledger.report))
+        if config.ENABLE_METRICS:
+            log.info("계측 기록: %s", config.METRICS_PATH)
+        metrics.close()
 
 if __name__ == "__main__":
     main()
@@ -2,8 +2,12 @@
 
 from .strategies import SummarizationStrategy
 from .schemas import SectionedSummarySchema
+from .dedup import DuplicateIndex
+from .archive import SummaryArchive
 
 __all__ = [
     'SummarizationStrategy',
-    'SectionedSummarySchema'
+    'SectionedSummarySchema',
+    'DuplicateIndex',
+    'SummaryArchive'
 ]
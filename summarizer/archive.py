@@ -0,0 +1,193 @@
+import json
+import hashlib
+import argparse
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+def content_hash(summary, schema_type: str) -> str:
+    """요약 내용 주소 (스키마 종류 + 요약 본문의 blake2b)"""
+    body = summary if isinstance(summary, str) else json.dumps(summary, ensure_ascii=False, sort_keys=True)
+    return hashlib.blake2b(f"{schema_type}\0{body}".encode('utf-8'), digest_size=16).hexdigest()
+
+def dict_to_markdown(data: Dict, level: int = 1) -> str:
+    """Dictionary를 Markdown 형식으로 변환"""
+    md_content = []
+
+    for key, value in data.items():
+        # 헤더 레벨 (최대 6까지)
+        header = '#' * min(level, 6)
+
+        if isinstance(value, dict):
+            md_content.append(f"\n{header} {key}")
+            md_content.append(dict_to_markdown(value, level + 1))
+        elif isinstance(value, list):
+            md_content.append(f"\n{header} {key}")
+            for item in value:
+                if isinstance(item, dict):
+                    md_content.append(dict_to_markdown(item, level + 1))
+                else:
+                    md_content.append(f"- {item}")
+        else:
+            md_content.append(f"\n{header} {key}")
+            md_content.append(str(value))
+
+    return '\n'.join(md_content)
+
+class SummaryArchive:
+    """내용 주소 기반 요약 저장소
+
+    요약은 날짜별 append-only JSONL 파일(YYYY-MM-DD.jsonl)에 한 줄씩 기록한다. 같은 요약
+    본문(스키마 종류 포함)은 한 번만 저장하고, 이후 다른 항목이 같은 요약을 가지면 본문 없이
+    내용 해시만 기록한다. 같은 항목/스키마의 요약이 바뀌지 않았으면 아무것도 쓰지 않는다.
+    (항목 ID, schema_type) -> 최신 기록 색인은 index.jsonl에 append하며 열 때 메모리로 읽는다.
+    Markdown은 저장하지 않고 필요할 때 render_markdown으로 만든다.
+    """
+
+    INDEX_FILE = 'index.jsonl'
+
+    def __init__(self, root: str = 'summaries'):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        # (item_id, schema_type) -> 최신 색인 항목, 내용 해시 -> (파일명, 오프셋)
+        self.entries: Dict[Tuple[str, str], Dict] = {}
+        self.bodies: Dict[str, Tuple[str, int]] = {}
+        self._load_index()
+
+    def _load_index(self) -> None:
+        path = self.root / self.INDEX_FILE
+        if not path.exists():
+            return
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    self._apply(json.loads(line))
+
+    def _apply(self, entry: Dict) -> None:
+        self.entries[(entry['item_id'], entry['schema_type'])] = entry
+        if entry.get('body'):
+            self.bodies.setdefault(entry['hash'], (entry['file'], entry['offset']))
+
+    def put(self, item_id: str, schema_type: str, summary, title: str = None,
+            metadata: Dict = None) -> Optional[str]:
+        """요약 저장 (변경 없는 요약은 건너뜀)
+
+        Returns:
+            내용 해시 (저장할 필요가 없었으면 None)
+        """
+        digest = content_hash(summary, schema_type)
+        key = (item_id, schema_type)
+        with self._lock:
+            current = self.entries.get(key)
+            if current is not None and current['hash'] == digest:
+                return None
+
+            saved_at = datetime.now()
+            has_body = digest not in self.bodies
+            record = {
+                'hash': digest,
+                'item_id': item_id,
+                'schema_type': schema_type,
+                'title': title or item_id,
+                'saved_at': saved_at.isoformat(timespec='seconds'),
+                'metadata': metadata or {},
+            }
+            if has_body:
+                record['summary'] = summary
+            file_name = f"{saved_at:%Y-%m-%d}.jsonl"
+            with open(self.root / file_name, 'ab') as f:
+                offset = f.tell()
+                f.write((json.dumps(record, ensure_ascii=False) + '\n').encode('utf-8'))
+
+            entry = {k: record[k] for k in ('hash', 'item_id', 'schema_type', 'title', 'saved_at')}
+            entry.update({'file': file_name, 'offset': offset, 'body': has_body})
+            with open(self.root / self.INDEX_FILE, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            self._apply(entry)
+        return digest
+
+    def _read(self, file_name: str, offset: int) -> Dict:
+        with open(self.root / file_name, 'rb') as f:
+            f.seek(offset)
+            return json.loads(f.readline())
+
+    def get(self, item_id: str, schema_type: str = 'full') -> Optional[Dict]:
+        """항목의 최신 요약 기록 (summary 본문 포함), 없으면 None"""
+        entry = self.entries.get((item_id, schema_type))
+        if entry is None:
+            return None
+        record = self._read(entry['file'], entry['offset'])
+        if 'summary' not in record:
+            record['summary'] = self._read(*self.bodies[entry['hash']])['summary']
+        return record
+
+    def list_entries(self, schema_type: Optional[str] = None) -> List[Dict]:
+        """색인 항목 목록 (최근 저장 순)"""
+        entries = [e for e in self.entries.values() if schema_type is None or e['schema_type'] == schema_type]
+        return sorted(entries, key=lambda e: e['saved_at'], reverse=True)
+
+    def render_markdown(self, item_id: str, schema_type: str = 'full') -> Optional[str]:
+        """저장된 요약을 Markdown으로 변환"""
+        record = self.get(item_id, schema_type)
+        if record is None:
+            return None
+        summary = record['summary']
+        if isinstance(summary, str):
+            try:
+                summary = json.loads(summary)
+            except ValueError:
+                pass
+        return dict_to_markdown({
+            'title': record['title'],
+            'summary': summary,
+            'schema_type': record['schema_type'],
+            'timestamp': record['saved_at'],
+            'metadata': record['metadata'],
+        })
+
+    def rebuild_index(self) -> int:
+        """날짜별 파일을 다시 읽어 색인 재생성 (색인 기록 전에 중단된 경우 등), 기록 수 반환"""
+        with self._lock:
+            self.entries, self.bodies = {}, {}
+            entries = []
+            for path in sorted(self.root.glob('????-??-??.jsonl')):
+                offset = 0
+                with open(path, 'rb') as f:
+                    for line in f:
+                        if line.strip():
+                            record = json.loads(line)
+                            entry = {k: record[k] for k in ('hash', 'item_id', 'schema_type', 'title', 'saved_at')}
+                            entry.update({'file': path.name, 'offset': offset, 'body': 'summary' in record})
+                            entries.append(entry)
+                            self._apply(entry)
+                        offset += len(line)
+            with open(self.root / self.INDEX_FILE, 'w', encoding='utf-8') as f:
+                f.writelines(json.dumps(entry, ensure_ascii=False) + '\n' for entry in entries)
+        return len(entries)
+
+def main():
+    parser = argparse.ArgumentParser(description='요약 저장소 조회')
+    parser.add_argument('--root', type=str, default='summaries', help='저장소 경로 (기본값: summaries)')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    list_parser = subparsers.add_parser('list', help='저장된 요약 목록')
+    list_parser.add_argument('--schema_type', type=str, default=None)
+    show_parser = subparsers.add_parser('show', help='요약을 Markdown으로 출력')
+    show_parser.add_argument('item_id', type=str)
+    show_parser.add_argument('--schema_type', type=str, default='full')
+    subparsers.add_parser('reindex', help='날짜별 파일로 색인 재생성')
+    args = parser.parse_args()
+
+    archive = SummaryArchive(args.root)
+    if args.command == 'list':
+        for entry in archive.list_entries(args.schema_type):
+            print(f"{entry['saved_at']}  {entry['schema_type']:<8} {entry['item_id']}  {entry['title']}")
+    elif args.command == 'show':
+        markdown = archive.render_markdown(args.item_id, args.schema_type)
+        print(markdown if markdown is not None else f"요약 없음: {args.item_id} ({args.schema_type})")
+    elif args.command == 'reindex':
+        print(f"색인 재생성: {archive.rebuild_index()}개 기록")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+import time
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+from common.metrics import metrics
+from common.usage import ledger, estimate_tokens, cached_tokens
+from common.rate_limiter import limiter
+
+class MetricsCallbackHandler(BaseCallbackHandler):
+    """LangChain LLM 호출별 토큰 수와 소요 시간을 metrics와 사용량 장부에 기록"""
+
+    def __init__(self):
+        self._started: Dict[UUID, float] = {}
+
+    def on_llm_start(self, serialized: Dict[str, Any], prompts: List[str], *, run_id: UUID, **kwargs) -> None:
+        self._started[run_id] = time.perf_counter()
+
+    def on_chat_model_start(self, serialized: Dict[str, Any], messages: List[List[Any]], *,
+                            run_id: UUID, **kwargs) -> None:
+        self._started[run_id] = time.perf_counter()
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs) -> None:
+        started = self._started.pop(run_id, None)
+        llm_output = response.llm_output or {}
+        usage = llm_output.get('token_usage') or {}
+        model = llm_output.get('model_name', '')
+        cached = cached_tokens(usage)
+        metrics.observe_llm(
+            model,
+            usage.get('prompt_tokens', 0),
+            usage.get('completion_tokens', 0),
+            time.perf_counter() - started if started is not None else None,
+            cached_tokens=cached
+        )
+        ledger.record(model, usage.get('prompt_tokens', 0), usage.get('completion_tokens', 0), cached_tokens=cached)
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs) -> None:
+        self._started.pop(run_id, None)
+        metrics.incr('llm_errors')
+
+class RateLimitCallbackHandler(BaseCallbackHandler):
+    """LLM 호출 직전 전역 RPM/TPM 스케줄러에서 실행 시점을 받고, 응답 후 실제 토큰 수로 보정"""
+
+    def __init__(self, response_tokens: int = 500):
+        """
+        Args:
+            response_tokens: max_tokens가 없을 때 사용할 예상 응답 토큰 수
+        """
+        self.response_tokens = response_tokens
+        self._estimated: Dict[UUID, int] = {}
+
+    def _acquire(self, run_id: UUID, texts: List[str], invocation_params: Optional[Dict]) -> None:
+        max_tokens = (invocation_params or {}).get('max_tokens') or self.response_tokens
+        estimated = sum(estimate_tokens(text) for text in texts) + max_tokens
+        self._estimated[run_id] = estimated
+        limiter.acquire(estimated)
+
+    def on_llm_start(self, serialized: Dict[str, Any], prompts: List[str], *, run_id: UUID, **kwargs) -> None:
+        self._acquire(run_id, prompts, kwargs.get('invocation_params'))
+
+    def on_chat_model_start(self, serialized: Dict[str, Any], messages: List[List[Any]], *,
+                            run_id: UUID, **kwargs) -> None:
+        texts = [str(message.content) for batch in messages for message in batch]
+        self._acquire(run_id, texts, kwargs.get('invocation_params'))
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs) -> None:
+        estimated = self._estimated.pop(run_id, None)
+        if estimated is not None:
+            usage = (response.llm_output or {}).get('token_usage') or {}
+            limiter.reconcile(estimated, usage.get('total_tokens', estimated))
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs) -> None:
+        # 실패한 요청은 토큰을 소비하지 않은 것으로 보정
+        estimated = self._estimated.pop(run_id, None)
+        if estimated is not None:
+            limiter.reconcile(estimated, 0)
@@ -0,0 +1,101 @@
+import re
+import hashlib
+from collections import Counter
+from typing import Dict, List, Optional
+
+class DuplicateIndex:
+    """SimHash 기반 유사 중복 콘텐츠 탐지 인덱스
+
+    64비트 SimHash 지문을 밴드로 나누어 저장한다. 해밍 거리가 d 이하인 두 지문은
+    d+1개 밴드 중 최소 하나가 반드시 일치하므로(비둘기집 원리), 일치하는 밴드를
+    가진 후보만 비교하면 전체 항목을 훑지 않고도 임계값 이내의 중복을 모두 찾는다.
+    """
+
+    FINGERPRINT_BITS = 64
+
+    def __init__(self, threshold: float = 0.9, shingle_size: int = 3):
+        """
+        Args:
+            threshold: 중복으로 판단할 최소 유사도 (0~1, 1 - 해밍 거리/64)
+            shingle_size: 지문 계산에 사용할 단어 n-gram 크기
+        """
+        if not 0 < threshold <= 1:
+            raise ValueError(f"threshold는 0보다 크고 1 이하여야 합니다: {threshold}")
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        self.max_distance = int((1 - threshold) * self.FINGERPRINT_BITS)
+        self.bands = self._make_bands(self.max_distance + 1)
+        self.entries: List[Dict] = []
+        self.buckets: Dict[tuple, List[int]] = {}
+
+    def _make_bands(self, n_bands: int) -> List[tuple]:
+        """64비트를 n개의 (shift, mask) 밴드로 균등 분할"""
+        n_bands = min(n_bands, self.FINGERPRINT_BITS)
+        bands = []
+        start = 0
+        for i in range(n_bands):
+            width = (self.FINGERPRINT_BITS - start) // (n_bands - i)
+            bands.append((start, (1 << width) - 1))
+            start += width
+        return bands
+
+    def _features(self, text: str) -> Counter:
+        """소문자 단어 n-gram 특성 추출"""
+        words = re.findall(r'\w+', text.lower())
+        n = self.shingle_size
+        if len(words) < n:
+            return Counter([' '.join(words)]) if words else Counter()
+        return Counter(' '.join(words[i:i + n]) for i in range(len(words) - n + 1))
+
+    def fingerprint(self, text: str) -> int:
+        """텍스트의 64비트 SimHash 지문 계산"""
+        weights = [0] * self.FINGERPRINT_BITS
+        for feature, count in self._features(text).items():
+            digest = hashlib.blake2b(feature.encode('utf-8'), digest_size=8).digest()
+            h = int.from_bytes(digest, 'big')
+            for bit in range(self.FINGERPRINT_BITS):
+                if h >> bit & 1:
+                    weights[bit] += count
+                else:
+                    weights[bit] -= count
+
+        fingerprint = 0
+        for bit, weight in enumerate(weights):
+            if weight > 0:
+                fingerprint |= 1 << bit
+        return fingerprint
+
+    def similarity(self, a: int, b: int) -> float:
+        """두 지문의 유사도 (1 - 해밍 거리/64)"""
+        return 1 - bin(a ^ b).count('1') / self.FINGERPRINT_BITS
+
+    def find(self, fingerprint: int) -> Optional[Dict]:
+        """임계값 이상으로 유사한 기존 항목 중 가장 유사한 항목 반환"""
+        best, best_similarity = None, -1.0
+        seen = set()
+        for band, (shift, mask) in enumerate(self.bands):
+            for idx in self.buckets.get((band, fingerprint >> shift & mask), []):
+                if idx in seen:
+                    continue
+                seen.add(idx)
+                similarity = self.similarity(fingerprint, self.entries[idx]['fingerprint'])
+                if similarity >= self.threshold and similarity > best_similarity:
+                    best, best_similarity = self.entries[idx], similarity
+
+        if best is None:
+            return None
+        return {**best, 'similarity': best_similarity}
+
+    def add(self, key: str, fingerprint: int, summary=None) -> None:
+        """항목과 요약 결과 등록"""
+        idx = len(self.entries)
+        self.entries.append({
+            'key': key,
+            'fingerprint': fingerprint,
+            'summary': summary,
+        })
+        for band, (shift, mask) in enumerate(self.bands):
+            self.buckets.setdefault((band, fingerprint >> shift & mask), []).append(idx)
+
+    def __len__(self) -> int:
+        return len(self.entries)
@@ -19,9 +19,16 @@ class SectionedSummarySchema(SummarySchema):
         """
         self.schema_type = schema_type
         self.config = config
+        self._schema = None
         
     def get_schema(self) -> Dict:
-        """스키마 가져오기"""
+        """스키마 가져오기 (처음 호출할 때 한 번만 생성)"""
+        if self._schema is None:
+            self._schema = self._create_schema()
+        return self._schema
+    
+    def _create_schema(self) -> Dict:
+        """schema_type에 맞는 스키마 생성"""
         if self.config:
             schemas = self.config.create_schema()
             if self.schema_type == "section":
@@ -1,16 +1,174 @@
-from typing import List
+import re
+import zlib
+from typing import Callable, List
+import numpy as np
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain.docstore.document import Document
+from common.sentences import SentenceSegmenter
+
+class TopicSplitter:
+    """TextTiling 방식의 어휘 응집도로 주제 전환 지점에서 텍스트 분할
+
+    문장마다 해싱된 단어 벡터를 만들고, 각 문장 경계 앞뒤 window 문장의 벡터 합
+    사이 코사인 유사도를 NumPy로 한 번에 계산한다. 유사도가 주변보다 깊게
+    떨어지는 지점(depth score)을 주제 전환으로 보고, 청크 크기 제한 안에서
+    가장 깊은 지점을 청크 경계로 선택한다. 네트워크나 임베딩 모델은 사용하지 않는다.
+    """
+
+    TOKEN_PATTERN = re.compile(r'\w+')
+    ASCII_PATTERN = re.compile(r'[a-z0-9_]+')
+
+    def __init__(self, chunk_size: int = 4000, min_chunk_ratio: float = 0.5, window: int = 3,
+                 n_features: int = 2048, paragraph_bonus: float = 0.2,
+                 length_function: Callable[[str], int] = len):
+        """
+        Args:
+            chunk_size: 청크당 최대 길이 (length_function 기준)
+            min_chunk_ratio: 주제 경계를 찾을 최소 청크 길이 비율
+            window: 응집도 비교에 사용할 경계 앞뒤 문장 수
+            n_features: 단어 해싱 차원 수
+            paragraph_bonus: 문단 경계에 더하는 depth score 가중치
+            length_function: 길이 계산 함수 (문자 수 또는 토큰 수)
+        """
+        self.chunk_size = chunk_size
+        self.min_chunk_ratio = min_chunk_ratio
+        self.window = window
+        self.n_features = n_features
+        self.paragraph_bonus = paragraph_bonus
+        self.length_function = length_function
+        self.segmenter = SentenceSegmenter()
+
+    def split_sentences(self, text: str) -> List[str]:
+        """문장 단위 분리 (문장 부호가 없는 한국어 자막은 종결 어미와 줄바꿈 기준)"""
+        return self.segmenter.split(text)
+
+    def _split_paragraphs(self, text: str):
+        """문단별 문장 목록과 문단 마지막 문장 여부 반환"""
+        sentences, paragraph_ends = [], []
+        for para in text.split('\n\n'):
+            para_sentences = []
+            for sentence in self.split_sentences(para):
+                para_sentences.extend(self._split_oversized(sentence))
+            if para_sentences:
+                sentences.extend(para_sentences)
+                paragraph_ends.extend([False] * (len(para_sentences) - 1) + [True])
+        return sentences, paragraph_ends
+
+    def _split_oversized(self, sentence: str) -> List[str]:
+        """청크 크기를 넘는 문장을 단어 경계에서 분할"""
+        return self.segmenter.split_long(sentence, self.chunk_size, self.length_function)
+
+    def _terms(self, sentence: str) -> List[str]:
+        """단어 토큰 추출 (한글/CJK는 조사 변화를 흡수하도록 2-gram 사용)"""
+        terms = []
+        for token in self.TOKEN_PATTERN.findall(sentence.lower()):
+            if self.ASCII_PATTERN.fullmatch(token):
+                if len(token) > 2:
+                    terms.append(token)
+            elif len(token) < 3:
+                terms.append(token)
+            else:
+                terms.extend(token[i:i + 2] for i in range(len(token) - 1))
+        return terms
+
+    def _term_matrix(self, sentences: List[str]) -> np.ndarray:
+        """문장별 해싱 단어 빈도 행렬 (n_sentences x n_features)"""
+        rows, cols = [], []
+        for i, sentence in enumerate(sentences):
+            for term in self._terms(sentence):
+                rows.append(i)
+                cols.append(zlib.crc32(term.encode('utf-8')) % self.n_features)
+        matrix = np.zeros((len(sentences), self.n_features), dtype=np.float32)
+        if rows:
+            np.add.at(matrix, (np.array(rows), np.array(cols)), 1.0)
+        return matrix
+
+    def depth_scores(self, sentences: List[str]) -> np.ndarray:
+        """각 문장 경계(i와 i+1 사이)의 주제 전환 depth score 계산"""
+        n = len(sentences)
+        if n < 2:
+            return np.zeros(0, dtype=np.float32)
+
+        w = self.window
+        matrix = self._term_matrix(sentences)
+        cumsum = np.vstack([np.zeros((1, self.n_features), dtype=np.float32),
+                            np.cumsum(matrix, axis=0)])
+
+        # 경계 i 기준 왼쪽 [i-w+1, i], 오른쪽 [i+1, i+w] 문장 벡터 합
+        gaps = np.arange(n - 1)
+        left = cumsum[gaps + 1] - cumsum[np.maximum(gaps + 1 - w, 0)]
+        right = cumsum[np.minimum(gaps + 1 + w, n)] - cumsum[gaps + 1]
+        norms = np.linalg.norm(left, axis=1) * np.linalg.norm(right, axis=1)
+        similarity = np.divide(np.einsum('ij,ij->i', left, right), norms,
+                               out=np.zeros(n - 1, dtype=np.float32), where=norms > 0)
+
+        # 이동 평균으로 평활화
+        if len(similarity) >= 3:
+            padded = np.pad(similarity, 1, mode='edge')
+            similarity = np.convolve(padded, np.ones(3) / 3, mode='valid')
+
+        # 주변 window 범위의 최고점 대비 하락 폭
+        padded = np.pad(similarity, w, mode='edge')
+        windows = np.lib.stride_tricks.sliding_window_view(padded, w + 1)
+        left_peak = windows[:len(similarity)].max(axis=1)
+        right_peak = windows[w:w + len(similarity)].max(axis=1)
+        return (left_peak - similarity) + (right_peak - similarity)
+
+    def split_text(self, text: str) -> List[str]:
+        """주제 전환 지점을 기준으로 청크 크기 제한 내에서 분할"""
+        sentences, paragraph_ends = self._split_paragraphs(text)
+        if not sentences:
+            return []
+
+        depths = self.depth_scores(sentences)
+        depths = depths + self.paragraph_bonus * np.array(paragraph_ends[:-1], dtype=np.float32)
+
+        # 문장 사이 구분자(줄바꿈) 1자를 포함한 누적 길이
+        lengths = np.array([self.length_function(s) + 1 for s in sentences])
+        cumlen = np.concatenate([[0], np.cumsum(lengths)])
+        min_length = self.chunk_size * self.min_chunk_ratio
+
+        chunks = []
+        start = 0
+        n = len(sentences)
+        while start < n:
+            # 청크 크기 안에 들어가는 마지막 끝 위치 (exclusive)
+            limit = int(np.searchsorted(cumlen, cumlen[start] + self.chunk_size + 1, side='right')) - 1
+            end_max = max(min(limit, n), start + 1)
+            if end_max >= n:
+                end = n
+            else:
+                end_min = int(np.searchsorted(cumlen, cumlen[start] + min_length, side='left'))
+                end_min = min(max(end_min, start + 1), end_max)
+                # 경계 end는 문장 end-1과 end 사이 = depth 인덱스 end-1
+                candidates = depths[end_min - 1:end_max]
+                end = end_min + int(np.argmax(candidates)) if len(candidates) else end_max
+            chunks.append('\n'.join(sentences[start:end]))
+            start = end
+
+        return chunks
 
 class SectionSplitter:
     """텍스트를 의미 단위로 분할"""
-    
-    def __init__(self, chunk_size: int = 1000, chunk_overlap: int = 200):
-        self.splitter = RecursiveCharacterTextSplitter(
-            chunk_size=chunk_size,
-            chunk_overlap=chunk_overlap,
-            separators=["\n\n", "\n", ".", "!", "?"]
-        )
-    
+
+    def __init__(self, chunk_size: int = 1000, chunk_overlap: int = 200, semantic: bool = True):
+        """
+        Args:
+            chunk_size: 청크당 최대 문자 수
+            chunk_overlap: 문자 기반 분할 시 청크 간 중복 문자 수
+            semantic: 주제 전환 지점 기준 분할 사용 여부 (False면 문자 기반 분할)
+        """
+        self.semantic = semantic
+        if semantic:
+            self.splitter = TopicSplitter(chunk_size=chunk_size)
+        else:
+            self.splitter = RecursiveCharacterTextSplitter(
+                chunk_size=chunk_size,
+                chunk_overlap=chunk_overlap,
+                separators=["\n\n", "\n", ".", "!", "?"]
+            )
+
     def split(self, text: str) -> List[Document]:
-        return self.splitter.create_documents([text]) 
\ No newline at end of file
+        if self.semantic:
+            return [Document(page_content=chunk) for chunk in self.splitter.split_text(text)]
+        return self.splitter.create_documents([text])
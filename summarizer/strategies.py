@@ -1,6 +1,6 @@
 # summarizer/strategies.py
 
-from typing import Dict, List, Union
+from typing import Dict, List, Optional, Union
 from langchain.docstore.document import Document
 from langchain.chains import load_summarize_chain
 from langchain.prompts import PromptTemplate
@@ -10,23 +10,38 @@ from langchain.text_splitter import (
     SpacyTextSplitter,
     TokenTextSplitter
 )
-import json
+import logging
 from pathlib import Path
-from datetime import datetime
+from .section_splitter import TopicSplitter
+from .callbacks import MetricsCallbackHandler, RateLimitCallbackHandler
+from .archive import SummaryArchive, dict_to_markdown
+from common.metrics import metrics
+from common.log import get_logger, lazy
+from common.usage import ledger, estimate_tokens, context_window, BudgetExceeded
+from common.resilience import resilience
+from common.chunk_cache import chunk_cache
+from common.prompts import CompiledPrompt, PromptRegistry
 import re
 
+logger = get_logger(__name__)
+
 class SummarizationStrategy:
     """요약 전략 기본 클래스"""
     
-    def __init__(self, model_name: str, schema=None, max_length: int = None, save_dir: str = None, verbose: bool = False):
-        print(f"\n=== 요약 전략 초기화 ===")
-        print(f"모델: {model_name}")
-        print(f"최대 길이: {max_length if max_length else '제한 없음'}")
-        
-        self.llm = ChatOpenAI(
-            model=model_name,
-            temperature=0.2
-        )
+    # 예산 확인 시 호출당 예상 응답 토큰 수
+    ESTIMATED_RESPONSE_TOKENS = 500
+    # 프롬프트 템플릿의 출력 언어
+    OUTPUT_LANGUAGE = 'ko'
+    
+    def __init__(self, model_name: str, schema=None, max_length: int = None, save_dir: str = None, verbose: bool = False,
+                 fallback_model: str = None):
+        logger.info("요약 전략 초기화: 모델 %s, 최대 길이 %s", model_name, max_length if max_length else '제한 없음')
+        
+        self.model_name = model_name
+        self.llm = self._create_llm(model_name)
+        # 예산이 부족할 때 사용할 저렴한 모델
+        self.fallback_model = fallback_model
+        self._fallback_llm = None
         self.schema = schema
         self.max_length = max_length
         self.verbose = verbose
@@ -36,77 +51,83 @@ class SummarizationStrategy:
         
         # 저장 경로 설정
         self.save_dir = Path(save_dir) if save_dir else Path("summaries")
-        self.save_dir.mkdir(parents=True, exist_ok=True)
+        self.archive = SummaryArchive(self.save_dir)
         
         # 최대 길이 제한 (한글 기준 약 5000자)
         if max_length and max_length > 5000:
-            print(f"Warning: max_length {max_length}가 너무 큽니다. 5000자로 제한합니다.")
+            logger.warning("max_length %s가 너무 큽니다. 5000자로 제한합니다.", max_length)
             self.max_length = 5000
         else:
             self.max_length = max_length
         
         self.schema_type = schema.schema_type if schema else "default"  # schema type 저장
-        self.prompt_shown = False  # prompt 출력 여부 추적
+        self.prompts = PromptRegistry()  # (schema_type, content_type, 언어, 모델)별 프롬프트
     
-    def _create_text_splitter(self, chunk_size: int = 4000):
-        """의미 기반 텍스트 분할기 생성"""
-        # 문장 단위로 분할하되, 특수 구분자도 고려
-        separators = [
-            "\n\n",  # 단락
-            "\n",    # 줄바꿈
-            ".",     # 문장 끝
-            "。",    # 한자 문장 끝
-            "!",     # 감탄문
-            "?",     # 의문문
-            ";",     # 세미콜론
-            ",",     # 쉼표
-            " ",     # 공백
-            ""       # 문자 단위
-        ]
-        
-        return RecursiveCharacterTextSplitter(
-            separators=separators,
-            chunk_size=chunk_size,
-            chunk_overlap=200,
-            length_function=len,
-            is_separator_regex=False
+    @staticmethod
+    def _create_llm(model_name: str) -> ChatOpenAI:
+        return ChatOpenAI(
+            model=model_name,
+            temperature=0.2,
+            # OpenAI SDK 재시도 (지수 백오프 + jitter, Retry-After 준수)
+            max_retries=resilience.max_attempts - 1,
+            callbacks=[MetricsCallbackHandler(),
+                       RateLimitCallbackHandler(SummarizationStrategy.ESTIMATED_RESPONSE_TOKENS)]
         )
     
-    def _split_text(self, text: str) -> List[str]:
-        """텍스트를 의미 단위로 분할"""
-        # 1. 문단 단위로 먼저 분리
-        paragraphs = text.split('\n\n')
-        
-        chunks = []
-        current_chunk = []
-        current_length = 0
+    def _estimate_usage(self, chunks: List[str], chain_type: str) -> tuple:
+        """체인 실행 시 예상 (입력, 출력) 토큰 수"""
+        template_tokens = self._compiled_prompt().fixed_tokens
+        response = self.ESTIMATED_RESPONSE_TOKENS
+        text_tokens = sum(estimate_tokens(chunk) for chunk in chunks)
+        if chain_type == "stuff" or len(chunks) == 1:
+            return text_tokens + template_tokens, response
+        # map 단계(청크별) + combine 단계(청크 요약 통합)
+        prompt_tokens = text_tokens + template_tokens * len(chunks) + response * len(chunks) + template_tokens
+        return prompt_tokens, response * (len(chunks) + 1)
+    
+    def _plan_for_budget(self, chunks: List[str]) -> tuple:
+        """남은 예산에 맞는 (LLM, 체인 종류) 선택
         
-        for para in paragraphs:
-            # 2. 문장 단위로 분리
-            sentences = re.split(r'(?<=[.!?。])\s+', para)
-            
-            for sentence in sentences:
-                sentence = sentence.strip()
-                if not sentence:
+        기본 모델의 map_reduce가 예산을 넘으면 저렴한 모델로 바꾸고, 전체 텍스트가
+        컨텍스트에 들어가면 호출 수가 가장 적은 stuff 체인을 사용한다.
+        """
+        if not ledger.limited or ledger.allows(self.model_name, *self._estimate_usage(chunks, "map_reduce")):
+            return self.llm, "map_reduce"
+        
+        if self.fallback_model:
+            if self._fallback_llm is None:
+                self._fallback_llm = self._create_llm(self.fallback_model)
+            for chain_type in ("stuff", "map_reduce"):
+                prompt_tokens, response_tokens = self._estimate_usage(chunks, chain_type)
+                window = context_window(self.fallback_model)
+                if chain_type == "stuff" and (window is None or prompt_tokens + response_tokens > window):
                     continue
-                    
-                # 현재 청크가 너무 커지면 새로운 청크 시작
-                if current_length + len(sentence) > 4000:
-                    if current_chunk:
-                        chunks.append('\n'.join(current_chunk))
-                    current_chunk = [sentence]
-                    current_length = len(sentence)
-                else:
-                    current_chunk.append(sentence)
-                    current_length += len(sentence)
+                if ledger.allows(self.fallback_model, prompt_tokens, response_tokens):
+                    metrics.incr('budget_fallbacks')
+                    logger.warning("예산 부족 - %s (%s)로 전환", self.fallback_model, chain_type)
+                    return self._fallback_llm, chain_type
         
-        # 마지막 청크 추가
-        if current_chunk:
-            chunks.append('\n'.join(current_chunk))
-        
-        return chunks
+        raise BudgetExceeded(f"남은 예산으로 요약할 수 없습니다 (청크 {len(chunks)}개)")
+    
+    def _create_text_splitter(self, chunk_size: int = 4000) -> TopicSplitter:
+        """주제 전환 지점 기반 텍스트 분할기 생성"""
+        # 문장 단위로 나눈 뒤, 청크 크기 안에서 어휘 응집도가 가장 크게 떨어지는 곳에서 분할
+        return TopicSplitter(chunk_size=chunk_size)
+    
+    def _split_text(self, text: str) -> List[str]:
+        """텍스트를 의미 단위로 분할"""
+        return self.text_splitter.split_text(text)
+    
+    def _compiled_prompt(self) -> CompiledPrompt:
+        """현재 스키마/콘텐츠 타입/언어/모델의 프롬프트 (처음 한 번만 생성)"""
+        key = (self.schema_type, getattr(self, 'content_type', None), self.OUTPUT_LANGUAGE, self.model_name)
+        return self.prompts.get(key, self._build_structured_prompt)
     
     def _create_structured_prompt(self) -> PromptTemplate:
+        """스키마 기반 프롬프트"""
+        return self._compiled_prompt().prompt
+    
+    def _build_structured_prompt(self) -> CompiledPrompt:
         """스키마 기반 프롬프트 생성"""
         
         # 기본 템플릿
@@ -165,6 +186,9 @@ class SummarizationStrategy:
             """
         }
         
+        # 고정된 부분(지시사항, 유형별 규칙)을 앞에 두고 청크마다 바뀌는 텍스트는 맨 뒤에 둔다.
+        # JSON 스키마는 넣지 않음: 호출마다 입력 토큰이 크게 늘지만 고정 부분이 프롬프트 캐시
+        # 최소 길이(1024 토큰)에 못 미쳐 캐시 할인도 받지 못한다.
         template = base_template
         
         # schema type별 지시사항 추가
@@ -181,105 +205,139 @@ class SummarizationStrategy:
         
         template += "\n\n텍스트:\n{text}"
         
-        # 프롬프트는 처음 한 번만 출력
-        if not self.prompt_shown:
-            print("\n=== 프롬프트 템플릿 ===")
-            print(template)
-            print("\n=== JSON 스키마 ===")
-            print(self.schema.get_schema())
-            self.prompt_shown = True
-        
-        return PromptTemplate(
-            template=template,
-            input_variables=["text"],
-            partial_variables={"format_instructions": str(self.schema.get_schema())}
-        )
+        # 프롬프트는 생성할 때 한 번만 출력 (DEBUG)
+        logger.debug("=== 프롬프트 템플릿 ===\n%s", template)
+        
+        prompt = PromptTemplate(template=template, input_variables=["text"])
+        return CompiledPrompt(template, prompt=prompt)
     
     def _dict_to_markdown(self, data: Dict, level: int = 1) -> str:
         """Dictionary를 Markdown 형식으로 변환"""
-        md_content = []
-        
-        for key, value in data.items():
-            # 헤더 레벨 (최대 6까지)
-            header = '#' * min(level, 6)
-            
-            if isinstance(value, dict):
-                md_content.append(f"\n{header} {key}")
-                md_content.append(self._dict_to_markdown(value, level + 1))
-            elif isinstance(value, list):
-                md_content.append(f"\n{header} {key}")
-                for item in value:
-                    if isinstance(item, dict):
-                        md_content.append(self._dict_to_markdown(item, level + 1))
-                    else:
-                        md_content.append(f"- {item}")
-            else:
-                md_content.append(f"\n{header} {key}")
-                md_content.append(str(value))
-        
-        return '\n'.join(md_content)
+        return dict_to_markdown(data, level)
     
     def _save_summary(self, title: str, summary: str, metadata: Dict = None) -> None:
-        """요약 결과를 파일로 저장"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        """요약 결과를 저장소에 기록 (항목 ID: metadata의 item_id/url, 없으면 제목)"""
+        metadata = metadata or {}
+        item_id = metadata.get('item_id') or metadata.get('url') or title
+        digest = self.archive.put(item_id, self.schema_type, summary, title=title, metadata=metadata)
+        if digest is None:
+            logger.info("요약 변경 없음 (%s): %s", self.schema_type, item_id)
+        else:
+            logger.info("요약본 저장 완료 (%s): %s [%s]", self.schema_type, item_id, digest[:12])
+    
+    @staticmethod
+    def _map_key(model_name: str, prompt: PromptTemplate, chunk: str) -> str:
+        """청크 map 결과 캐시 키 (모델 + 프롬프트 템플릿 + 청크)"""
+        return chunk_cache.key(model_name, prompt.template, chunk)
+    
+    def _map_reduce(self, chain, chunks: List[str], model_name: str, prompt: PromptTemplate) -> str:
+        """캐시에 없는(바뀐) 청크만 map 후 전체 청크 요약으로 reduce
+        
+        자막 수정이나 기사 갱신처럼 일부만 바뀐 텍스트는 바뀐 청크만 LLM을 호출하고,
+        reduce 단계만 다시 실행한다.
+        """
+        keys = [self._map_key(model_name, prompt, chunk) for chunk in chunks]
+        outputs = [chunk_cache.get(key) for key in keys]
+        missing = [i for i, output in enumerate(outputs) if output is None]
+        if len(missing) < len(chunks):
+            logger.info("청크 요약 재사용: %d/%d개, 새로 요약: %d개",
+                        len(chunks) - len(missing), len(chunks), len(missing))
+        metrics.set('chunks_reused', len(chunks) - len(missing))
+        
+        if missing:
+            # apply()는 여러 프롬프트를 한 번의 generate로 묶어 usage를 합산하는데, usage에
+            # prompt_tokens_details(캐시 토큰) 같은 중첩 값이 있으면 합산에 실패하므로 청크별로 호출
+            results = resilience.call(chain.llm_chain.batch, [{"text": chunks[i]} for i in missing],
+                                      endpoint='openai', attempts=1)
+            for i, result in zip(missing, results):
+                outputs[i] = result[chain.llm_chain.output_key]
+                chunk_cache.put(keys[i], outputs[i])
+        
+        docs = [Document(page_content=output) for output in outputs]
+        result = resilience.call(chain.reduce_documents_chain.invoke, {"input_documents": docs},
+                                 endpoint='openai', attempts=1)
+        return result[chain.reduce_documents_chain.output_key]
+    
+    def summarize_batch(self, texts: List[str], runner, titles: List[str] = None) -> List[Optional[str]]:
+        """여러 텍스트를 Batch API로 요약
+        
+        모든 텍스트의 map 단계(청크별 요약) 요청을 하나의 배치 파일로 제출하고,
+        결과가 오면 텍스트별로 청크 요약을 stuff 체인으로 통합(reduce)한다.
+        이전에 요약한 청크는 요청하지 않고 캐시된 요약을 사용한다.
+        청크가 하나인 텍스트는 map 결과를 그대로 사용한다. 배치에서 실패한 청크가
+        있는 텍스트는 summarize()로 다시 요약한다.
+        """
+        titles = titles or [None] * len(texts)
+        prompt = self._create_structured_prompt()
         
-        # 파일명 생성 (제목에서 특수문자 제거)
-        safe_title = "".join(c for c in title if c.isalnum() or c in (' ', '-', '_')).strip()
-        if len(safe_title) > 50:  # 파일명 길이 제한
-            safe_title = safe_title[:47] + "..."
+        requests, plans, map_keys = [], [], {}
+        for i, text in enumerate(texts):
+            keys = []
+            for j, chunk in enumerate(self._split_text(text)):
+                key = self._map_key(self.model_name, prompt, chunk)
+                keys.append(key)
+                # 이전에 요약한 청크는 다시 요청하지 않음
+                if chunk_cache.get(key) is not None:
+                    continue
+                custom_id = f"{i}-{j}"
+                map_keys[custom_id] = key
+                requests.append({'custom_id': custom_id, 'body': {
+                    'model': self.model_name,
+                    'temperature': 0.2,
+                    'messages': [{'role': 'user', 'content': prompt.format(text=chunk)}],
+                }})
+            plans.append(keys)
+        
+        if ledger.limited:
+            prompt_tokens = sum(estimate_tokens(r['body']['messages'][0]['content']) for r in requests)
+            if not ledger.allows(self.model_name, prompt_tokens, self.ESTIMATED_RESPONSE_TOKENS * len(requests), batch=True):
+                raise BudgetExceeded(f"남은 예산으로 배치를 실행할 수 없습니다 (요청 {len(requests)}개)")
+        
+        results = runner.run(requests, description=f"map {len(texts)} texts") if requests else {}
+        for custom_id, body in results.items():
+            if body is not None:
+                chunk_cache.put(map_keys[custom_id], body['choices'][0]['message']['content'])
+        combine_chain = load_summarize_chain(self.llm, chain_type="stuff", prompt=prompt)
+        
+        summaries = []
+        for text, title, keys in zip(texts, titles, plans):
+            outputs = [chunk_cache.peek(key) for key in keys]
+            if not outputs or any(output is None for output in outputs):
+                logger.warning("배치 결과 누락 - 동기 요약으로 재시도: %s", title or f"{len(text)} 글자")
+                summaries.append(self.summarize(text, title))
+                continue
             
-        # schema type을 파일명에 추가
-        file_prefix = f"{safe_title}_{timestamp}_{self.schema_type}"
+            if len(outputs) == 1:
+                output_text = outputs[0]
+            else:
+                docs = [Document(page_content=output) for output in outputs]
+                output_text = resilience.call(combine_chain.invoke, {"input_documents": docs},
+                                              endpoint='openai', attempts=1)["output_text"]
             
-        # JSON 데이터 준비
-        json_data = {
-            "title": title,
-            "summary": summary,
-            "schema_type": self.schema_type,
-            "timestamp": timestamp,
-            "metadata": metadata or {}
-        }
-        
-        # JSON 저장
-        json_path = self.save_dir / f"{file_prefix}.json"
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(json_data, f, ensure_ascii=False, indent=2)
-        
-        # Markdown 저장
-        md_path = self.save_dir / f"{file_prefix}.md"
-        md_content = self._dict_to_markdown(json_data)
-        
-        with open(md_path, 'w', encoding='utf-8') as f:
-            f.write(md_content)
-        
-        print(f"\n=== 요약본 저장 완료 ({self.schema_type}) ===")
-        print(f"JSON: {json_path}")
-        print(f"Markdown: {md_path}")
+            if title:
+                self._save_summary(title, output_text)
+            summaries.append(output_text)
+        return summaries
     
     def summarize(self, text: str, title: str = None, metadata: Dict = None) -> Union[Dict, str]:
         """텍스트 요약 수행"""
-        print("\n=== 요약 시작 ===")
-        print(f"입력 텍스트 길이: {len(text)} 글자")
-        
         # 텍스트를 의미 단위로 분할
         chunks = self._split_text(text)
+        metrics.set('chunks', len(chunks))
         
-        print(f"\n=== 텍스트 분할 정보 ===")
-        print(f"총 청크 수: {len(chunks)}")
-        print(f"평균 청크 길이: {sum(len(c) for c in chunks) / len(chunks):.0f} 글자")
-        print(f"최대 청크 길이: {max(len(c) for c in chunks)} 글자")
-        
-        # 각 청크의 상세 정보 출력
-        for i, chunk in enumerate(chunks, 1):
-            print(f"\n청크 {i}/{len(chunks)}")
-            print(f"길이: {len(chunk)} 글자")
-            if self.verbose:
-                print("내용:")
-                print(chunk)
-            else:
-                # 첫 1-2문장만 출력
-                preview = '. '.join(chunk.split('.')[:2]) + '...'
-                print("미리보기:", preview)
+        logger.info("요약 시작: 입력 %d 글자, 청크 %d개", len(text), len(chunks))
+        
+        # 청크별 상세 정보 (DEBUG, 샘플링됨)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("평균 청크 길이: %.0f 글자, 최대 청크 길이: %d 글자",
+                         sum(len(c) for c in chunks) / len(chunks), max(len(c) for c in chunks))
+            for i, chunk in enumerate(chunks, 1):
+                if self.verbose:
+                    logger.debug("청크 %d/%d (%d 글자):\n%s", i, len(chunks), len(chunk), chunk)
+                else:
+                    # 첫 1-2문장만 출력
+                    logger.debug("청크 %d/%d (%d 글자) 미리보기: %s", i, len(chunks), len(chunk),
+                                 lazy(lambda chunk=chunk: '. '.join(chunk.split('.')[:2]) + '...'))
         
         # 각 청크를 Document 객체로 변환
         docs = [Document(page_content=chunk) for chunk in chunks]
@@ -287,30 +345,30 @@ class SummarizationStrategy:
         # 프롬프트 설정 및 출력 (처음 한 번만)
         prompt = self._create_structured_prompt()
         
-        print("\n=== 요약 프로세스 시작 ===")
-        print("1. 각 청크 개별 요약")
-        print("2. 요약본 통합")
-        print("3. 최종 정리")
-        
-        # 요약 체인 생성
-        chain = load_summarize_chain(
-            self.llm,
-            chain_type="map_reduce",
-            map_prompt=prompt,
-            combine_prompt=prompt,
-            verbose=True
-        )
+        # 예산에 맞춰 모델과 체인 선택 후 요약 체인 생성
+        llm, chain_type = self._plan_for_budget(chunks)
+        verbose = self.verbose and logger.isEnabledFor(logging.DEBUG)
+        if chain_type == "stuff":
+            chain = load_summarize_chain(llm, chain_type="stuff", prompt=prompt, verbose=verbose)
+        else:
+            chain = load_summarize_chain(
+                llm,
+                chain_type="map_reduce",
+                map_prompt=prompt,
+                combine_prompt=prompt,
+                verbose=verbose
+            )
         
         try:
-            # 요약 실행
-            result = chain.invoke({"input_documents": docs})
-            output_text = result["output_text"]
+            # 요약 실행 (호출별 재시도는 ChatOpenAI가 처리하므로 차단기만 적용)
+            if chain_type == "map_reduce":
+                output_text = self._map_reduce(chain, chunks, llm.model_name, prompt)
+            else:
+                result = resilience.call(chain.invoke, {"input_documents": docs}, endpoint='openai', attempts=1)
+                output_text = result["output_text"]
             
-            print("\n=== 요약 결과 ===")
-            print(f"최종 길이: {len(output_text)} 글자")
-            print("---결과---")
-            print(output_text)
-            print("---------")
+            logger.info("요약 완료: 최종 %d 글자", len(output_text))
+            logger.debug("요약 결과:\n%s", output_text)
             
             # 결과 저장
             if title:
@@ -319,14 +377,13 @@ class SummarizationStrategy:
             return output_text
             
         except Exception as e:
-            print(f"\n!!! 요약 중 오류 발생 !!!")
-            print(f"오류 메시지: {str(e)}")
+            logger.error("요약 중 오류 발생: %s", e)
             
             if "maximum context length" in str(e):
-                print("\n=== 토큰 제한 초과 - 전략 수정 ===")
+                metrics.incr('retries')
                 # 청크 크기 줄이기
                 self.text_splitter = self._create_text_splitter(2000)
-                print("청크 크기 조정: 4000 -> 2000")
+                logger.warning("토큰 제한 초과 - 청크 크기 조정: 4000 -> 2000")
                 # 재귀적으로 다시 시도
                 return self.summarize(text)
             
@@ -0,0 +1,57 @@
+import sys
+import json
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+project_root = str(Path(__file__).parent.parent)
+sys.path.insert(0, project_root)
+
+from summarizer.archive import SummaryArchive
+
+SUMMARY = json.dumps({'full_summary': ['요약 문장'], 'keywords': ['LLM']}, ensure_ascii=False)
+
+def test_rerun_does_not_duplicate(tmp_path):
+    """같은 항목의 같은 요약은 다시 써도 파일이 늘지 않음"""
+    archive = SummaryArchive(tmp_path)
+    assert archive.put('video-1', 'full', SUMMARY, title='영상') is not None
+    for _ in range(4):
+        assert SummaryArchive(tmp_path).put('video-1', 'full', SUMMARY, title='영상') is None
+
+    day_files = list(tmp_path.glob('????-??-??.jsonl'))
+    assert len(day_files) == 1
+    assert len(day_files[0].read_text(encoding='utf-8').splitlines()) == 1
+    assert archive.get('video-1')['summary'] == SUMMARY
+
+def test_identical_summaries_stored_once(tmp_path):
+    """다른 항목의 같은 요약은 본문 없이 해시만 기록"""
+    archive = SummaryArchive(tmp_path)
+    digest = archive.put('a', 'full', SUMMARY)
+    assert archive.put('b', 'full', SUMMARY) == digest
+    lines = [json.loads(l) for f in tmp_path.glob('????-??-??.jsonl') for l in f.read_text(encoding='utf-8').splitlines()]
+    assert ['summary' in l for l in lines] == [True, False]
+    assert SummaryArchive(tmp_path).get('b')['summary'] == SUMMARY
+
+def test_index_by_item_and_schema_type(tmp_path):
+    """(항목, schema_type)별 최신 요약 조회, 요약이 바뀌면 새 기록"""
+    archive = SummaryArchive(tmp_path)
+    archive.put('a', 'section', 'section summary')
+    archive.put('a', 'full', SUMMARY)
+    archive.put('a', 'full', 'updated')
+    reopened = SummaryArchive(tmp_path)
+    assert reopened.get('a', 'section')['summary'] == 'section summary'
+    assert reopened.get('a', 'full')['summary'] == 'updated'
+    assert reopened.get('missing') is None
+    assert [e['schema_type'] for e in reopened.list_entries('full')] == ['full']
+
+def test_markdown_on_demand_and_reindex(tmp_path):
+    """Markdown은 필요할 때 생성, 색인은 날짜별 파일로 재생성 가능"""
+    archive = SummaryArchive(tmp_path)
+    archive.put('a', 'full', SUMMARY, title='제목', metadata={'url': 'https://example.com'})
+    markdown = archive.render_markdown('a')
+    assert '# title\n제목' in markdown and '- 요약 문장' in markdown
+    assert not list(tmp_path.glob('*.md'))
+
+    (tmp_path / SummaryArchive.INDEX_FILE).unlink()
+    assert SummaryArchive(tmp_path).get('a') is None
+    assert SummaryArchive(tmp_path).rebuild_index() == 1
+    assert SummaryArchive(tmp_path).get('a')['title'] == '제목'
@@ -0,0 +1,83 @@
+import sys
+import json
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+project_root = str(Path(__file__).parent.parent)
+sys.path.insert(0, project_root)
+
+import pytest
+from openai import OpenAI
+from benchmarks.fake_services import FakeServices
+from common.batch import BatchRunner
+from common.usage import UsageLedger, ledger
+
+@pytest.fixture
+def services():
+    with FakeServices(n_items=1, latency=0.0, batch_delay=0.2) as services:
+        yield services
+
+def make_request(custom_id: str, text: str) -> dict:
+    return {'custom_id': custom_id, 'body': {
+        'model': 'gpt-4o-mini',
+        'messages': [{'role': 'user', 'content': text}],
+    }}
+
+def test_batch_runner_round_trip(services, tmp_path):
+    """배치 파일 업로드, 폴링, 결과 수집"""
+    client = OpenAI(api_key='test', base_url=f"{services.base_url}/v1", max_retries=0)
+    runner = BatchRunner(client, batch_dir=str(tmp_path), poll_interval=0.05, timeout=10)
+    ledger.reset()
+
+    results = runner.run([make_request('a', '첫 번째 청크'), make_request('b', '두 번째 청크')])
+
+    assert set(results) == {'a', 'b'}
+    for body in results.values():
+        content = json.loads(body['choices'][0]['message']['content'])
+        assert 'full_summary' in content
+
+    # 입력 파일과 출력 파일 저장
+    assert len(list(tmp_path.glob('requests_*.jsonl'))) == 1
+    assert len(list(tmp_path.glob('*_output.jsonl'))) == 1
+
+    # 배치 요청은 개별 요청으로 기록되고 사용량 장부에 반영
+    batch_calls = [c for c in services.calls if c['service'] == 'openai_batch']
+    assert len(batch_calls) == 2
+    assert ledger.total['calls'] == 2
+    assert ledger.total['prompt_tokens'] == sum(c['prompt_tokens'] for c in batch_calls)
+
+def test_batch_runner_timeout(services, tmp_path):
+    """완료 기한 내에 끝나지 않으면 TimeoutError"""
+    services.batch_delay = 5.0
+    client = OpenAI(api_key='test', base_url=f"{services.base_url}/v1", max_retries=0)
+    runner = BatchRunner(client, batch_dir=str(tmp_path), poll_interval=0.05, timeout=0.2)
+
+    with pytest.raises(TimeoutError):
+        runner.run([make_request('a', '청크')])
+
+def test_batch_cost_discount():
+    """배치 요청 비용은 동기 요청의 절반"""
+    usage = UsageLedger()
+    assert usage.cost('gpt-4o-mini', 1_000_000, 1_000_000, batch=True) == pytest.approx(0.375)
+
+def test_strategy_summarize_batch(services, tmp_path, monkeypatch):
+    """SummarizationStrategy의 map 단계가 배치로 실행되고 단일 청크 텍스트는 reduce 생략"""
+    for name, value in services.env().items():
+        monkeypatch.setenv(name, value)
+    from summarizer.strategies import SummarizationStrategy
+    from summarizer.schemas import SectionedSummarySchema
+
+    strategy = SummarizationStrategy('gpt-3.5-turbo', schema=SectionedSummarySchema(schema_type='full'),
+                                     save_dir=str(tmp_path / 'summaries'))
+    client = OpenAI(max_retries=0)
+    runner = BatchRunner(client, batch_dir=str(tmp_path / 'batches'), poll_interval=0.05, timeout=10)
+
+    summaries = strategy.summarize_batch(['첫 번째 글입니다. 짧은 본문입니다.', '두 번째 글입니다.'], runner)
+
+    assert len(summaries) == 2
+    assert all('full_summary' in json.loads(summary) for summary in summaries)
+    # 동기 chat.completions 호출 없이 배치 요청만 사용
+    sync_calls = [c for c in services.calls if c['service'] == 'openai' and c['path'] == '/v1/chat/completions']
+    batch_calls = [c for c in services.calls if c['service'] == 'openai_batch']
+    assert sync_calls == []
+    assert len(batch_calls) == 2
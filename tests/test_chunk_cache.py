@@ -0,0 +1,81 @@
+import sys
+import math
+from pathlib import Path
+from types import SimpleNamespace
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+project_root = str(Path(__file__).parent.parent)
+sys.path.insert(0, project_root)
+
+from langchain.prompts import PromptTemplate
+from common.chunk_cache import ChunkCache, chunk_cache
+from common.sentences import SentenceSegmenter
+from summarizer.strategies import SummarizationStrategy
+
+def test_key_and_persistence(tmp_path):
+    """키는 구성 요소가 같으면 같고, 기록은 다시 열어도 유지"""
+    path = tmp_path / 'chunk_cache.jsonl'
+    cache = ChunkCache(str(path))
+    key = cache.key('gpt-4o-mini', '프롬프트', '청크 내용')
+    assert key == ChunkCache.key('gpt-4o-mini', '프롬프트', '청크 내용')
+    assert key != ChunkCache.key('gpt-4o', '프롬프트', '청크 내용')
+
+    cache.put(key, {'full_summary': '요약'})
+    cache.put(key, {'full_summary': '요약'})  # 같은 값은 다시 기록하지 않음
+    cache.put('other', None)                  # None은 저장하지 않음
+    assert len(path.read_text(encoding='utf-8').splitlines()) == 1
+
+    reopened = ChunkCache(str(path))
+    assert reopened.get(key) == {'full_summary': '요약'}
+    assert reopened.get('other') is None
+
+def test_map_reduce_maps_only_changed_chunks():
+    """바뀐 청크만 map하고 reduce는 전체 청크 요약으로 실행"""
+    chunk_cache.configure(None)
+    mapped, reduced = [], []
+
+    def batch(inputs):
+        mapped.extend(item['text'] for item in inputs)
+        return [{'text': f"요약({item['text']})"} for item in inputs]
+
+    def invoke(inputs):
+        reduced.append([doc.page_content for doc in inputs['input_documents']])
+        return {'output_text': ' + '.join(reduced[-1])}
+
+    chain = SimpleNamespace(
+        llm_chain=SimpleNamespace(batch=batch, output_key='text'),
+        reduce_documents_chain=SimpleNamespace(invoke=invoke, output_key='output_text')
+    )
+    prompt = PromptTemplate(template="요약하세요: {text}", input_variables=["text"])
+    strategy = object.__new__(SummarizationStrategy)
+
+    strategy._map_reduce(chain, ['가', '나', '다'], 'gpt-4o-mini', prompt)
+    assert mapped == ['가', '나', '다']
+
+    mapped.clear()
+    output = strategy._map_reduce(chain, ['가', '나 수정', '다'], 'gpt-4o-mini', prompt)
+    assert mapped == ['나 수정']
+    assert output == '요약(가) + 요약(나 수정) + 요약(다)'
+    chunk_cache.configure(None)
+
+def test_chunk_boundaries_survive_local_edit():
+    """문장 하나가 바뀌어도 바뀐 청크(와 길이 제한 때문에 경계가 밀린 이웃 청크) 밖은 그대로 유지"""
+    sentences = [f"문장 {i} " + '내용 ' * (5 + (i * 7) % 30) + '입니다.' for i in range(300)]
+    edited = list(sentences)
+    edited[120] = edited[120].replace('입니다.', '추가된 설명이 조금 있습니다.')
+
+    segmenter = SentenceSegmenter()
+    before = segmenter.chunk(' '.join(sentences), max_length=2000)
+    after = segmenter.chunk(' '.join(edited), max_length=2000)
+
+    assert len(after) == len(before) == math.ceil((len(' '.join(sentences)) + 1) / 2001)
+    assert len(set(before) - set(after)) <= 2
+    assert all(len(chunk) <= 2000 for chunk in after)
+
+def test_text_within_limit_is_one_chunk():
+    """최대 길이 이하의 텍스트는 나누지 않음"""
+    text = ' '.join(f"문장 {i} " + '내용 ' * (3 + i % 7) + '입니다.' for i in range(40))
+    segmenter = SentenceSegmenter()
+    for max_length in (len(text), len(text) + 50, len(text) * 2):
+        assert segmenter.chunk(text, max_length=max_length) == [text]
+    assert len(segmenter.chunk(text, max_length=len(text) - 1)) == 2
@@ -0,0 +1,64 @@
+import sys
+import random
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+project_root = str(Path(__file__).parent.parent)
+sys.path.insert(0, project_root)
+
+import pytest
+from summarizer.dedup import DuplicateIndex
+
+random.seed(0)
+VOCAB = [f"word{i}" for i in range(2000)]
+
+def make_text(n_words: int = 400) -> str:
+    return ' '.join(random.choice(VOCAB) for _ in range(n_words))
+
+def test_near_duplicate_detected():
+    """일부만 수정된 사본은 중복으로 탐지"""
+    index = DuplicateIndex(threshold=0.85)
+    original = make_text()
+    index.add('original', index.fingerprint(original), summary={'full_summary': '요약'})
+
+    # 신디케이션 사본: 앞뒤에 짧은 문구 추가
+    copy = "Originally published elsewhere. " + original + " Subscribe for more."
+    match = index.find(index.fingerprint(copy))
+
+    assert match is not None
+    assert match['key'] == 'original'
+    assert match['summary'] == {'full_summary': '요약'}
+    assert match['similarity'] >= 0.85
+
+def test_different_content_not_matched():
+    """서로 다른 콘텐츠는 중복이 아님"""
+    index = DuplicateIndex(threshold=0.9)
+    for i in range(20):
+        text = make_text()
+        index.add(str(i), index.fingerprint(text))
+
+    assert index.find(index.fingerprint(make_text())) is None
+    assert len(index) == 20
+
+def test_band_lookup_matches_linear_scan():
+    """밴드 후보 탐색 결과가 전체 비교 결과와 일치"""
+    index = DuplicateIndex(threshold=0.8)
+    fingerprints = [random.getrandbits(64) for _ in range(300)]
+    for i, fp in enumerate(fingerprints):
+        index.add(str(i), fp)
+
+    for _ in range(50):
+        base = random.choice(fingerprints)
+        # 임계값 이내의 비트만 뒤집은 질의
+        query = base
+        for bit in random.sample(range(64), random.randint(0, index.max_distance)):
+            query ^= 1 << bit
+        expected = max(index.similarity(query, fp) for fp in fingerprints)
+        match = index.find(query)
+        assert match is not None
+        assert match['similarity'] == expected
+
+def test_invalid_threshold():
+    """잘못된 임계값 검증"""
+    with pytest.raises(ValueError):
+        DuplicateIndex(threshold=0)
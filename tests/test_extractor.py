@@ -0,0 +1,107 @@
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+project_root = str(Path(__file__).parent.parent)
+sys.path.insert(0, project_root)
+
+import pytest
+from fetcher.extractor import HTMLExtractor, HAS_LXML
+
+PARSERS = ['html.parser'] + (['lxml'] if HAS_LXML else [])
+
+SAMPLE_HTML = """
+<html><head><title>  테스트   문서 </title>
+<style>.x { color: red }</style><script>var tracking = 1;</script></head>
+<body>
+<nav><a href="/">홈</a><a href="/news">뉴스</a></nav>
+<article><h1>본문 제목</h1><p>첫 번째 <b>문단</b>입니다.</p><!-- 주석 --><p>두 번째 문단입니다.</p></article>
+<footer>Copyright</footer>
+</body></html>
+"""
+
+@pytest.mark.parametrize("parser", PARSERS)
+def test_extract_main_block(parser):
+    """보일러플레이트 제거 및 본문 블록 선택 테스트"""
+    result = HTMLExtractor(parser).extract(SAMPLE_HTML)
+
+    assert result['title'] == '테스트 문서'
+    assert result['text'] == '본문 제목 첫 번째 문단입니다. 두 번째 문단입니다.'
+    for noise in ['tracking', 'color', '홈', 'Copyright', '주석']:
+        assert noise not in result['text']
+
+@pytest.mark.parametrize("parser", PARSERS)
+def test_extract_without_main_tag(parser):
+    """article/main이 없으면 보일러플레이트를 제외한 전체 텍스트 사용"""
+    html = "<html><body><header>메뉴</header><div><p>내용</p></div></body></html>"
+    assert HTMLExtractor(parser).extract_text(html) == '내용'
+
+def test_parsers_agree_on_fixtures():
+    """픽스처에서 lxml과 html.parser 결과 일치 여부 테스트"""
+    if not HAS_LXML:
+        pytest.skip("lxml 미설치")
+    fixture_dir = Path(project_root) / 'benchmarks' / 'fixtures' / 'html'
+    for path in fixture_dir.glob('*.html'):
+        html = path.read_text(encoding='utf-8')
+        assert HTMLExtractor('lxml').extract(html) == HTMLExtractor('html.parser').extract(html)
+
+@pytest.mark.parametrize("parser", PARSERS)
+def test_inline_tags_keep_words_together(parser):
+    """인라인 태그 경계에는 공백을 넣지 않고 블록 경계에만 넣음"""
+    html = ("<html><body><div><p>물은 H<sub>2</sub>O, <a href='/x'>link</a>s와 <b>굵은</b> <i>글씨</i></p>"
+            "<p>다음</p><ul><li>항목1</li><li>항목2</li></ul></div></body></html>")
+    assert HTMLExtractor(parser).extract_text(html) == '물은 H2O, links와 굵은 글씨 다음 항목1 항목2'
+
+def test_deeply_nested_document():
+    """중첩이 매우 깊은 문서도 html.parser 경로에서 예외 없이 텍스트 추출"""
+    html = '<div>' * 5000 + '<p>깊은 본문</p>' + '</div>' * 5000
+    assert HTMLExtractor('html.parser').extract_text(html) == '깊은 본문'
+
+def test_empty_document():
+    """빈 문서 처리 테스트"""
+    assert HTMLExtractor().extract('') == {'title': '', 'text': ''}
+
+def test_link_heavy_blocks_removed():
+    """링크 밀도가 높은 관련 기사 블록과 쿠키 배너 제거 테스트"""
+    paragraph = "<p>본문 문단은 충분히 긴 문장으로 구성되어 있으며, 쉼표도 포함하고 있다.</p>"
+    html = f"""
+    <html><body>
+    <div class="cookie-banner">쿠키 사용에 동의해 주세요. <a href="/privacy">개인정보처리방침</a></div>
+    <div id="wrap">
+      <div class="related-links"><a href="/1">관련 기사 첫 번째 제목입니다</a><a href="/2">관련 기사 두 번째 제목입니다</a></div>
+      <div class="post-body">{paragraph * 5}<div class="ad-slot">광고 문구</div></div>
+    </div>
+    </body></html>
+    """
+    for parser in PARSERS:
+        text = HTMLExtractor(parser).extract_text(html)
+        assert text.startswith('본문 문단은')
+        assert '관련 기사' not in text
+        assert '쿠키' not in text
+        assert '광고' not in text
+
+def test_hint_matches_whole_tokens():
+    """stage, inside, thread- 같은 클래스명은 광고/태그/사이드바로 오인하지 않음"""
+    paragraph = "<p>본문 문단은 충분히 긴 문장으로 구성되어 있으며, 쉼표도 포함하고 있다.</p>"
+    html = f"""
+    <html><body><article>
+      <div class="stage">{paragraph}</div>
+      <div class="heritage inside">{paragraph}</div>
+      <div class="thread-list loads">{paragraph}</div>
+      <div class="side">사이드 메뉴</div>
+    </article></body></html>
+    """
+    for parser in PARSERS:
+        text = HTMLExtractor(parser).extract_text(html)
+        assert text.count('본문 문단은') == 3
+        assert '사이드' not in text
+
+def test_token_stats():
+    """토큰 절감량 통계 테스트"""
+    extractor = HTMLExtractor(count_tokens=lambda text: len(text.split()))
+    result = extractor.extract(SAMPLE_HTML)
+    stats = result['token_stats']
+
+    assert stats['text_tokens'] == len(result['text'].split())
+    assert stats['raw_tokens'] > stats['text_tokens']
+    assert 0 < stats['reduction'] < 1
@@ -0,0 +1,89 @@
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+project_root = str(Path(__file__).parent.parent)
+sys.path.insert(0, project_root)
+
+import pytest
+from benchmarks.fake_services import FakeServices, make_token_counter
+from benchmarks.bench_pipeline import load_fetch_save_module
+from common.chunk_cache import chunk_cache
+from common.metrics import metrics
+
+CHUNK = "인공지능은 데이터를 학습하여 예측을 수행한다. 최근에는 거대 언어 모델이 등장했다. " * 5
+
+def make_summarizer(services, monkeypatch, model='gpt-4o-mini'):
+    """로컬 가짜 OpenAI 서버를 사용하는 fetch_save BaseSummarizer"""
+    for name, value in services.env().items():
+        monkeypatch.setenv(name, value)
+    fetch_save_config = load_fetch_save_module('config')
+    fetch_save_summarizer = load_fetch_save_module('summarizer')
+    # tiktoken 인코딩을 내려받지 않도록 토큰 수 계산을 근사 함수로 대체
+    count_tokens = make_token_counter()
+    monkeypatch.setattr(fetch_save_summarizer.Utils, 'num_tokens_from_string',
+                        staticmethod(lambda text, gpt_model: count_tokens(text)))
+    config = fetch_save_config.Config()
+    config.GPT_MODEL = model
+    chunk_cache.configure(None)
+    return fetch_save_summarizer.BaseSummarizer(config, verbose=False)
+
+def chat_calls(services):
+    return [call for call in services.calls if call['path'].startswith('/v1/chat/completions')]
+
+def test_only_invalid_field_is_requested_again(monkeypatch):
+    """스트리밍 응답에서 스키마에 맞지 않는 필드만 다시 요청하고 나머지 필드는 그대로 사용"""
+    with FakeServices(n_items=1, latency=0.0, invalid_fields=['sections']) as services:
+        summarizer = make_summarizer(services, monkeypatch)
+        retries = metrics.counters.get('json_field_retries', 0)
+
+        result = summarizer.get_chunk_summary(CHUNK, summarizer.json_function_full)
+
+        properties = list(summarizer.json_function_full[0]['parameters']['properties'])
+        assert [call['fields'] for call in chat_calls(services)] == [properties, ['sections']]
+        assert isinstance(result['sections'], list) and result['sections']
+        assert all(isinstance(section, dict) for section in result['sections'])
+        assert metrics.counters['json_field_retries'] == retries + 1
+    chunk_cache.configure(None)
+
+@pytest.mark.parametrize("model, mode", [
+    ('gpt-4o-mini', 'response_format'),
+    ('gpt-4o-2024-08-06', 'response_format'),
+    ('gpt-4o-2024-05-13', 'tools'),
+    ('gpt-3.5-turbo', 'tools'),
+    ('o3-mini', 'response_format'),
+    ('o1-mini', 'prompt'),
+])
+def test_request_format_per_model(monkeypatch, model, mode):
+    """Structured Outputs는 지원하는 스냅샷에만, 추론 모델은 max_completion_tokens/temperature 없이"""
+    with FakeServices(n_items=1, latency=0.0) as services:
+        summarizer = make_summarizer(services, monkeypatch, model)
+        request = summarizer.build_chat_request(CHUNK, summarizer.json_function_full)
+
+    assert ('response_format' in request) == (mode == 'response_format')
+    assert ('tools' in request) == (mode == 'tools')
+    if mode == 'prompt':
+        assert [message['role'] for message in request['messages']] == ['user']
+        assert '"properties"' in request['messages'][0]['content']
+    if model.startswith('o'):
+        assert 'temperature' not in request and 'max_tokens' not in request
+        assert request['max_completion_tokens'] > 0
+    else:
+        assert request['max_tokens'] > 0 and 'max_completion_tokens' not in request
+
+def test_fallback_model_summaries_cached_under_fallback_key(monkeypatch):
+    """예산 부족으로 대체 모델을 쓰면 그 모델의 키로 캐시하고 기본 모델 요청에는 재사용하지 않음"""
+    with FakeServices(n_items=1, latency=0.0) as services:
+        summarizer = make_summarizer(services, monkeypatch, model='gpt-4o')
+        compiled = summarizer.compiled_prompt(summarizer.json_function_full)
+        monkeypatch.setattr(summarizer, 'select_model', lambda *args, **kwargs: 'gpt-4o-mini')
+        summarizer.get_chunk_summary(CHUNK, summarizer.json_function_full)
+
+        assert chunk_cache.peek(summarizer._cache_key(CHUNK, compiled, 'gpt-4o-mini')) is not None
+        assert chunk_cache.peek(summarizer._cache_key(CHUNK, compiled, 'gpt-4o')) is None
+
+        # 예산이 회복되면 기본 모델로 다시 요약
+        monkeypatch.setattr(summarizer, 'select_model', lambda *args, **kwargs: 'gpt-4o')
+        summarizer.get_chunk_summary(CHUNK, summarizer.json_function_full)
+        assert len(chat_calls(services)) == 2
+    chunk_cache.configure(None)
@@ -0,0 +1,37 @@
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+project_root = str(Path(__file__).parent.parent)
+sys.path.insert(0, project_root)
+
+from common.highlight import KeywordHighlighter
+
+def parts(rich_text):
+    return [(p['text']['content'], 'annotations' in p) for p in rich_text]
+
+def test_highlights_all_keywords_case_insensitive():
+    """대소문자와 무관하게 모든 키워드를 강조하고 원문 대소문자 유지"""
+    highlighter = KeywordHighlighter(['LLM', 'token'])
+    result = highlighter.highlight("llm tokens and the LLM")
+    assert parts(result) == [('llm', True), (' ', False), ('token', True), ('s and the ', False), ('LLM', True)]
+    assert ''.join(c for c, _ in parts(result)) == "llm tokens and the LLM"
+
+def test_longest_keyword_wins_at_same_position():
+    """같은 위치에서는 가장 긴 키워드 선택"""
+    highlighter = KeywordHighlighter(['Index', 'Index Section', 'Section'])
+    result = highlighter.highlight("see index section now")
+    assert parts(result) == [('see ', False), ('index section', True), (' now', False)]
+
+def test_empty_inputs_and_special_characters():
+    """빈 텍스트/키워드는 일반 텍스트, 정규식 특수문자는 그대로 일치"""
+    assert parts(KeywordHighlighter([]).highlight("text")) == [('text', False)]
+    assert parts(KeywordHighlighter(['', '  ']).highlight("text")) == [('text', False)]
+    assert parts(KeywordHighlighter(['a']).highlight("")) == [('', False)]
+    assert parts(KeywordHighlighter(['C++', '(beta)']).highlight("C++ (beta)")) == \
+        [('C++', True), (' ', False), ('(beta)', True)]
+
+def test_korean_keywords():
+    """한글 키워드 강조"""
+    result = KeywordHighlighter(['요약', '요약 모델']).highlight("새 요약 모델과 요약")
+    assert parts(result) == [('새 ', False), ('요약 모델', True), ('과 ', False), ('요약', True)]
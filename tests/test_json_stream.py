@@ -0,0 +1,65 @@
+import sys
+import json
+import random
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+project_root = str(Path(__file__).parent.parent)
+sys.path.insert(0, project_root)
+
+from common.json_stream import JsonStreamParser, parse_json_fields, invalid_fields
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "keywords": {"type": "array", "items": {"type": "string"}},
+        "sections": {"type": "array", "items": {
+            "type": "object",
+            "properties": {"title": {"type": "string"}, "summary": {"type": "array", "items": {"type": "string"}}},
+            "required": ["title", "summary"]
+        }},
+        "full_summary": {"type": "array", "items": {"type": "string"}},
+    },
+    "required": ["keywords", "sections", "full_summary"]
+}
+
+def test_fields_complete_while_streaming():
+    """조각 경계와 관계없이 필드가 끝나는 즉시 파싱되고 문자열 안의 공백은 그대로 유지"""
+    value = {
+        "keywords": ["AI", "코드  블록"],
+        "sections": [{"title": "제목, {괄호}", "summary": ["줄\n바꿈", "따옴표 \"인용\" \\ 역슬래시"]}],
+        "full_summary": ["\t들여쓰기   유지"],
+    }
+    text = "```json\n" + json.dumps(value, ensure_ascii=False, indent=2) + "\n```"
+    rng = random.Random(0)
+    for _ in range(50):
+        parser, completed, pos = JsonStreamParser(), [], 0
+        while pos < len(text):
+            size = rng.randint(1, 8)
+            completed.extend(parser.feed(text[pos:pos + size]))
+            pos += size
+        parser.close()
+        assert completed == list(value)
+        assert parser.fields == value
+        assert parser.done and not parser.errors
+
+def test_malformed_field_reported_separately():
+    """잘못된 필드만 오류로 기록하고 나머지 필드는 사용"""
+    parser = parse_json_fields('{"keywords": ["a"], "sections": [{"title": "t",}], "full_summary": ["요약"]}')
+    assert parser.fields == {"keywords": ["a"], "full_summary": ["요약"]}
+    assert set(parser.errors) == {"sections"}
+    assert invalid_fields(parser.fields, SCHEMA, parser.errors) == ["sections"]
+
+def test_truncated_response():
+    """필드 중간에서 끊긴 응답은 끝나지 않은 필드만 오류"""
+    parser = parse_json_fields('{"keywords": ["a", "b"], "full_summary": ["잘린')
+    assert parser.fields == {"keywords": ["a", "b"]}
+    assert set(parser.errors) == {"full_summary"}
+    assert not parser.done
+
+def test_invalid_fields_checks_types_and_required():
+    """없는 필수 필드와 타입이 맞지 않는 필드를 찾음"""
+    fields = {"keywords": "문자열", "sections": [{"title": "t"}]}
+    assert invalid_fields(fields, SCHEMA) == ["keywords", "sections", "full_summary"]
+    fields = {"keywords": [], "sections": [{"title": "t", "summary": ["s"]}], "full_summary": ["f"]}
+    assert invalid_fields(fields, SCHEMA) == []
@@ -0,0 +1,58 @@
+import sys
+import json
+import logging
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+project_root = str(Path(__file__).parent.parent)
+sys.path.insert(0, project_root)
+
+from common.log import get_logger, configure_logging, lazy, SampleFilter
+
+def test_lazy_argument_not_evaluated_below_level(capsys):
+    """출력되지 않는 레벨의 lazy 인자는 계산하지 않음"""
+    configure_logging(level='INFO')
+    logger = get_logger('test.lazy')
+    calls = []
+
+    def expensive():
+        calls.append(1)
+        return '미리보기'
+
+    logger.debug("청크: %s", lazy(expensive))
+    assert calls == []
+
+    logger.info("청크: %s", lazy(expensive))
+    assert calls == [1]
+    assert '청크: 미리보기' in capsys.readouterr().out
+
+def test_repeated_debug_messages_sampled(capsys):
+    """같은 템플릿의 DEBUG 로그는 처음 몇 개 이후 일정 간격으로만 출력"""
+    configure_logging(level='DEBUG', sample_first=2, sample_every=5)
+    logger = get_logger('test.sample')
+    for i in range(1, 13):
+        logger.debug("청크 %d", i)
+    logger.info("완료")
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines == ['청크 1', '청크 2', '청크 7', '청크 12', '완료']
+
+def test_sample_filter_passes_warnings():
+    """WARNING 이상은 샘플링하지 않음"""
+    sampler = SampleFilter(first=0, every=0)
+    record = logging.LogRecord('pipeline.x', logging.WARNING, __file__, 1, "경고 %s", ('a',), None)
+    assert all(sampler.filter(record) for _ in range(10))
+
+def test_json_file_output(tmp_path):
+    """파일 출력은 JSON 한 줄씩 기록"""
+    path = tmp_path / 'run.log'
+    root = configure_logging(level='INFO', path=str(path))
+    get_logger('test.file').error("Notion 저장 실패: %s", '429')
+    for handler in root.handlers:
+        handler.flush()
+
+    record = json.loads(path.read_text(encoding='utf-8').strip())
+    assert record['level'] == 'ERROR'
+    assert record['logger'] == 'pipeline.test.file'
+    assert record['message'] == 'Notion 저장 실패: 429'
+    configure_logging(level='INFO')
@@ -0,0 +1,79 @@
+import sys
+import json
+from pathlib import Path
+from urllib.request import urlopen
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+project_root = str(Path(__file__).parent.parent)
+sys.path.insert(0, project_root)
+
+import pytest
+from common.metrics import Metrics
+
+def test_item_record_written_to_jsonl(tmp_path):
+    """항목별 단계 시간, LLM 토큰, 이벤트가 JSONL 한 줄로 기록"""
+    path = tmp_path / 'metrics.jsonl'
+    metrics = Metrics()
+    metrics.configure(path=str(path))
+
+    with metrics.item('youtube', 'video-1'):
+        with metrics.stage('fetch'):
+            pass
+        metrics.set('transcript_chars', 1200)
+        metrics.observe_llm('gpt-3.5-turbo', 100, 20, 0.5)
+        metrics.observe_llm('gpt-3.5-turbo', 50, 10, 0.25)
+        metrics.incr('retries')
+    metrics.close()
+
+    record = json.loads(path.read_text(encoding='utf-8').strip())
+    assert record['source'] == 'youtube'
+    assert record['key'] == 'video-1'
+    assert record['status'] == 'ok'
+    assert set(record['stages']) == {'fetch', 'llm'}
+    assert record['stages']['llm'] == pytest.approx(0.75)
+    assert record['values'] == {'transcript_chars': 1200}
+    assert record['prompt_tokens'] == 150
+    assert record['completion_tokens'] == 30
+    assert len(record['llm_calls']) == 2
+    assert record['counters'] == {'retries': 1}
+
+def test_failed_item_marked():
+    """예외 발생 또는 mark_error 호출 시 실패로 기록"""
+    metrics = Metrics()
+    with pytest.raises(ValueError):
+        with metrics.item('pocket', 'a'):
+            raise ValueError('boom')
+    with metrics.item('pocket', 'b'):
+        metrics.mark_error(RuntimeError('handled'))
+
+    assert metrics.items == {('pocket', 'error'): 2}
+
+def test_values_outside_item_only_in_totals():
+    """항목 밖에서 기록한 값은 전체 누적값에만 반영"""
+    metrics = Metrics()
+    metrics.observe_llm('gpt-3.5-turbo', 10, 5)
+    metrics.incr('translation_calls', 2)
+
+    assert metrics.llm_calls == 1
+    assert metrics.counters == {'translation_calls': 2}
+
+def test_prometheus_endpoint():
+    """Prometheus 텍스트 엔드포인트 노출"""
+    metrics = Metrics()
+    with metrics.item('youtube', 'v'):
+        metrics.observe_stage('notion_write', 0.2)
+        metrics.observe_llm('gpt-3.5-turbo', 30, 7, cached_tokens=16)
+
+    port = metrics.serve(0)
+    try:
+        # 기본은 로컬 인터페이스에만 노출
+        assert metrics._server.server_address[0] == '127.0.0.1'
+        body = urlopen(f"http://127.0.0.1:{port}/metrics").read().decode('utf-8')
+    finally:
+        metrics.close()
+
+    assert '# TYPE summarizer_items_total counter' in body
+    assert 'summarizer_items_total{source="youtube",status="ok"} 1' in body
+    assert 'summarizer_stage_seconds_total{stage="notion_write"} 0.2' in body
+    assert 'summarizer_llm_tokens_total{type="prompt"} 30' in body
+    assert 'summarizer_llm_tokens_total{type="cached"} 16' in body
@@ -0,0 +1,79 @@
+import sys
+import json
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+project_root = str(Path(__file__).parent.parent)
+sys.path.insert(0, project_root)
+
+from common.notion_blocks import (build_summary_blocks, block_batches, chapter_headings, plain_text, dumps,
+                                  MAX_BLOCKS_PER_REQUEST)
+
+def texts(blocks):
+    return [(b['type'], ''.join(p['text']['content'] for p in b[b['type']].get('rich_text', [])))
+            for b in blocks]
+
+def test_sections_with_chapters_in_one_pass():
+    """챕터 시작 섹션 앞에 챕터 제목, 섹션마다 제목/글머리/빈 줄"""
+    summary = {
+        'sections': [{'title': 'A', 'summary': ['a1']}, {'title': 'B', 'summary': ['b1', 'b2']},
+                     {'title': 'C', 'summary': []}],
+    }
+    chapters = [{'chapter_title': 'Intro', 'section_indices': {'start': 0, 'end': 2}},
+                {'chapter_title': 'Empty', 'section_indices': {'start': 2, 'end': 2}},
+                {'chapter_title': 'Rest', 'section_indices': {'start': 2, 'end': 3}}]
+    blocks = build_summary_blocks(summary, plain_text, chapters, thumbnail='http://img')
+    assert [b['type'] for b in blocks[:3]] == ['table_of_contents', 'image', 'heading_1']
+    assert texts(blocks[3:]) == [
+        ('heading_1', '1. Intro'), ('heading_2', '1. A'), ('bulleted_list_item', 'a1'), ('paragraph', ''),
+        ('heading_2', '2. B'), ('bulleted_list_item', 'b1'), ('bulleted_list_item', 'b2'), ('paragraph', ''),
+        ('heading_1', '3. Rest'), ('heading_2', '3. C'), ('paragraph', ''),
+    ]
+
+def test_summary_without_sections():
+    """섹션이 없으면 목차(와 썸네일)만"""
+    assert [b['type'] for b in build_summary_blocks('text only', plain_text)] == ['table_of_contents']
+    assert chapter_headings(None) == {}
+
+def test_batches_respect_request_limit():
+    """블록은 요청당 100개 이하로 순서대로 분할"""
+    summary = {'sections': [{'title': str(i), 'summary': ['x'] * 10} for i in range(30)]}
+    blocks = build_summary_blocks(summary, plain_text)
+    batches = block_batches(blocks)
+    assert all(len(batch) <= MAX_BLOCKS_PER_REQUEST for batch in batches)
+    assert [b for batch in batches for b in batch] == blocks
+    assert block_batches([]) == []
+
+def test_dumps_matches_json():
+    """직렬화 결과는 표준 json과 같은 내용"""
+    blocks = build_summary_blocks({'sections': [{'title': '요약', 'summary': ['내용']}]}, plain_text)
+    assert json.loads(dumps(blocks)) == blocks
+
+def test_fetch_save_organize_summary_with_keyword_terms():
+    """fetch_save 요약 형태({'term', 'count'} 키워드)에서도 섹션/글머리 블록 생성"""
+    import importlib.util
+    from types import SimpleNamespace
+    spec = importlib.util.spec_from_file_location('fetch_save_logger', Path(project_root) / 'fetch_save' / 'logger.py')
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    config = SimpleNamespace(NOTION_TOKEN='test', NOTION_DATABASE_ID='db', INCLUDE_KEYWORDS=True,
+                             HIGHLIGHT_KEYWORDS=True, ENABLE_CHAPTERS=False)
+    notion = module.NotionBase(config)
+    summary = {
+        'keywords': [{'term': 'AI', 'count': 3}, {'term': '모델', 'count': 1}],
+        'sections': [{'title': 'AI 개요', 'summary': ['언어 모델 소개']}],
+        'full_summary': ['요약'],
+    }
+    blocks = notion.organize_summary({'summary': summary})
+    assert texts(blocks[1:]) == [('heading_1', 'Detailed Section Summaries'), ('heading_2', '1. AI 개요'), ('bulleted_list_item', '언어 모델 소개'),
+                                 ('paragraph', '')]
+    highlighted = [part['text']['content'] for part in blocks[2]['heading_2']['rich_text'] if 'annotations' in part]
+    assert highlighted == ['AI']
+
+    # 번역된 요약은 keywords_original을 사용
+    summary['keywords_original'] = ['모델']
+    blocks = notion.organize_summary({'summary': summary})
+    highlighted = [part['text']['content'] for part in blocks[3]['bulleted_list_item']['rich_text']
+                   if 'annotations' in part]
+    assert highlighted == ['모델']
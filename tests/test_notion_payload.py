@@ -0,0 +1,114 @@
+import sys
+import asyncio
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+project_root = str(Path(__file__).parent.parent)
+sys.path.insert(0, project_root)
+
+from common.notion_blocks import block, plain_text, dumps
+from common.notion_payload import (split_text, text_property, fit_block, pack_page, create_page, create_page_async,
+                                   MAX_TEXT_LENGTH, MAX_RICH_TEXT_ITEMS, MAX_PAYLOAD_BYTES)
+
+def joined(parts):
+    return ''.join(p['text']['content'] for p in parts)
+
+def test_long_text_split_without_loss():
+    """2000자 넘는 텍스트는 여러 조각으로 나뉘고 이어 붙이면 원문"""
+    text = '가나다라마' * 1000
+    parts = text_property(text)['rich_text']
+    assert len(parts) == 3
+    assert all(len(p['text']['content']) <= MAX_TEXT_LENGTH for p in parts)
+    assert joined(parts) == text
+    assert split_text('') == [''] and text_property(None)['rich_text'] == [{"text": {"content": ""}}]
+
+def test_fit_block_keeps_annotations_and_item_limit():
+    """긴 강조 조각은 서식을 유지하며 나누고, 조각이 100개를 넘으면 연속 블록으로 분할"""
+    bold = {"type": "text", "text": {"content": "x" * 4500}, "annotations": {"bold": True}}
+    [fitted] = fit_block(block("paragraph", [bold]))
+    assert [len(p['text']['content']) for p in fitted['paragraph']['rich_text']] == [2000, 2000, 500]
+    assert all(p['annotations'] == {"bold": True} for p in fitted['paragraph']['rich_text'])
+
+    many = block("bulleted_list_item", plain_text('a') * 250)
+    fitted = fit_block(many)
+    assert [len(b['bulleted_list_item']['rich_text']) for b in fitted] == [100, 100, 50]
+
+def test_property_overflow_moves_to_page_body():
+    """속성 제한을 넘는 내용은 본문 블록으로 옮겨 전부 보존"""
+    text = 'a' * (MAX_TEXT_LENGTH * (MAX_RICH_TEXT_ITEMS + 5))
+    properties, batches = pack_page({"Summary": text_property(text), "URL": {"url": "u"}})
+    assert len(properties["Summary"]["rich_text"]) <= MAX_RICH_TEXT_ITEMS
+    assert properties["URL"] == {"url": "u"}
+    moved = [b for batch in batches for b in batch if b['type'] == 'paragraph']
+    assert joined(properties["Summary"]["rich_text"]) + ''.join(joined(b['paragraph']['rich_text']) for b in moved) == text
+
+def test_batches_minimize_requests_within_limits():
+    """블록 수/본문 크기 제한 안에서 최소 요청 수로 묶음"""
+    blocks = [block("paragraph", plain_text(str(i))) for i in range(250)]
+    _, batches = pack_page({}, blocks)
+    assert [len(b) for b in batches] == [100, 100, 50]
+
+    big = [block("paragraph", plain_text('가' * 2000) * 10) for _ in range(20)]
+    _, batches = pack_page({}, big)
+    assert all(len(dumps(batch)) <= MAX_PAYLOAD_BYTES for batch in batches)
+    assert sum(len(b) for b in batches) == 20
+    assert len(batches) == -(-len(dumps(big)) // MAX_PAYLOAD_BYTES)
+
+class FakeClient:
+    """pages.create / blocks.children.append 호출 기록"""
+
+    def __init__(self):
+        self.calls = []
+        self.pages = self
+        self.blocks = self
+        self.children = self
+
+    def create(self, **kwargs):
+        self.calls.append(('create', len(kwargs['children'])))
+        return {'id': 'page'}
+
+    def append(self, block_id, children):
+        self.calls.append(('append', len(children)))
+
+def test_create_page_sends_every_block():
+    """첫 묶음은 페이지 생성, 나머지는 append"""
+    client = FakeClient()
+    create_page(client, 'db', {"Summary": text_property('s')}, [block("paragraph", plain_text('p'))] * 230)
+    assert client.calls == [('create', 100), ('append', 100), ('append', 30)]
+
+class FakeAsyncClient(FakeClient):
+    """AsyncClient처럼 코루틴을 반환하는 FakeClient"""
+
+    async def create(self, **kwargs):
+        return super().create(**kwargs)
+
+    async def append(self, block_id, children):
+        return super().append(block_id, children)
+
+def test_create_page_async_sends_every_block():
+    """비동기 버전도 같은 묶음으로 전송"""
+    client = FakeAsyncClient()
+    asyncio.run(create_page_async(client, 'db', {}, [block("paragraph", plain_text('p'))] * 150))
+    assert client.calls == [('create', 100), ('append', 50)]
+
+def test_each_block_serialized_once(monkeypatch):
+    """블록 크기는 한 번만 재고 묶음/지표에 재사용하며, 잰 크기는 실제 직렬화 크기와 같음"""
+    import common.notion_payload as notion_payload
+    from common.metrics import metrics
+    calls = []
+
+    def counting_dumps(obj):
+        calls.append(obj)
+        return dumps(obj)
+
+    monkeypatch.setattr(notion_payload, 'dumps', counting_dumps)
+    properties = {"Summary": text_property('요약'), "URL": {"url": "u"}}
+    blocks = [block("paragraph", plain_text(str(i))) for i in range(230)]
+    client = FakeClient()
+    with metrics.item('test', 'payload'):
+        create_page(client, 'db', properties, blocks)
+        values = metrics.current_item()['values']
+
+    # 블록 230개 + 속성 값 2개 + 속성 이름 2개
+    assert len(calls) == 230 + 2 + 2
+    assert values['notion_payload_bytes'] == len(dumps(properties)) + sum(len(dumps(b)) for b in blocks)
@@ -0,0 +1,59 @@
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+project_root = str(Path(__file__).parent.parent)
+sys.path.insert(0, project_root)
+
+import pytest
+from fetcher.pacer import HostPacer
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+def make_pacer(**kwargs):
+    clock = FakeClock()
+    return HostPacer(clock=clock, sleep=clock.sleep, **kwargs), clock
+
+def test_no_wait_without_throttling():
+    """제한이 없으면 대기 없이 요청하고 고정 대기 시간만큼 절감"""
+    pacer, clock = make_pacer()
+    for i in range(10):
+        assert pacer.wait(f"https://example.com/{i}", baseline=4.0) == 0.0
+        pacer.success(f"https://example.com/{i}")
+    assert clock.now == 0.0
+    assert pacer.saved() == pytest.approx(40.0)
+
+def test_backoff_on_throttle_and_recovery():
+    """제한 감지 시 간격을 두 배로 늘리고, 성공하면 절반으로 줄임"""
+    pacer, clock = make_pacer(initial_backoff=1.0)
+    url = "https://example.com/a"
+    pacer.wait(url)
+    pacer.throttled(url)
+    assert pacer.wait(url) == pytest.approx(1.0)
+    pacer.throttled(url)
+    assert pacer.wait(url) == pytest.approx(2.0)
+    # 성공하면 이미 예약된 시점 이후부터 간격이 줄어듦 (2초 -> 1초 -> 0.5초)
+    pacer.success(url)
+    assert pacer.wait(url) == pytest.approx(2.0)
+    pacer.success(url)
+    assert pacer.wait(url) == pytest.approx(1.0)
+    pacer.success(url)
+    pacer.success(url)
+    clock.now += 10
+    assert pacer.wait(url) == 0.0
+    assert pacer.backoffs == 2
+
+def test_retry_after_and_hosts_are_independent():
+    """Retry-After를 따르고, 다른 호스트는 영향 없음"""
+    pacer, clock = make_pacer(max_delay=30.0)
+    pacer.throttled("https://slow.example/x", retry_after=20)
+    assert pacer.wait("https://fast.example/y") == 0.0
+    assert pacer.wait("https://slow.example/z") == pytest.approx(20.0)
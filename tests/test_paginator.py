@@ -0,0 +1,62 @@
+import sys
+import time
+import threading
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+project_root = str(Path(__file__).parent.parent)
+sys.path.insert(0, project_root)
+
+from fetcher.paginator import paginate
+
+class FakeApi:
+    """total개 항목을 page_size씩 나눠 반환하며 요청 페이지와 동시 요청 수 기록"""
+
+    def __init__(self, total: int, page_size: int, delay: float = 0.01):
+        self.total = total
+        self.page_size = page_size
+        self.delay = delay
+        self.pages = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, page: int):
+        with self._lock:
+            self.pages.append(page)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        start = page * self.page_size
+        return list(range(start, min(start + self.page_size, self.total)))
+
+def test_items_streamed_in_order():
+    """병렬로 요청해도 항목은 페이지 순서대로 전달"""
+    api = FakeApi(total=1234, page_size=100)
+    assert list(paginate(api, 100, concurrency=4)) == list(range(1234))
+    assert 1 < api.max_active <= 4
+
+def test_single_page_skips_parallel_requests():
+    """첫 페이지가 가득 차지 않으면 추가 요청 없음"""
+    api = FakeApi(total=30, page_size=100)
+    assert list(paginate(api, 100)) == list(range(30))
+    assert api.pages == [0]
+
+def test_max_items_and_early_stop_bound_requests():
+    """max_items에 도달하거나 소비를 멈추면 더 요청하지 않음"""
+    api = FakeApi(total=100_000, page_size=100)
+    assert list(paginate(api, 100, concurrency=3, max_items=250)) == list(range(250))
+    assert sorted(api.pages) == [0, 1, 2]
+
+    api = FakeApi(total=100_000, page_size=100, delay=0.0)
+    assert list(paginate(api, 100, concurrency=4, max_items=200)) == list(range(200))
+    assert sorted(api.pages) == [0, 1]
+
+    # 두 번째 페이지를 소비하는 중에 멈추면 이미 요청한 페이지(1, 2) 외에는 요청하지 않음
+    api = FakeApi(total=100_000, page_size=100)
+    stream = paginate(api, 100, concurrency=2)
+    assert [next(stream) for _ in range(150)] == list(range(150))
+    stream.close()
+    assert set(api.pages) <= {0, 1, 2}
@@ -0,0 +1,77 @@
+import sys
+import time
+import asyncio
+import threading
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+project_root = str(Path(__file__).parent.parent)
+sys.path.insert(0, project_root)
+
+from common.metrics import metrics
+from common.pipeline import overlap_writes
+
+def run(items, prepare, write, **kwargs):
+    asyncio.run(overlap_writes(items, 'test', str, prepare, write, **kwargs))
+
+def test_writes_overlap_with_next_prepare():
+    """저장은 다음 항목 준비와 겹치고 준비는 순서대로 하나씩 실행"""
+    events = []
+    active = []
+
+    def prepare(item):
+        active.append(item)
+        assert len(active) == 1     # 준비는 동시에 하나만
+        time.sleep(0.05)
+        events.append(('prepared', item))
+        active.remove(item)
+        return item
+
+    async def write(item):
+        await asyncio.sleep(0.05)
+        events.append(('written', item))
+
+    started = time.perf_counter()
+    run(list(range(4)), prepare, write)
+    elapsed = time.perf_counter() - started
+
+    assert [item for kind, item in events if kind == 'prepared'] == [0, 1, 2, 3]
+    assert sorted(item for kind, item in events if kind == 'written') == [0, 1, 2, 3]
+    assert events.index(('prepared', 1)) < events.index(('written', 0))
+    assert elapsed < 0.35           # 순차 실행이면 0.4초
+
+def test_skips_none_and_stop_and_errors():
+    """None은 저장하지 않고, stop이면 중단하며, 한 항목의 오류는 나머지에 영향 없음"""
+    written = []
+
+    def prepare(item):
+        if item == 1:
+            raise ValueError("bad item")
+        return None if item == 2 else item
+
+    async def write(item):
+        written.append(item)
+
+    run([0, 1, 2, 3, 4, 5], prepare, write, stop=lambda remaining: remaining <= 1)
+    assert written == [0, 3, 4]
+
+def test_item_metrics_include_prepare_and_write():
+    """준비(스레드)와 저장(코루틴) 단계가 같은 항목 기록에 남음"""
+    records = []
+    original = metrics._finish
+    metrics._finish = records.append
+    try:
+        def prepare(item):
+            with metrics.stage('summarize'):
+                assert threading.current_thread() is not threading.main_thread()
+            return item
+
+        async def write(item):
+            with metrics.stage('notion_write'):
+                await asyncio.sleep(0)
+
+        run(['a', 'b'], prepare, write)
+    finally:
+        metrics._finish = original
+    assert sorted(r['key'] for r in records) == ['a', 'b']
+    assert all(set(r['stages']) == {'summarize', 'notion_write'} for r in records)
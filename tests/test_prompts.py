@@ -0,0 +1,57 @@
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+project_root = str(Path(__file__).parent.parent)
+sys.path.insert(0, project_root)
+
+from common.prompts import CompiledPrompt, PromptRegistry
+from summarizer.schemas import SectionedSummarySchema
+
+def test_compiled_prompt_token_counts():
+    """청크를 제외한 부분의 토큰 수는 만들 때 한 번만 계산"""
+    counted = []
+
+    def count_tokens(text):
+        counted.append(text)
+        return len(text.split())
+
+    functions = [{"name": "create_summary", "parameters": {"type": "object"}}]
+    compiled = CompiledPrompt("요약하세요:\n{text}", system="시스템 프롬프트 입니다", functions=functions,
+                              count_tokens=count_tokens)
+
+    assert compiled.system_tokens == 3
+    assert compiled.template_tokens == 1
+    assert compiled.fixed_tokens == compiled.system_tokens + compiled.template_tokens + compiled.functions_tokens
+    assert compiled.format("본문") == "요약하세요:\n본문"
+    assert len(counted) == 3
+
+def test_registry_builds_once_per_key():
+    """같은 (schema_type, content_type, 언어, 모델)은 다시 만들지 않음"""
+    registry = PromptRegistry()
+    builds = []
+
+    def build():
+        builds.append(1)
+        return CompiledPrompt()
+
+    first = registry.get(('section', None, 'ko', 'gpt-4o-mini'), build)
+    assert registry.get(('section', None, 'ko', 'gpt-4o-mini'), build) is first
+    registry.get(('final', None, 'ko', 'gpt-4o-mini'), build)
+    assert len(builds) == 2
+    assert len(registry) == 2
+
+def test_schema_created_once():
+    """get_schema는 설정의 스키마를 처음 한 번만 생성"""
+    class FakeConfig:
+        calls = 0
+
+        @classmethod
+        def create_schema(cls):
+            cls.calls += 1
+            return {'name': 'section'}, {'name': 'final'}, {'name': 'full'}
+
+    schema = SectionedSummarySchema(schema_type="final", config=FakeConfig)
+    assert schema.get_schema() == {'name': 'final'}
+    assert schema.get_schema() is schema.get_schema()
+    assert FakeConfig.calls == 1
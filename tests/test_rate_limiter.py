@@ -0,0 +1,80 @@
+import sys
+import threading
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+project_root = str(Path(__file__).parent.parent)
+sys.path.insert(0, project_root)
+
+import pytest
+from common.rate_limiter import RateLimiter
+
+class FakeClock:
+    """sleep 호출 시 시간만 앞으로 이동하는 가짜 시계"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+def make_limiter(rpm=None, tpm=None, headroom=1.0):
+    clock = FakeClock()
+    return RateLimiter(rpm=rpm, tpm=tpm, headroom=headroom, clock=clock, sleep=clock.sleep), clock
+
+def test_disabled_limiter_never_waits():
+    """한도가 없으면 대기 없이 통과"""
+    limiter, clock = make_limiter()
+    assert not limiter.enabled
+    assert all(limiter.acquire(10_000) == 0.0 for _ in range(100))
+    assert clock.sleeps == []
+
+def test_rpm_spaces_requests_after_burst():
+    """버킷이 빈 뒤에는 60/RPM 초 간격으로 실행"""
+    limiter, clock = make_limiter(rpm=60)
+    for _ in range(60):
+        assert limiter.acquire() == 0.0
+    assert limiter.acquire() == pytest.approx(1.0)
+    assert limiter.acquire() == pytest.approx(1.0)
+    assert clock.now == pytest.approx(2.0)
+
+def test_tpm_waits_for_token_cost_and_headroom():
+    """예상 토큰 수만큼 차감하고, 한도는 headroom 비율로 유지"""
+    limiter, clock = make_limiter(tpm=1000, headroom=0.9)
+    assert limiter.acquire(900) == 0.0
+    # 450 토큰이 다시 채워지려면 450 / (900/60) = 30초
+    assert limiter.acquire(450) == pytest.approx(30.0)
+
+def test_reconcile_returns_unused_tokens():
+    """실제 사용량이 예상보다 적으면 차이만큼 되돌려 다음 요청이 바로 실행"""
+    limiter, clock = make_limiter(tpm=1000)
+    limiter.acquire(1000)
+    limiter.reconcile(1000, 200)
+    assert limiter.acquire(800) == 0.0
+    assert clock.sleeps == []
+
+def test_concurrent_callers_are_scheduled_in_order():
+    """동시에 호출한 스레드들이 겹치지 않는 실행 시점을 받음"""
+    limiter = RateLimiter(rpm=600, headroom=1.0, clock=lambda: 0.0, sleep=lambda seconds: None)
+    waits = []
+    lock = threading.Lock()
+
+    def worker():
+        wait = limiter.acquire()
+        with lock:
+            waits.append(wait)
+
+    threads = [threading.Thread(target=worker) for _ in range(620)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # 버킷을 넘는 20건은 0.1초(60/600) 간격으로 서로 다른 시점에 실행
+    delayed = sorted(w for w in waits if w > 0)
+    assert delayed == pytest.approx([0.1 * i for i in range(1, 21)])
@@ -0,0 +1,139 @@
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+project_root = str(Path(__file__).parent.parent)
+sys.path.insert(0, project_root)
+
+import asyncio
+import pytest
+import requests
+from common.metrics import metrics
+from common.resilience import Resilience, CircuitBreaker, CircuitOpenError, is_retryable, retry_after
+
+def http_error(status: int, headers: dict = None) -> requests.HTTPError:
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers or {})
+    return requests.HTTPError(f"{status} error", response=response)
+
+class Flaky:
+    """지정한 예외들을 차례로 발생시킨 뒤 'ok' 반환"""
+
+    def __init__(self, *errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return 'ok'
+
+def test_error_classification():
+    """연결 오류, 429, 5xx만 재시도 대상"""
+    assert is_retryable(requests.exceptions.ConnectionError())
+    assert is_retryable(requests.exceptions.ReadTimeout())
+    assert is_retryable(http_error(429))
+    assert is_retryable(http_error(503))
+    assert not is_retryable(http_error(404))
+    assert not is_retryable(ValueError("bad json"))
+    assert retry_after(http_error(429, {'Retry-After': '7'})) == 7.0
+    assert retry_after(http_error(503)) is None
+
+def test_retries_transient_errors_with_backoff():
+    """일시적 오류는 재시도하고 대기 시간은 지수 상한 안에서 jitter"""
+    sleeps = []
+    resilience = Resilience(max_attempts=4, base_delay=1.0, max_delay=30.0, sleep=sleeps.append)
+    func = Flaky(http_error(503), requests.exceptions.ConnectionError())
+    before = metrics.counters.get('retries', 0)
+
+    assert resilience.call(func, endpoint='test') == 'ok'
+    assert func.calls == 3
+    assert 0 <= sleeps[0] <= 1.0 and 0 <= sleeps[1] <= 2.0
+    assert metrics.counters['retries'] - before == 2
+
+def test_retry_after_overrides_backoff():
+    """Retry-After 헤더가 있으면 그 시간만큼 대기 (max_delay로 제한)"""
+    sleeps = []
+    resilience = Resilience(base_delay=0.1, max_delay=10.0, sleep=sleeps.append)
+    func = Flaky(http_error(429, {'Retry-After': '5'}), http_error(429, {'Retry-After': '120'}))
+    assert resilience.call(func, endpoint='test') == 'ok'
+    assert sleeps == [5.0, 10.0]
+
+def test_non_retryable_and_exhausted_errors_propagate():
+    """4xx는 즉시, 일시적 오류는 마지막 시도 후 호출부로 전달"""
+    sleeps = []
+    resilience = Resilience(max_attempts=2, sleep=sleeps.append)
+    func = Flaky(http_error(404))
+    with pytest.raises(requests.HTTPError):
+        resilience.call(func, endpoint='test')
+    assert func.calls == 1 and sleeps == []
+
+    func = Flaky(http_error(500), http_error(500))
+    with pytest.raises(requests.HTTPError):
+        resilience.call(func, endpoint='test')
+    assert func.calls == 2
+
+def test_circuit_opens_and_recovers():
+    """연속 실패 후 호출을 거부하고, reset_timeout 뒤 시험 호출이 성공하면 닫힘"""
+    now = [0.0]
+    breaker = CircuitBreaker('test', failure_threshold=2, reset_timeout=60, clock=lambda: now[0])
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == 'open' and not breaker.allow()
+
+    now[0] = 61
+    assert breaker.allow()          # 시험 호출 하나만 허용
+    assert not breaker.allow()
+    breaker.record_success()
+    assert breaker.state == 'closed' and breaker.allow()
+
+def test_non_retryable_errors_leave_breaker_state():
+    """4xx/로컬 예외는 실패 횟수를 초기화하거나 half-open 차단기를 닫지 않음"""
+    resilience = Resilience(max_attempts=1, failure_threshold=2, reset_timeout=0, sleep=lambda s: None)
+    breaker = resilience.breaker('test')
+    with pytest.raises(requests.HTTPError):
+        resilience.call(Flaky(http_error(500)), endpoint='test')
+    with pytest.raises(requests.HTTPError):
+        resilience.call(Flaky(http_error(400)), endpoint='test')
+    assert breaker.failures == 1
+
+    with pytest.raises(requests.HTTPError):
+        resilience.call(Flaky(http_error(500)), endpoint='test')
+    assert breaker.state == 'half_open'
+    # 시험 호출이 TypeError로 끝나도 닫히지 않고 시험 호출 자리만 반납
+    with pytest.raises(TypeError):
+        resilience.call(Flaky(TypeError('bad argument')), endpoint='test')
+    assert breaker.state == 'half_open' and breaker.failures == 2
+    assert resilience.call(Flaky(), endpoint='test') == 'ok'
+    assert breaker.state == 'closed'
+
+def test_open_circuit_skips_calls():
+    """차단기가 열린 엔드포인트는 호출 없이 CircuitOpenError"""
+    resilience = Resilience(max_attempts=1, failure_threshold=1, sleep=lambda s: None)
+    with pytest.raises(requests.HTTPError):
+        resilience.call(Flaky(http_error(502)), endpoint='notion')
+    func = Flaky()
+    with pytest.raises(CircuitOpenError):
+        resilience.call(func, endpoint='notion')
+    assert func.calls == 0
+    # 다른 엔드포인트는 영향 없음
+    assert resilience.call(func, endpoint='pocket') == 'ok'
+
+def test_async_call_retries_transient_errors():
+    """비동기 호출도 같은 규칙으로 재시도하고 4xx는 즉시 전달"""
+    resilience = Resilience(max_attempts=3, base_delay=0.001, max_delay=0.01)
+    func = Flaky(http_error(503), requests.exceptions.ConnectionError())
+
+    async def call_async():
+        return func()
+
+    assert asyncio.run(resilience.acall(call_async, endpoint='test')) == 'ok'
+    assert func.calls == 3
+
+    func = Flaky(http_error(404))
+    with pytest.raises(requests.HTTPError):
+        asyncio.run(resilience.acall(call_async, endpoint='test'))
+    assert func.calls == 1
@@ -0,0 +1,68 @@
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+project_root = str(Path(__file__).parent.parent)
+sys.path.insert(0, project_root)
+
+from summarizer.section_splitter import TopicSplitter, SectionSplitter
+
+SPACE_SENTENCES = [
+    "The rocket launched from the orbital platform toward distant planets.",
+    "Astronauts monitored the rocket engines during the orbital climb.",
+    "Planets and moons appeared as the spacecraft left orbit.",
+    "The spacecraft crew adjusted the orbital trajectory toward the planets.",
+    "Rocket telemetry confirmed the spacecraft reached stable orbit.",
+    "Mission control praised the astronauts for the orbital maneuver.",
+]
+
+COOKING_SENTENCES = [
+    "The chef chopped fresh garlic and onions for the sauce.",
+    "Tomatoes simmered slowly with garlic, basil and olive oil.",
+    "The sauce thickened while the pasta boiled in salted water.",
+    "Fresh basil and grated cheese finished the pasta dish.",
+    "The chef tasted the sauce and added more olive oil.",
+    "Dinner guests enjoyed the pasta with garlic bread.",
+]
+
+def test_split_at_topic_shift():
+    """주제가 바뀌는 문장 경계에서 분할"""
+    text = ' '.join(SPACE_SENTENCES + COOKING_SENTENCES)
+    splitter = TopicSplitter(chunk_size=len(text) * 3 // 4, min_chunk_ratio=0.3)
+    chunks = splitter.split_text(text)
+
+    assert len(chunks) == 2
+    assert chunks[0].split('\n') == SPACE_SENTENCES
+    assert chunks[1].split('\n') == COOKING_SENTENCES
+
+def test_chunk_size_respected():
+    """모든 청크가 최대 크기 이내이며 원문 문장을 모두 포함"""
+    sentences = (SPACE_SENTENCES + COOKING_SENTENCES) * 5
+    splitter = TopicSplitter(chunk_size=300)
+    chunks = splitter.split_text(' '.join(sentences))
+
+    assert all(len(chunk) <= 300 for chunk in chunks)
+    assert '\n'.join(chunks).split('\n') == sentences
+
+def test_oversized_sentence_split():
+    """청크 크기를 넘는 단일 문장은 공백 기준으로 분할"""
+    text = ' '.join(['word'] * 200)
+    chunks = TopicSplitter(chunk_size=100).split_text(text)
+
+    assert len(chunks) > 1
+    assert all(len(chunk) <= 100 for chunk in chunks)
+    assert ' '.join(chunks).split() == text.split()
+
+def test_empty_input():
+    """빈 입력 처리"""
+    assert TopicSplitter().split_text('') == []
+    assert TopicSplitter().split_text('   \n\n ') == []
+    assert SectionSplitter().split('') == []
+
+def test_section_splitter_documents():
+    """SectionSplitter가 Document 목록 반환"""
+    text = ' '.join(SPACE_SENTENCES + COOKING_SENTENCES)
+    docs = SectionSplitter(chunk_size=300).split(text)
+
+    assert docs
+    assert all(len(doc.page_content) <= 300 for doc in docs)
@@ -0,0 +1,76 @@
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+project_root = str(Path(__file__).parent.parent)
+sys.path.insert(0, project_root)
+
+from common.sentences import SentenceSegmenter
+
+# 문장 부호가 없는 자동 생성 한국어 자막
+KOREAN_TRANSCRIPT = (
+    "안녕하세요 여러분 오늘은 바다 이야기를 해볼게요 바다는 정말 넓습니다 "
+    "그래서 많은 생물이 살고 있죠 그렇다고 모두 알려진 건 아니에요 다음 영상에서 만나요"
+)
+
+def test_korean_sentence_endings():
+    """문장 부호 없이 종결 어미 기준으로 분리"""
+    sentences = SentenceSegmenter().split(KOREAN_TRANSCRIPT)
+
+    assert sentences == [
+        '안녕하세요',
+        '여러분 오늘은 바다 이야기를 해볼게요',
+        '바다는 정말 넓습니다',
+        '그래서 많은 생물이 살고 있죠',
+        '그렇다고 모두 알려진 건 아니에요',
+        '다음 영상에서 만나요',
+    ]
+
+def test_connective_nikka_does_not_split():
+    """연결 어미 '-니까'에서는 나누지 않고 의문형 '-ㅂ니까'에서만 분리"""
+    sentences = SentenceSegmenter().split("비가 오니까 우산을 챙기세요 내일도 비가 옵니까 아마 그럴 겁니다")
+    assert sentences == ['비가 오니까 우산을 챙기세요', '내일도 비가 옵니까', '아마 그럴 겁니다']
+
+def test_punctuation_and_cjk():
+    """일반 문장 부호와 공백 없는 CJK 문장 부호 처리"""
+    sentences = SentenceSegmenter().split("今日は晴れです。明日は雨でしょう！ It works. Really?")
+    assert sentences == ['今日は晴れです。', '明日は雨でしょう！', 'It works.', 'Really?']
+
+def test_join_segments_uses_pauses():
+    """자막 구간 사이 휴지가 길면 줄바꿈으로 이어붙임"""
+    segments = [
+        {'text': '첫 번째 말', 'start': 0.0, 'duration': 1.0},
+        {'text': '이어지는 말', 'start': 1.1, 'duration': 1.0},
+        {'text': '새로운  말', 'start': 3.5, 'duration': 1.0},
+    ]
+    segmenter = SentenceSegmenter(pause_seconds=0.5)
+    text = segmenter.join_segments(segments)
+
+    assert text == '첫 번째 말 이어지는 말\n새로운 말'
+    assert segmenter.split(text) == ['첫 번째 말 이어지는 말', '새로운 말']
+
+def test_balanced_chunks():
+    """청크 길이를 제한하면서 고르게 분배"""
+    text = ' '.join(['가' * 95 + '다.'] * 10)
+    chunks = SentenceSegmenter().chunk(text, max_length=450)
+
+    lengths = [len(chunk) for chunk in chunks]
+    assert len(chunks) == 3
+    assert max(lengths) <= 450
+    assert max(lengths) - min(lengths) <= 100
+    assert ' '.join(chunks) == text
+
+def test_long_sentence_split_at_words():
+    """종결 어미가 없는 긴 문장은 단어 중간이 아닌 공백에서 분할"""
+    words = [f"단어{i}" for i in range(300)]
+    chunks = SentenceSegmenter().chunk(' '.join(words), max_length=200)
+
+    assert all(len(chunk) <= 200 for chunk in chunks)
+    assert ' '.join(chunks).split() == words
+
+def test_empty_text():
+    """빈 입력 처리"""
+    segmenter = SentenceSegmenter()
+    assert segmenter.split('') == []
+    assert segmenter.chunk('  ', max_length=100) == []
+    assert segmenter.join_segments([]) == ''
@@ -0,0 +1,97 @@
+import sys
+import json
+import time
+import asyncio
+import sqlite3
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+project_root = str(Path(__file__).parent.parent)
+sys.path.insert(0, project_root)
+
+import pytest
+from fetcher.sinks import (create_sink, to_record, JsonlSink, SqliteSink, ParquetSink, NotionSink, FanoutSink,
+                           HAS_PYARROW)
+
+def make_item(i: int):
+    return {
+        'url': f'https://example.com/{i}',
+        'title': f'제목 {i}',
+        'summary': {'full_summary': ['첫 문장.', '둘째 문장.'], 'one_sentence_summary': '한 줄 요약',
+                    'keywords': ['요약', 'LLM'], 'sections': [{'title': 'A', 'summary': ['a']}]},
+    }
+
+def test_record_flattens_summary():
+    """요약 dict/문자열 모두 공통 행으로 변환"""
+    record = to_record('pocket', make_item(1))
+    assert record['full_summary'] == '첫 문장. 둘째 문장.'
+    assert json.loads(record['keywords']) == ['요약', 'LLM']
+    assert json.loads(record['summary_json'])['sections'][0]['title'] == 'A'
+    assert to_record('youtube', {'url': 'u', 'summary': 'plain'})['full_summary'] == 'plain'
+
+def test_bulk_export_jsonl_and_sqlite(tmp_path):
+    """1만 개 요약을 버퍼링해 몇 초 안에 기록"""
+    sink = FanoutSink([JsonlSink('pocket', tmp_path / 'out.jsonl', batch_size=1000),
+                       SqliteSink('pocket', tmp_path / 'out.db', batch_size=1000)])
+    started = time.perf_counter()
+    for i in range(10_000):
+        sink.write(make_item(i))
+    sink.close()
+    assert time.perf_counter() - started < 5
+
+    lines = (tmp_path / 'out.jsonl').read_text(encoding='utf-8').splitlines()
+    assert len(lines) == 10_000 and json.loads(lines[-1])['url'] == 'https://example.com/9999'
+    conn = sqlite3.connect(tmp_path / 'out.db')
+    assert conn.execute("SELECT COUNT(*), MAX(title) FROM summaries").fetchone()[0] == 10_000
+    conn.close()
+
+@pytest.mark.skipif(not HAS_PYARROW, reason="pyarrow 미설치")
+def test_parquet_row_groups(tmp_path):
+    """flush마다 row group 하나씩 기록"""
+    import pyarrow.parquet as pq
+    sink = ParquetSink('raindrop', tmp_path / 'out.parquet', batch_size=10)
+    for i in range(25):
+        sink.write(make_item(i))
+    sink.close()
+    table = pq.read_table(tmp_path / 'out.parquet')
+    assert table.num_rows == 25 and pq.ParquetFile(tmp_path / 'out.parquet').num_row_groups == 3
+
+class FakeLogger:
+    def __init__(self, fail: bool = False):
+        self.saved = []
+        self.fail = fail
+        self.closed = False
+
+    def save_to_notion(self, item):
+        if self.fail:
+            raise RuntimeError("notion down")
+        self.saved.append(item['url'])
+
+    async def save_to_notion_async(self, item):
+        self.save_to_notion(item)
+
+    async def aclose(self):
+        self.closed = True
+
+def test_fanout_isolates_sink_errors(tmp_path):
+    """한 싱크가 실패해도 나머지 싱크에는 기록"""
+    jsonl = JsonlSink('youtube', tmp_path / 'out.jsonl')
+    sink = FanoutSink([NotionSink(FakeLogger(fail=True)), jsonl])
+
+    async def run():
+        await sink.write_async(make_item(1))
+        await sink.aclose()
+    asyncio.run(run())
+    assert len((tmp_path / 'out.jsonl').read_text(encoding='utf-8').splitlines()) == 1
+
+def test_create_sink_from_names(tmp_path):
+    """이름으로 싱크 구성, 사용할 수 없는 싱크는 제외"""
+    notion = FakeLogger()
+    sink = create_sink(['notion', 'jsonl', 'sqlite', 'parquet', 'jsonl'], 'pocket', tmp_path, notion)
+    names = [s.name for s in sink.sinks]
+    assert names[:3] == ['notion', 'jsonl', 'sqlite']
+    assert ('parquet' in names) == HAS_PYARROW
+    sink.write(make_item(1))
+    sink.close()
+    assert notion.saved == ['https://example.com/1']
+    assert [s.name for s in create_sink(['notion'], 'pocket', tmp_path).sinks] == []
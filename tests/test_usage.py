@@ -0,0 +1,110 @@
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+project_root = str(Path(__file__).parent.parent)
+sys.path.insert(0, project_root)
+
+import pytest
+from common.metrics import metrics
+from common.usage import UsageLedger, estimate_tokens, context_window, cached_tokens
+
+def test_cost_by_model_prefix():
+    """모델 버전 접미사가 있어도 가격표의 모델로 환산"""
+    ledger = UsageLedger()
+    assert ledger.cost('gpt-4o-mini-2024-07-18', 1_000_000, 0) == pytest.approx(0.15)
+    assert ledger.cost('gpt-4o', 0, 1_000_000) == pytest.approx(10.0)
+    assert ledger.cost('unknown-model', 1000, 1000) == 0.0
+    assert context_window('gpt-3.5-turbo-0125') == 16385
+
+def test_usage_aggregated_per_item_and_source():
+    """사용량을 실행 전체, 소스별, 항목별로 집계"""
+    ledger = UsageLedger()
+    with metrics.item('youtube', 'a'):
+        ledger.record('gpt-3.5-turbo', 1000, 200)
+        ledger.record('gpt-3.5-turbo', 500, 100)
+    with metrics.item('pocket', 'b'):
+        ledger.record('gpt-4o-mini', 2000, 300)
+    ledger.record('gpt-3.5-turbo', 10, 0)
+
+    assert ledger.total['calls'] == 4
+    assert ledger.tokens_used == 1000 + 200 + 500 + 100 + 2000 + 300 + 10
+    assert ledger.by_item[('youtube', 'a')]['prompt_tokens'] == 1500
+    assert ledger.by_source['pocket']['completion_tokens'] == 300
+    assert ledger.by_model['gpt-3.5-turbo']['calls'] == 3
+    assert ledger.by_source['youtube']['cost'] == pytest.approx((1500 * 0.5 + 300 * 1.5) / 1e6)
+
+def test_cached_tokens_reported_and_discounted():
+    """프롬프트 캐시로 처리된 입력 토큰을 따로 집계하고 입력 단가의 절반으로 환산"""
+    assert cached_tokens({'prompt_tokens': 2000, 'prompt_tokens_details': {'cached_tokens': 1536}}) == 1536
+    assert cached_tokens({'prompt_tokens': 2000, 'prompt_tokens_details': None}) == 0
+    assert cached_tokens(None) == 0
+
+    ledger = UsageLedger()
+    with metrics.item('youtube', 'cached'):
+        cost = ledger.record('gpt-4o-mini', 2000, 100, cached_tokens=1536)
+
+    assert cost == pytest.approx(((2000 - 1536) * 0.15 + 1536 * 0.15 * 0.5 + 100 * 0.60) / 1e6)
+    assert ledger.by_item[('youtube', 'cached')]['cached_tokens'] == 1536
+    assert '프롬프트 캐시: 입력 1536 토큰' in ledger.report()
+
+def test_repeated_prefix_served_from_prompt_cache():
+    """앞부분이 1024 토큰 이상 같은 요청은 두 번째부터 캐시 토큰으로 보고 (가짜 서비스)"""
+    from openai import OpenAI
+    from benchmarks.fake_services import FakeServices
+
+    system = "규칙을 지켜 요약하세요. " * 400
+    with FakeServices(n_items=1, latency=0.0) as services:
+        client = OpenAI(api_key='test', base_url=f"{services.base_url}/v1", max_retries=0)
+        usages = [client.chat.completions.create(model='gpt-4o-mini', messages=[
+            {'role': 'system', 'content': system},
+            {'role': 'user', 'content': chunk}
+        ]).usage for chunk in ('첫 번째 청크', '두 번째 청크')]
+
+    assert cached_tokens(usages[0]) == 0
+    assert cached_tokens(usages[1]) >= 1024
+    assert cached_tokens(usages[1]) % 128 == 0
+
+def test_budget_allows_and_exceeded():
+    """남은 예산 기준으로 예상 사용량 허용 여부 판단"""
+    ledger = UsageLedger(max_tokens=5000)
+    assert ledger.allows('gpt-3.5-turbo', 3000, 1000)
+    ledger.record('gpt-3.5-turbo', 3000, 1000)
+    assert not ledger.allows('gpt-3.5-turbo', 1000, 500)
+    assert not ledger.exceeded()
+    ledger.record('gpt-3.5-turbo', 1000, 0)
+    assert ledger.exceeded()
+
+    ledger = UsageLedger(max_cost=0.01)
+    # gpt-3.5-turbo: 입력 10000 + 출력 5000 토큰 = $0.0125, gpt-4o-mini: $0.0045
+    assert not ledger.allows('gpt-3.5-turbo', 10000, 5000)
+    assert ledger.allows('gpt-4o-mini', 10000, 5000)
+
+def test_estimate_tokens_is_conservative_for_korean():
+    """한글은 글자당 약 1토큰으로 추정"""
+    assert estimate_tokens('가' * 300) == 301
+    assert estimate_tokens('a' * 300) == 101
+
+def test_strategy_falls_back_when_budget_is_short(monkeypatch, tmp_path):
+    """기본 모델 map_reduce가 예산을 넘으면 저렴한 모델의 stuff 체인으로 전환"""
+    monkeypatch.setenv('OPENAI_API_KEY', 'test-key')
+    from common import usage
+    from summarizer.strategies import SummarizationStrategy, BudgetExceeded
+
+    monkeypatch.setattr(usage.ledger, 'max_cost', None)
+    monkeypatch.setattr(usage.ledger, 'max_tokens', None)
+    strategy = SummarizationStrategy('gpt-4o', fallback_model='gpt-4o-mini', save_dir=str(tmp_path))
+    chunks = ['가' * 3000] * 4
+
+    llm, chain_type = strategy._plan_for_budget(chunks)
+    assert (llm, chain_type) == (strategy.llm, 'map_reduce')
+
+    # gpt-4o map_reduce 예상 비용은 약 $0.065, gpt-4o-mini stuff는 약 $0.002
+    monkeypatch.setattr(usage.ledger, 'max_cost', 0.01)
+    llm, chain_type = strategy._plan_for_budget(chunks)
+    assert llm.model_name == 'gpt-4o-mini'
+    assert chain_type == 'stuff'
+
+    monkeypatch.setattr(usage.ledger, 'max_cost', 0.0001)
+    with pytest.raises(BudgetExceeded):
+        strategy._plan_for_budget(chunks)